@@ -28,7 +28,7 @@ from airflow import models
 from airflow.exceptions import AirflowException, DagNotFound
 from airflow.models import DagModel, TaskFail
 from airflow.models.errors import ParseImportError
-from airflow.models.serialized_dag import SerializedDagModel
+from airflow.models.serialized_dag import SerializedDagChange, SerializedDagModel
 from airflow.utils.db import get_sqla_model_classes
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.state import TaskInstanceState
@@ -84,6 +84,9 @@ def delete_dag(dag_id: str, keep_records_in_log: bool = True, session: Session =
     count = 0
 
     for model in get_sqla_model_classes():
+        # The deletion of the serialized DAG was just recorded in SerializedDagChange, for other processes
+        if model is SerializedDagChange:
+            continue
         if hasattr(model, "dag_id") and (not keep_records_in_log or model.__name__ != "Log"):
             count += session.execute(
                 delete(model)
@@ -37,6 +37,7 @@ from airflow.api_connexion.schemas.connection_schema import (
 )
 from airflow.configuration import conf
 from airflow.models import Connection
+from airflow.secrets.cache import SecretCache
 from airflow.secrets.environment_variables import CONN_ENV_PREFIX
 from airflow.security import permissions
 from airflow.utils import helpers
@@ -70,6 +71,7 @@ def delete_connection(*, connection_id: str, session: Session = NEW_SESSION) ->
             detail=f"The Connection with connection_id: `{connection_id}` was not found",
         )
     session.delete(connection)
+    SecretCache.invalidate_connection(connection_id)
     return NoContent, HTTPStatus.NO_CONTENT
 
 
@@ -144,6 +146,7 @@ def patch_connection(
         setattr(connection, key, data[key])
     session.add(connection)
     session.commit()
+    SecretCache.invalidate_connection(connection_id)
     return connection_schema.dump(connection)
 
 
@@ -172,6 +175,8 @@ def post_connection(*, session: Session = NEW_SESSION) -> APIResponse:
         connection = Connection(**data)
         session.add(connection)
         session.commit()
+        # a miss may have been cached
+        SecretCache.invalidate_connection(conn_id)
         return connection_schema.dump(connection)
     raise AlreadyExists(detail=f"Connection already exist. ID: {conn_id}")
 
@@ -107,6 +107,7 @@ def initialize_method_map() -> dict[str, Callable]:
         DagFileProcessor._validate_task_pools_and_update_dag_warnings,
         DagFileProcessorManager._fetch_callbacks,
         DagFileProcessorManager._get_priority_filelocs,
+        DagFileProcessorManager._mark_cached_dags_as_parsed,
         DagFileProcessorManager.clear_nonexistent_import_errors,
         DagFileProcessorManager.deactivate_stale_dags,
         DagWarning.purge_inactive_dag_warnings,
@@ -152,9 +153,13 @@ def initialize_method_map() -> dict[str, Callable]:
         Trigger.bulk_fetch,
         Trigger.clean_unused,
         Trigger.submit_event,
+        Trigger.submit_events,
         Trigger.submit_failure,
         Trigger.ids_for_triggerer,
         Trigger.assign_unassigned,
+        Trigger.report_load,
+        Trigger.get_triggerer_loads,
+        Trigger.release_triggers,
     ]
     return {f"{func.__module__}.{func.__qualname__}": func for func in functions}
 
@@ -507,10 +507,21 @@ ARG_DB_SKIP_ARCHIVE = Arg(
     help="Don't preserve purged records in an archive table.",
     action="store_true",
 )
+ARG_DB_BATCH_SIZE = Arg(
+    ("--batch-size",),
+    help="Archive and delete at most this many rows per transaction. An interrupted clean keeps the "
+    "batches already done, and can be run again with the same --clean-before-timestamp to finish.",
+    type=positive_int(allow_zero=False),
+)
+ARG_DB_MAX_ROWS_PER_SECOND = Arg(
+    ("--max-rows-per-second",),
+    help="With --batch-size, wait between batches to delete at most this many rows per second",
+    type=positive_int(allow_zero=False),
+)
 ARG_DB_EXPORT_FORMAT = Arg(
     ("--export-format",),
     help="The file format to export the cleaned data",
-    choices=("csv",),
+    choices=("csv", "csv.gz"),
     default="csv",
 )
 ARG_DB_OUTPUT_PATH = Arg(
@@ -1643,6 +1654,8 @@ DB_COMMANDS = (
             ARG_VERBOSE,
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
+            ARG_DB_BATCH_SIZE,
+            ARG_DB_MAX_ROWS_PER_SECOND,
         ),
     ),
     ActionCommand(
@@ -277,6 +277,8 @@ def cleanup_tables(args):
         verbose=args.verbose,
         confirm=not args.yes,
         skip_archive=args.skip_archive,
+        batch_size=args.batch_size,
+        max_rows_per_second=args.max_rows_per_second,
     )
 
 
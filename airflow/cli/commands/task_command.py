@@ -47,6 +47,7 @@ from airflow.models.dag import DAG, _run_inline_trigger
 from airflow.models.dagrun import DagRun
 from airflow.models.param import ParamsDict
 from airflow.models.taskinstance import TaskReturnCode
+from airflow.secrets.cache import SecretCache
 from airflow.serialization.pydantic.taskinstance import TaskInstancePydantic
 from airflow.settings import IS_EXECUTOR_CONTAINER, IS_K8S_EXECUTOR_POD
 from airflow.ti_deps.dep_context import DepContext
@@ -448,6 +449,9 @@ def task_run(args, dag: DAG | None = None) -> TaskReturnCode | None:
         settings.configure_vars()
 
     settings.MASK_SECRETS_IN_LOGS = True
+    if conf.getboolean("secrets", "cache_task_lookups"):
+        # needs to be done before the task is forked, so that the raw task process uses it too
+        SecretCache.init()
 
     get_listener_manager().hook.on_starting(component=TaskCommandMarker())
 
@@ -44,7 +44,9 @@ import airflow.models
 from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.callbacks.callback_requests import CallbackRequest, SlaCallbackRequest
 from airflow.configuration import conf
+from airflow.dag_processing.parse_cache import DagFileParseCache
 from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.processor_pool import DagFileProcessorPool, PooledDagFileProcessor
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagPriorityParsingRequest
 from airflow.models.dagwarning import DagWarning
@@ -417,7 +419,14 @@ class DagFileProcessorManager(LoggingMixin):
         self.print_stats_interval = conf.getint("scheduler", "print_stats_interval")
 
         # Map from file path to the processor
-        self._processors: dict[str, DagFileProcessorProcess] = {}
+        self._processors: dict[str, DagFileProcessorProcess | PooledDagFileProcessor] = {}
+        # When set, files are parsed by long-lived processes of the pool instead of a process per file
+        self._processor_pool: DagFileProcessorPool | None = None
+        if conf.getboolean("scheduler", "reuse_parsing_processes"):
+            self._processor_pool = DagFileProcessorPool(
+                max_parses=conf.getint("scheduler", "parsing_process_max_parses"),
+                max_memory_mb=conf.getint("scheduler", "parsing_process_max_memory_mb"),
+            )
 
         self._num_run = 0
 
@@ -442,6 +451,16 @@ class DagFileProcessorManager(LoggingMixin):
         # Mapping file name and callbacks requests
         self._callback_to_execute: dict[str, list[CallbackRequest]] = defaultdict(list)
 
+        # Files whose content and dependencies did not change since they were last parsed successfully
+        # are not parsed again when the parse cache is enabled.
+        self._parse_cache: DagFileParseCache | None = None
+        if conf.getboolean("scheduler", "enable_dag_file_parse_cache"):
+            self._parse_cache = DagFileParseCache(dag_directory)
+        # Parse cache keys of the files being processed, stored in the cache once they parse successfully
+        self._parse_cache_pending_keys: dict[str, str | None] = {}
+        self._parse_cache_hits = 0
+        self._parse_cache_misses = 0
+
         self._log = logging.getLogger("airflow.processor_manager")
 
         self.waitables: dict[Any, MultiprocessingConnection | DagFileProcessorProcess] = (
@@ -629,6 +648,8 @@ class DagFileProcessorManager(LoggingMixin):
                 if span.is_recording():
                     span.add_event(name="_kill_timed_out_processors")
                 self._kill_timed_out_processors()
+                if self._processor_pool:
+                    self._processor_pool.reap()
 
                 # Generate more file paths to process if we processed all the files already. Note for this
                 # to clear down, we must have cleared all files found from scanning the dags dir _and_ have
@@ -787,6 +808,24 @@ class DagFileProcessorManager(LoggingMixin):
             self._add_paths_to_queue([request.full_filepath], True)
             Stats.incr("dag_processing.other_callback_count")
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def _mark_cached_dags_as_parsed(cls, fileloc: str, session: Session = NEW_SESSION) -> int:
+        """
+        Update the last parsed time of the DAGs of a file that was not parsed again thanks to the parse cache.
+
+        This keeps the DAGs from being deactivated as stale.
+
+        :return: The number of active DAGs in the file
+        """
+        return session.execute(
+            update(DagModel)
+            .where(DagModel.fileloc == fileloc, DagModel.is_active)
+            .values(last_parsed_time=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
     def _refresh_requested_filelocs(self) -> None:
         """Refresh filepaths from dag dir as requested by users via APIs."""
         # Get values from DB table
@@ -799,6 +838,9 @@ class DagFileProcessorManager(LoggingMixin):
                 pass
             # enqueue fileloc to the start of the queue.
             self._file_path_queue.appendleft(fileloc)
+            # A reparse requested by a user must not be skipped by the parse cache
+            if self._parse_cache:
+                self._parse_cache.invalidate(fileloc)
 
     @classmethod
     @internal_api_call
@@ -1160,6 +1202,12 @@ class DagFileProcessorManager(LoggingMixin):
             last_num_of_db_queries=last_num_of_db_queries,
         )
         self._file_stats[processor.file_path] = stat
+        if self._parse_cache:
+            parse_cache_key = self._parse_cache_pending_keys.pop(processor.file_path, None)
+            if processor.result is not None and count_import_errors == 0:
+                self._parse_cache.store(processor.file_path, parse_cache_key)
+            else:
+                self._parse_cache.invalidate(processor.file_path)
         file_name = Path(processor.file_path).stem
         """crude exposure of instrumentation code which may need to be furnished"""
         span = Trace.get_tracer("DagFileProcessorManager").start_span(
@@ -1199,6 +1247,38 @@ class DagFileProcessorManager(LoggingMixin):
 
         self.log.debug("%s file paths queued for processing", len(self._file_path_queue))
 
+    def _is_parse_cached(self, file_path: str) -> bool:
+        """
+        Check whether ``file_path`` can be skipped because it did not change since it was last parsed.
+
+        On a hit, the file is recorded as processed without starting a processor for it.
+        """
+        if TYPE_CHECKING:
+            assert self._parse_cache
+
+        key = self._parse_cache.compute_key(file_path)
+        stat = self._file_stats.get(file_path, DagFileProcessorManager.DEFAULT_FILE_STAT)
+        if self._parse_cache.is_cached(file_path, key):
+            # The DAGs may have been deleted since the file was last parsed, in which case it must be parsed
+            # again to recreate them.
+            if self._mark_cached_dags_as_parsed(file_path) >= stat.num_dags:
+                self._parse_cache_hits += 1
+                Stats.incr("dag_processing.parse_cache.hit")
+                self._file_stats[file_path] = stat._replace(
+                    last_finish_time=timezone.utcnow(),
+                    last_duration=timedelta(0),
+                    run_count=stat.run_count + 1,
+                    last_num_of_db_queries=0,
+                )
+                self.log.debug("Skipping parsing of unchanged file %s", file_path)
+                return True
+            self._parse_cache.invalidate(file_path)
+
+        self._parse_cache_misses += 1
+        Stats.incr("dag_processing.parse_cache.miss")
+        self._parse_cache_pending_keys[file_path] = key
+        return False
+
     @staticmethod
     def _create_process(file_path, pickle_dags, dag_ids, dag_directory, callback_requests):
         """Create DagFileProcessorProcess instance."""
@@ -1222,15 +1302,32 @@ class DagFileProcessorManager(LoggingMixin):
             # Stop creating duplicate processor i.e. processor with the same filepath
             if file_path in self._processors:
                 continue
+            # Callbacks can only be run by parsing the file
+            if (
+                self._parse_cache
+                and not self._callback_to_execute.get(file_path)
+                and self._is_parse_cached(file_path)
+            ):
+                continue
 
             callback_to_execute_for_file = self._callback_to_execute[file_path]
-            processor = self._create_process(
-                file_path,
-                self._pickle_dags,
-                self._dag_ids,
-                self.get_dag_directory(),
-                callback_to_execute_for_file,
-            )
+            processor: DagFileProcessorProcess | PooledDagFileProcessor
+            if self._processor_pool:
+                processor = self._processor_pool.create_processor(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
+            else:
+                processor = self._create_process(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
 
             del self._callback_to_execute[file_path]
             Stats.incr("dag_processing.processes", tags={"file_path": file_path, "action": "start"})
@@ -1269,6 +1366,8 @@ class DagFileProcessorManager(LoggingMixin):
         Note this method is only called when the file path queue is empty
         """
         self._parsing_start_time = time.perf_counter()
+        if self._parse_cache:
+            self._parse_cache.refresh_fingerprint()
         # If the file path is already being processed, or if a file was
         # processed recently, wait until the next batch
         file_paths_in_progress = set(self._processors)
@@ -1427,10 +1526,14 @@ class DagFileProcessorManager(LoggingMixin):
                 "dag_processing.processes", tags={"file_path": processor.file_path, "action": "terminate"}
             )
             processor.terminate()
+        if self._processor_pool:
+            self._processor_pool.shutdown()
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
         pids_to_kill = self.get_all_pids()
+        if self._processor_pool:
+            pids_to_kill = list(set(pids_to_kill).union(self._processor_pool.pids))
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
@@ -1448,6 +1551,12 @@ class DagFileProcessorManager(LoggingMixin):
             Stats.gauge(
                 "dag_processing.import_errors", sum(stat.import_errors for stat in self._file_stats.values())
             )
+            if self._parse_cache and (self._parse_cache_hits or self._parse_cache_misses):
+                Stats.gauge(
+                    "dag_processing.parse_cache.hit_ratio",
+                    self._parse_cache_hits / (self._parse_cache_hits + self._parse_cache_misses),
+                )
+                self._parse_cache_hits = self._parse_cache_misses = 0
             span.set_attribute("total_parse_time", parse_time)
             span.set_attribute("dag_bag_size", sum(stat.num_dags for stat in self._file_stats.values()))
             span.set_attribute("import_errors", sum(stat.import_errors for stat in self._file_stats.values()))
@@ -0,0 +1,183 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Cache of DAG file parse results, keyed by the content of the file and of what it depends on."""
+
+from __future__ import annotations
+
+import ast
+import os
+from importlib.metadata import distributions
+from pathlib import Path
+
+from airflow import __version__ as airflow_version
+from airflow.utils.hashlib_wrapper import md5
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+
+class DagFileParseCache(LoggingMixin):
+    """
+    Remember which DAG files were parsed successfully, and what the parse depended on.
+
+    A file needs to be parsed again only when its key changes. The key is a hash of:
+
+    * the content of the file,
+    * the content of the modules it imports, directly or not, from the DAG directory,
+    * the values of the Variables it reads with ``Variable.get`` using a literal key,
+    * the environment fingerprint: the Airflow and provider versions and the Airflow configuration.
+
+    Anything else a DAG file depends on - the current time, other files it reads, external services - is
+    not part of the key, so the cache must only be enabled for DAG files that are deterministic.
+
+    :param dag_directory: Directory where DAG definitions are kept; local modules are resolved from it
+    """
+
+    def __init__(self, dag_directory: os.PathLike[str] | str):
+        super().__init__()
+        self.dag_directory = Path(dag_directory)
+        self._keys: dict[str, str] = {}
+        self._fingerprint = ""
+        self.refresh_fingerprint()
+
+    def refresh_fingerprint(self) -> None:
+        """Recompute the environment fingerprint, invalidating the whole cache if it changed."""
+        from airflow.configuration import AIRFLOW_CONFIG
+
+        hasher = md5(airflow_version.encode())
+        providers = sorted(
+            f"{dist.metadata['Name']}=={dist.version}"
+            for dist in distributions()
+            if (dist.metadata["Name"] or "").startswith("apache-airflow-providers-")
+        )
+        hasher.update("\n".join(providers).encode())
+        try:
+            hasher.update(Path(AIRFLOW_CONFIG).read_bytes())
+        except OSError:
+            pass
+        hasher.update(
+            "\n".join(f"{k}={v}" for k, v in sorted(os.environ.items()) if k.startswith("AIRFLOW__")).encode()
+        )
+        fingerprint = hasher.hexdigest()
+        if self._fingerprint and fingerprint != self._fingerprint:
+            self.log.info("Configuration or providers changed, invalidating the DAG file parse cache")
+            self._keys.clear()
+        self._fingerprint = fingerprint
+
+    def compute_key(self, file_path: str) -> str | None:
+        """Return the cache key of ``file_path``, or None if it cannot be computed."""
+        try:
+            content = Path(file_path).read_bytes()
+        except OSError:
+            return None
+        hasher = md5(self._fingerprint.encode())
+        hasher.update(content)
+        if not file_path.endswith(".py"):
+            # Zipped DAGs are keyed on the content of the archive only
+            return hasher.hexdigest()
+
+        try:
+            tree = ast.parse(content, filename=file_path)
+        except (SyntaxError, ValueError):
+            return None
+        variable_keys: set[str] = set()
+        seen = {Path(file_path).resolve()}
+        pending = [(tree, Path(file_path).parent)]
+        while pending:
+            module_tree, module_dir = pending.pop()
+            variable_keys.update(self._variable_keys(module_tree))
+            for module_path in self._local_imports(module_tree, module_dir):
+                if module_path in seen:
+                    continue
+                seen.add(module_path)
+                try:
+                    module_content = module_path.read_bytes()
+                    pending.append((ast.parse(module_content, filename=str(module_path)), module_path.parent))
+                except (OSError, SyntaxError, ValueError):
+                    return None
+                hasher.update(str(module_path).encode())
+                hasher.update(module_content)
+
+        if variable_keys:
+            from airflow.models.variable import Variable
+
+            for key in sorted(variable_keys):
+                hasher.update(f"{key}={Variable.get(key, default_var=None)}".encode())
+        return hasher.hexdigest()
+
+    def is_cached(self, file_path: str, key: str | None) -> bool:
+        """Whether ``file_path`` was parsed successfully with the given key."""
+        return key is not None and self._keys.get(file_path) == key
+
+    def store(self, file_path: str, key: str | None) -> None:
+        """Record that ``file_path`` was parsed successfully with the given key."""
+        if key is None:
+            self._keys.pop(file_path, None)
+        else:
+            self._keys[file_path] = key
+
+    def invalidate(self, file_path: str) -> None:
+        """Forget the parse result of ``file_path``."""
+        self._keys.pop(file_path, None)
+
+    def _local_imports(self, tree: ast.AST, module_dir: Path) -> list[Path]:
+        """Return the files of the modules imported by ``tree`` that live in the DAG directory."""
+        module_names: list[tuple[str, int]] = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names.extend((alias.name, 0) for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                module_names.append((node.module or "", node.level))
+                # ``from package import module`` may import a module rather than a name
+                module_names.extend(
+                    (f"{node.module}.{alias.name}" if node.module else alias.name, node.level)
+                    for alias in node.names
+                )
+
+        paths = []
+        for name, level in module_names:
+            if level:
+                base = module_dir
+                for _ in range(level - 1):
+                    base = base.parent
+            else:
+                base = self.dag_directory
+            parts = [part for part in name.split(".") if part]
+            # Importing ``a.b.c`` also imports the packages ``a`` and ``a.b``
+            for i in range(1, len(parts) + 1):
+                candidate = base.joinpath(*parts[:i])
+                for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                    if path.is_file():
+                        paths.append(path.resolve())
+        return paths
+
+    @staticmethod
+    def _variable_keys(tree: ast.AST) -> set[str]:
+        """Return the literal keys passed to ``Variable.get`` in ``tree``."""
+        keys = set()
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "get"
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "Variable"
+                and node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)
+            ):
+                keys.add(node.args[0].value)
+        return keys
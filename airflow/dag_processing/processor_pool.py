@@ -0,0 +1,429 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Pool of long-lived DAG file processor processes, each parsing many files."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from contextlib import ExitStack, redirect_stderr, redirect_stdout, suppress
+from typing import TYPE_CHECKING
+
+import psutil
+from setproctitle import setproctitle
+
+from airflow import settings
+from airflow.configuration import conf
+from airflow.dag_processing.processor import DagFileProcessor
+from airflow.exceptions import AirflowException
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin, StreamLogWriter, set_context
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
+
+if TYPE_CHECKING:
+    import multiprocessing
+    from datetime import datetime
+    from multiprocessing.connection import Connection as MultiprocessingConnection
+
+    from airflow.callbacks.callback_requests import CallbackRequest
+
+
+class _PoolWorker:
+    """A process of the pool, and the connection used to send it files and receive their results."""
+
+    def __init__(self, process: multiprocessing.process.BaseProcess, conn: MultiprocessingConnection):
+        self.process = process
+        self.conn = conn
+        self.num_parses = 0
+
+
+def _unload_dag_modules(*directories: str | None) -> None:
+    """Remove the modules imported from ``directories`` from ``sys.modules``, so they are imported afresh."""
+    prefixes = tuple(
+        {
+            os.path.join(path, "")
+            for directory in directories
+            if directory
+            for path in (os.path.abspath(directory), os.path.realpath(directory))
+        }
+    )
+    if not prefixes:
+        return
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file).startswith(prefixes):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+class DagFileProcessorPool(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    Reuse DAG file processor processes across files instead of starting a process per file.
+
+    The worker processes are started on demand and kept idle between files, with Airflow and the modules
+    imported by the DAG files they parsed already loaded. A worker is recycled once it has parsed
+    ``max_parses`` files, or once its memory usage exceeds ``max_memory_mb``, to contain leaks and state
+    left behind by the DAG files. The modules imported from the DAGs folder and the plugins folder are
+    unloaded before each file, so a change to a helper module shared by DAG files is picked up.
+
+    Retired workers are reaped by :meth:`reap` without waiting for them, so that recycling a worker does
+    not block the DAG file processor manager.
+
+    :param max_parses: Number of files a worker parses before being recycled, 0 for no limit
+    :param max_memory_mb: Resident memory in MB above which a worker is recycled, 0 for no limit
+    """
+
+    # Seconds a retired worker is given to exit before being killed
+    RETIRE_TIMEOUT = 5
+
+    def __init__(self, max_parses: int = 0, max_memory_mb: int = 0):
+        super().__init__()
+        self.max_parses = max_parses
+        self.max_memory_mb = max_memory_mb
+        self._idle: list[_PoolWorker] = []
+        self._busy: set[_PoolWorker] = set()
+        # Workers asked to exit, with the monotonic time after which they are killed
+        self._retiring: dict[_PoolWorker, float] = {}
+        self._worker_counter = 0
+
+    def create_processor(
+        self,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ) -> PooledDagFileProcessor:
+        """Create a processor for ``file_path`` that runs in a worker of this pool once started."""
+        return PooledDagFileProcessor(
+            pool=self,
+            file_path=file_path,
+            pickle_dags=pickle_dags,
+            dag_ids=dag_ids,
+            dag_directory=dag_directory,
+            callback_requests=callback_requests,
+        )
+
+    @property
+    def pids(self) -> list[int]:
+        """PIDs of all the worker processes, idle, busy or retiring."""
+        return [
+            worker.process.pid
+            for worker in (*self._idle, *self._busy, *self._retiring)
+            if worker.process.pid
+        ]
+
+    def acquire(self) -> _PoolWorker:
+        """Return an idle worker, starting a new one if there is none."""
+        self.reap()
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.process.is_alive():
+                self._busy.add(worker)
+                return worker
+            self.discard(worker)
+        worker = self._start_worker()
+        self._busy.add(worker)
+        return worker
+
+    def release(self, worker: _PoolWorker, rss: int) -> None:
+        """Return ``worker`` to the pool after it parsed a file, or recycle it if it reached its limits."""
+        self._busy.discard(worker)
+        worker.num_parses += 1
+        if self.max_parses and worker.num_parses >= self.max_parses:
+            self.log.debug(
+                "Recycling DAG processor worker %s after %d parses", worker.process.pid, worker.num_parses
+            )
+            Stats.incr("dag_processing.pool.worker_recycled", tags={"reason": "max_parses"})
+            self.retire(worker)
+        elif self.max_memory_mb and rss > self.max_memory_mb * 1024 * 1024:
+            self.log.info(
+                "Recycling DAG processor worker %s using %d MB of memory",
+                worker.process.pid,
+                rss // (1024 * 1024),
+            )
+            Stats.incr("dag_processing.pool.worker_recycled", tags={"reason": "memory"})
+            self.retire(worker)
+        else:
+            self._idle.append(worker)
+
+    def retire(self, worker: _PoolWorker) -> None:
+        """Ask ``worker`` to exit without waiting for it; it is reaped, or killed if it takes too long."""
+        self._busy.discard(worker)
+        with suppress(ValueError):
+            self._idle.remove(worker)
+        with suppress(OSError):
+            worker.conn.send(None)
+        self._retiring.setdefault(worker, time.monotonic() + self.RETIRE_TIMEOUT)
+        self.reap()
+
+    def reap(self) -> None:
+        """Discard the retired workers that exited, and kill the ones that did not exit in time."""
+        now = time.monotonic()
+        for worker, deadline in list(self._retiring.items()):
+            # is_alive() also reaps the process if it exited
+            if not worker.process.is_alive():
+                del self._retiring[worker]
+                self.discard(worker)
+            elif now >= deadline:
+                del self._retiring[worker]
+                self.kill(worker)
+
+    def kill(self, worker: _PoolWorker) -> None:
+        """Kill ``worker`` and remove it from the pool."""
+        if worker.process.is_alive() and worker.process.pid:
+            self.log.warning("Killing DAG processor worker (PID=%d)", worker.process.pid)
+            os.kill(worker.process.pid, signal.SIGKILL)
+        worker.process.join()
+        self.discard(worker)
+
+    def discard(self, worker: _PoolWorker) -> None:
+        """Remove a worker that has exited from the pool."""
+        self._busy.discard(worker)
+        self._retiring.pop(worker, None)
+        with suppress(ValueError):
+            self._idle.remove(worker)
+        worker.conn.close()
+
+    def shutdown(self) -> None:
+        """Stop all the idle workers, and wait for the retired workers to exit."""
+        for worker in list(self._idle):
+            self.retire(worker)
+        while self._retiring:
+            time.sleep(0.1)
+            self.reap()
+
+    def _start_worker(self) -> _PoolWorker:
+        context = self._get_multiprocessing_context()
+        parent_conn, child_conn = context.Pipe()
+        thread_name = f"DagFileProcessorPoolWorker{self._worker_counter}"
+        self._worker_counter += 1
+        process = context.Process(
+            target=type(self)._serve,
+            args=(child_conn, parent_conn, thread_name),
+            name=f"{thread_name}-Process",
+        )
+        process.start()
+        # Close the child side of the pipe now the worker has started, so that reading from the parent side
+        # fails instead of blocking when the worker dies.
+        child_conn.close()
+        Stats.incr("dag_processing.pool.worker_started")
+        return _PoolWorker(process, parent_conn)
+
+    @staticmethod
+    def _serve(
+        conn: MultiprocessingConnection, parent_conn: MultiprocessingConnection, thread_name: str
+    ) -> None:
+        """Parse the files received on ``conn`` until told to stop; runs in the worker process."""
+        log: logging.Logger = logging.getLogger("airflow.processor")
+        parent_conn.close()
+        del parent_conn
+
+        # Re-configure the ORM engine as there are issues with multiple processes
+        settings.configure_orm()
+        threading.current_thread().name = thread_name
+        process = psutil.Process()
+        log_to_stdout = conf.get_mandatory_value("logging", "DAG_PROCESSOR_LOG_TARGET") == "stdout"
+        try:
+            while True:
+                setproctitle("airflow scheduler - DagFileProcessor pool worker")
+                try:
+                    request = conn.recv()
+                except EOFError:
+                    break
+                if request is None:
+                    break
+                file_path, pickle_dags, dag_ids, dag_directory, callback_requests = request
+                set_context(log, file_path)
+                setproctitle(f"airflow scheduler - DagFileProcessor {file_path}")
+                log.info("Worker process (PID=%s) started to work on %s", os.getpid(), file_path)
+                # Import the helper modules of the DAG files again, in case they changed since the last file
+                _unload_dag_modules(dag_directory, settings.PLUGINS_FOLDER)
+                try:
+                    with ExitStack() as stack:
+                        # stdout must not be sent to the logs when the logs are sent to stdout, that would
+                        # loop forever; see DagFileProcessorProcess._run_file_processor.
+                        if not log_to_stdout:
+                            stack.enter_context(redirect_stdout(StreamLogWriter(log, logging.INFO)))
+                            stack.enter_context(redirect_stderr(StreamLogWriter(log, logging.WARNING)))
+                        timer = stack.enter_context(Stats.timer())
+                        dag_file_processor = DagFileProcessor(
+                            dag_ids=dag_ids, dag_directory=dag_directory, log=log
+                        )
+                        result = dag_file_processor.process_file(
+                            file_path=file_path,
+                            pickle_dags=pickle_dags,
+                            callback_requests=callback_requests,
+                        )
+                except Exception:
+                    log.exception("Got an exception while processing %s! Recycling the worker.", file_path)
+                    conn.send((None, process.memory_info().rss))
+                    break
+                log.info("Processing %s took %.3f seconds", file_path, timer.duration)
+                conn.send((result, process.memory_info().rss))
+        finally:
+            # We re-initialized the ORM within this Process above so we need to
+            # tear it down manually here
+            settings.dispose_orm()
+            conn.close()
+
+
+class PooledDagFileProcessor(LoggingMixin):
+    """
+    Process a single DAG file in a worker of a :class:`DagFileProcessorPool`.
+
+    This has the same interface as :class:`~airflow.dag_processing.processor.DagFileProcessorProcess`, so
+    the DAG file processor manager can use either.
+
+    :param pool: the pool to take the worker from
+    :param file_path: a Python file containing Airflow DAG definitions
+    :param pickle_dags: whether to serialize the DAG objects to the DB
+    :param dag_ids: If specified, only look at these DAG ID's
+    :param callback_requests: failure callback to execute
+    """
+
+    def __init__(
+        self,
+        pool: DagFileProcessorPool,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ):
+        super().__init__()
+        self._pool = pool
+        self._file_path = file_path
+        self._pickle_dags = pickle_dags
+        self._dag_ids = dag_ids
+        self._dag_directory = dag_directory
+        self._callback_requests = callback_requests
+
+        self._worker: _PoolWorker | None = None
+        self._result: tuple[int, int, int] | None = None
+        self._done = False
+        self._start_time: datetime | None = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def start(self) -> None:
+        """Send the file to an idle worker of the pool."""
+        self._worker = self._pool.acquire()
+        self._start_time = timezone.utcnow()
+        self._worker.conn.send(
+            (self._file_path, self._pickle_dags, self._dag_ids, self._dag_directory, self._callback_requests)
+        )
+
+    def kill(self) -> None:
+        """Kill the worker processing the file, and ensure consistent state."""
+        if self._worker is None:
+            raise AirflowException("Tried to kill before starting!")
+        self._done = True
+        self._pool.kill(self._worker)
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Terminate (and then kill) the worker processing the file.
+
+        :param sigkill: whether to issue a SIGKILL if SIGTERM doesn't work.
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to call terminate before starting!")
+        self._done = True
+        self._worker.process.terminate()
+        # The pool reaps the worker, and kills it if it did not die after a while
+        self._pool.retire(self._worker)
+
+    @property
+    def pid(self) -> int:
+        """PID of the worker processing the given file."""
+        if self._worker is None or self._worker.process.pid is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._worker.process.pid
+
+    @property
+    def exit_code(self) -> int | None:
+        """Exit code of the worker, if processing the file made it exit."""
+        if self._worker is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        if not self._done:
+            raise AirflowException("Tried to call retcode before process was finished!")
+        return self._worker.process.exitcode
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the worker is done processing the file.
+
+        :return: whether the file is processed
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to see if it's done before starting!")
+
+        if self._done:
+            return True
+
+        if self._worker.conn.poll():
+            self._done = True
+            try:
+                self._result, rss = self._worker.conn.recv()
+            except (EOFError, OSError):
+                # The worker died while processing the file
+                self._pool.retire(self._worker)
+                return True
+            if self._result is None:
+                # The worker could not process the file and is exiting
+                self._pool.retire(self._worker)
+            else:
+                self._pool.release(self._worker, rss)
+            return True
+
+        if not self._worker.process.is_alive():
+            self._done = True
+            self._pool.discard(self._worker)
+            return True
+
+        return False
+
+    @property
+    def result(self) -> tuple[int, int, int] | None:
+        """Result of running ``DagFileProcessor.process_file()``."""
+        if not self.done:
+            raise AirflowException("Tried to get the result before it's done!")
+        return self._result
+
+    @property
+    def start_time(self) -> datetime:
+        """Time when this started to process the file."""
+        if self._start_time is None:
+            raise AirflowException("Tried to get start time before it started!")
+        return self._start_time
+
+    @property
+    def waitable_handle(self):
+        if self._worker is None:
+            raise AirflowException("Tried to get waitable handle before starting!")
+        return self._worker.conn
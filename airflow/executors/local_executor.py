@@ -26,17 +26,19 @@ LocalExecutor.
 from __future__ import annotations
 
 import contextlib
+import importlib
 import logging
 import os
 import subprocess
 from abc import abstractmethod
 from multiprocessing import Manager, Process
 from queue import Empty
-from typing import TYPE_CHECKING, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple
 
 from setproctitle import getproctitle, setproctitle
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
 from airflow.traces.tracer import Trace, span
@@ -57,6 +59,14 @@ if TYPE_CHECKING:
     # "Poison Pill" - worker seeing Poison Pill should take the pill and ... die instantly.
     ExecutorWorkType = Tuple[Optional[TaskInstanceKey], Optional[CommandType]]
 
+# Modules every forked task process needs to run ``airflow tasks run``; imported by the fork server.
+TASK_RUN_MODULES = (
+    "airflow.cli.commands.task_command",
+    "airflow.jobs.local_task_job_runner",
+    "airflow.models.dagbag",
+    "airflow.task.task_runner.standard_task_runner",
+)
+
 
 class LocalWorkerBase(Process, LoggingMixin):
     """
@@ -186,17 +196,37 @@ class QueuedLocalWorker(LocalWorkerBase):
 
     :param task_queue: queue from which worker reads tasks
     :param result_queue: queue where worker puts results after finishing tasks
+    :param stop_with_parent: whether to terminate once the process that started the worker has died
     """
 
-    def __init__(self, task_queue: Queue[ExecutorWorkType], result_queue: Queue[TaskInstanceStateType]):
+    # Seconds between checks that the parent process is alive, when stopping with it
+    parent_check_interval = 5.0
+
+    def __init__(
+        self,
+        task_queue: Queue[ExecutorWorkType],
+        result_queue: Queue[TaskInstanceStateType],
+        stop_with_parent: bool = False,
+    ):
         super().__init__(result_queue=result_queue)
         self.task_queue = task_queue
+        self.stop_with_parent = stop_with_parent
 
     @span
     def do_work(self) -> None:
+        parent_pid = os.getppid()
         while True:
             try:
-                key, command = self.task_queue.get()
+                if self.stop_with_parent:
+                    key, command = self.task_queue.get(timeout=self.parent_check_interval)
+                else:
+                    key, command = self.task_queue.get()
+            except Empty:
+                if os.getppid() != parent_pid:
+                    # A new fork server replaces the one that started this worker
+                    self.log.info("The parent of worker %s died. Terminating it.", self.name)
+                    break
+                continue
             except EOFError:
                 self.log.info(
                     "Failed to read tasks from the task queue because the other "
@@ -213,12 +243,109 @@ class QueuedLocalWorker(LocalWorkerBase):
                 self.task_queue.task_done()
 
 
+class LocalWorkerForkServer(Process, LoggingMixin):
+    """
+    Warm process the LocalExecutor workers are forked from, when running in fork server mode.
+
+    It imports everything ``airflow tasks run`` needs, initializes the providers and imports
+    ``preload_modules`` once, then forks the workers. The workers - and the task processes they fork - share
+    these modules with the fork server copy-on-write, instead of importing them again for every task.
+
+    With limited parallelism it starts ``parallelism`` :class:`QueuedLocalWorker` reading ``task_queue``.
+    With unlimited parallelism it starts one :class:`LocalWorker` per task read from ``task_queue``.
+
+    :param task_queue: queue from which the workers read tasks
+    :param result_queue: queue where workers put results after finishing tasks
+    :param parallelism: how many workers to start, 0 for one worker per task
+    :param preload_modules: additional modules to import before forking the workers
+    """
+
+    def __init__(
+        self,
+        task_queue: Queue[ExecutorWorkType],
+        result_queue: Queue[TaskInstanceStateType],
+        parallelism: int,
+        preload_modules: Iterable[str] = (),
+    ):
+        super().__init__(target=self.serve)
+        # Daemonic processes are not allowed to start child processes, and the fork server stops by
+        # itself once it has received the poison pill and all its workers have finished.
+        self.daemon: bool = False
+        self.task_queue = task_queue
+        self.result_queue = result_queue
+        self.parallelism = parallelism
+        self.preload_modules = list(preload_modules)
+
+    def run(self):
+        # We know we've just started a new process, so lets disconnect from the metadata db now
+        settings.engine.pool.dispose()
+        settings.engine.dispose()
+        setproctitle("airflow worker -- LocalExecutor fork server")
+        return super().run()
+
+    def preload(self) -> None:
+        """Import the modules the forked task processes will need."""
+        from airflow.cli.cli_parser import get_parser
+        from airflow.providers_manager import ProvidersManager
+
+        # The parser is cached, so the forked task processes get it ready to use.
+        get_parser()
+        providers_manager = ProvidersManager()
+        providers_manager.initialize_providers_hooks()
+        providers_manager.initialize_providers_taskflow_decorator()
+
+        for module in (*TASK_RUN_MODULES, *self.preload_modules):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                self.log.exception("Failed to preload module %s in the LocalExecutor fork server", module)
+        self.log.info("LocalExecutor fork server preloaded, forking workers")
+
+    def serve(self) -> None:
+        """Preload the modules, then fork the workers from this process and wait for them to finish."""
+        self.preload()
+        if self.parallelism:
+            workers = [
+                QueuedLocalWorker(self.task_queue, self.result_queue, stop_with_parent=True)
+                for _ in range(self.parallelism)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            return
+
+        workers = []
+        while True:
+            try:
+                key, command = self.task_queue.get()
+            except EOFError:
+                self.log.info("Task queue closed. Terminating LocalExecutor fork server.")
+                break
+            try:
+                if key is None or command is None:
+                    # Received poison pill, no more tasks to run
+                    break
+                worker = LocalWorker(self.result_queue, key=key, command=command)
+                worker.start()
+                workers.append(worker)
+                # Reap the workers that have already finished
+                workers = [worker for worker in workers if worker.is_alive()]
+            finally:
+                self.task_queue.task_done()
+        for worker in workers:
+            worker.join()
+
+
 class LocalExecutor(BaseExecutor):
     """
     LocalExecutor executes tasks locally in parallel.
 
     It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
 
+    With ``[core] local_executor_fork_server`` enabled, the workers are forked from a
+    :class:`LocalWorkerForkServer` with the task running modules already imported.
+
     :param parallelism: how many parallel processes are run in the executor
     """
 
@@ -237,6 +364,54 @@ class LocalExecutor(BaseExecutor):
         self.workers_used: int = 0
         self.workers_active: int = 0
         self.impl: None | (LocalExecutor.UnlimitedParallelism | LocalExecutor.LimitedParallelism) = None
+        self.fork_server: LocalWorkerForkServer | None = None
+        self.use_fork_server: bool = conf.getboolean("core", "local_executor_fork_server")
+        if self.use_fork_server and settings.EXECUTE_TASKS_NEW_PYTHON_INTERPRETER:
+            self.log.warning(
+                "[core] local_executor_fork_server has no effect when "
+                "[core] execute_tasks_new_python_interpreter is enabled."
+            )
+            self.use_fork_server = False
+
+    def _start_fork_server(self, task_queue: Queue[ExecutorWorkType]) -> None:
+        if TYPE_CHECKING:
+            assert self.result_queue
+
+        preload_modules = [
+            module.strip()
+            for module in conf.get("core", "local_executor_preload_modules", fallback="").split(",")
+            if module.strip()
+        ]
+        self.fork_server = LocalWorkerForkServer(
+            task_queue, self.result_queue, parallelism=self.parallelism, preload_modules=preload_modules
+        )
+        self.fork_server.start()
+
+    def _check_fork_server(self) -> None:
+        """Fail the tasks the fork server did not start and start a new one, if it died."""
+        if self.fork_server is None or self.fork_server.is_alive():
+            return
+        if TYPE_CHECKING:
+            assert self.impl
+            assert self.impl.queue
+
+        self.log.error(
+            "LocalExecutor fork server died with exit code %s, starting a new one",
+            self.fork_server.exitcode,
+        )
+        task_queue = self.impl.queue
+        with contextlib.suppress(Empty):
+            while True:
+                key, _ = task_queue.get_nowait()
+                task_queue.task_done()
+                if key is None:
+                    continue
+                self.log.error("Failing task %s, which was not started before the fork server died", key)
+                self.fail(key)
+                if isinstance(self.impl, LocalExecutor.UnlimitedParallelism):
+                    self.workers_active -= 1
+        # The tasks the workers of the dead fork server were running report their results as usual
+        self._start_fork_server(task_queue)
 
     class UnlimitedParallelism:
         """
@@ -247,11 +422,18 @@ class LocalExecutor(BaseExecutor):
 
         def __init__(self, executor: LocalExecutor):
             self.executor: LocalExecutor = executor
+            self.queue: Queue[ExecutorWorkType] | None = None
 
         def start(self) -> None:
             """Start the executor."""
             self.executor.workers_used = 0
             self.executor.workers_active = 0
+            if self.executor.use_fork_server:
+                if TYPE_CHECKING:
+                    assert self.executor.manager
+
+                self.queue = self.executor.manager.Queue()
+                self.executor._start_fork_server(self.queue)
 
         @span
         def execute_async(
@@ -280,9 +462,13 @@ class LocalExecutor(BaseExecutor):
                 span.set_attribute("try_number", key.try_number)
                 span.set_attribute("commands_to_run", str(command))
 
-            local_worker = LocalWorker(self.executor.result_queue, key=key, command=command)
             self.executor.workers_used += 1
             self.executor.workers_active += 1
+            if self.queue is not None:
+                # The fork server starts the worker
+                self.queue.put((key, command))
+                return
+            local_worker = LocalWorker(self.executor.result_queue, key=key, command=command)
             local_worker.start()
 
         def sync(self) -> None:
@@ -298,6 +484,9 @@ class LocalExecutor(BaseExecutor):
             """Wait synchronously for the previously submitted job to complete."""
             while self.executor.workers_active > 0:
                 self.executor.sync()
+            if self.queue is not None:
+                self.queue.put((None, None))
+                self.queue.join()
 
     class LimitedParallelism:
         """
@@ -319,6 +508,12 @@ class LocalExecutor(BaseExecutor):
                 assert self.executor.result_queue
 
             self.queue = self.executor.manager.Queue()
+            if self.executor.use_fork_server:
+                # The workers are forked from the fork server instead of from the executor
+                self.executor._start_fork_server(self.queue)
+                self.executor.workers_used = self.executor.parallelism
+                return
+
             self.executor.workers = [
                 QueuedLocalWorker(self.queue, self.executor.result_queue)
                 for _ in range(self.executor.parallelism)
@@ -366,7 +561,7 @@ class LocalExecutor(BaseExecutor):
 
             Sends the poison pill to all workers.
             """
-            for _ in self.executor.workers:
+            for _ in range(self.executor.workers_used):
                 self.queue.put((None, None))
 
             # Wait for commands to finish
@@ -412,6 +607,7 @@ class LocalExecutor(BaseExecutor):
         if TYPE_CHECKING:
             assert self.impl
 
+        self._check_fork_server()
         self.impl.sync()
 
     def end(self) -> None:
@@ -424,7 +620,11 @@ class LocalExecutor(BaseExecutor):
             "Shutting down LocalExecutor"
             "; waiting for running tasks to finish.  Signal again if you don't want to wait."
         )
+        # The task queue is only consumed, and joined, if the fork server is alive
+        self._check_fork_server()
         self.impl.end()
+        if self.fork_server:
+            self.fork_server.join()
         self.manager.shutdown()
 
     def terminate(self):
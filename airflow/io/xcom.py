@@ -0,0 +1,320 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""XCom backend storing tabular and array values as Arrow IPC or Parquet files in object storage."""
+
+from __future__ import annotations
+
+import math
+import sys
+import uuid
+from typing import TYPE_CHECKING, Any, Sequence
+
+from airflow.configuration import conf
+from airflow.io.path import ObjectStoragePath
+from airflow.models.xcom import BaseXCom
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from sqlalchemy.orm import Session
+
+    from airflow.models.xcom import XCom
+
+XCOM_REFERENCE_KEY = "__airflow_columnar_xcom__"
+
+_SUFFIXES = {"arrow": ".arrow", "parquet": ".parquet"}
+_NUMPY_COLUMN = "values"
+_CHUNK_ROWS = 64 * 1024
+"""Rows per Parquet row group or Arrow record batch, the unit in which row slices are read."""
+
+
+def _get_kind(value: Any) -> str | None:
+    """Return the kind of tabular or array value ``value`` is, or None if it is not one."""
+    # Only check the types of libraries that are already imported: if pandas is not imported, the value
+    # cannot be a DataFrame.
+    if (np := sys.modules.get("numpy")) is not None and isinstance(value, np.ndarray):
+        return "numpy"
+    if (pd := sys.modules.get("pandas")) is not None and isinstance(value, pd.DataFrame):
+        return "pandas"
+    if (pa := sys.modules.get("pyarrow")) is not None and isinstance(value, (pa.Table, pa.RecordBatch)):
+        return "arrow"
+    return None
+
+
+class ColumnarXComValue:
+    """
+    Lazy handle to a tabular or array XCom value stored by :class:`ColumnarXComBackend`.
+
+    Nothing is read until :meth:`read` or :meth:`to_arrow` is called, and then only the requested columns
+    and rows. Arrow IPC files on the local filesystem are memory-mapped, so reading them does not copy the
+    data; Parquet files and remote Arrow IPC files are read one row group or record batch at a time.
+
+    :param path: Location of the file, as accepted by :class:`~airflow.io.path.ObjectStoragePath`
+    :param format: ``arrow`` or ``parquet``
+    :param kind: Type of the value that was pushed: ``pandas``, ``arrow`` or ``numpy``
+    :param num_rows: Number of rows of the value; for arrays, the length of the first axis
+    :param columns: Column names of the value
+    :param index_columns: Columns holding the index, for ``pandas`` values
+    :param shape: Shape of the array, for ``numpy`` values
+    :param dtype: Data type of the array, for ``numpy`` values
+    """
+
+    def __init__(
+        self,
+        path: str,
+        format: str,
+        kind: str,
+        num_rows: int,
+        columns: list[str],
+        index_columns: list[str] | None = None,
+        shape: list[int] | None = None,
+        dtype: str | None = None,
+    ):
+        self.path = path
+        self.format = format
+        self.kind = kind
+        self.num_rows = num_rows
+        self.columns = columns
+        self.index_columns = index_columns or []
+        self.shape = shape
+        self.dtype = dtype
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.kind} value, {self.num_rows} rows, at {self.path}>"
+
+    def read(self, columns: Sequence[str] | None = None, rows: slice | None = None) -> Any:
+        """
+        Read the value back as the type that was pushed.
+
+        :param columns: Only read these columns; not supported for ``numpy`` values
+        :param rows: Only read this slice of rows, or of the first axis for ``numpy`` values
+        """
+        if self.kind == "numpy":
+            if columns is not None:
+                raise ValueError("Column projection is not supported for numpy XCom values")
+            return self._read_array(rows)
+        table = self.to_arrow(columns, rows)
+        if self.kind == "pandas":
+            return table.to_pandas()
+        return table
+
+    def to_arrow(self, columns: Sequence[str] | None = None, rows: slice | None = None) -> pa.Table:
+        """
+        Read the value as a :class:`pyarrow.Table`.
+
+        :param columns: Only read these columns
+        :param rows: Only read this slice of rows
+        """
+        start, stop = self._row_range(rows, self.num_rows)
+        if columns is not None:
+            # Keep the index of DataFrames, which is stored in its own columns
+            columns = [*self.index_columns, *(c for c in columns if c not in self.index_columns)]
+        return self._read_rows(start, stop, columns)
+
+    def _read_array(self, rows: slice | None) -> Any:
+        import numpy as np
+
+        shape = self.shape or [self.num_rows]
+        row_size = math.prod(shape[1:])
+        start, stop = self._row_range(rows, self.num_rows)
+        table = self._read_rows(start * row_size, stop * row_size, None)
+        values = table.column(_NUMPY_COLUMN).to_numpy()
+        return values.astype(np.dtype(self.dtype), copy=False).reshape(stop - start, *shape[1:])
+
+    @staticmethod
+    def _row_range(rows: slice | None, num_rows: int) -> tuple[int, int]:
+        if rows is None:
+            return 0, num_rows
+        start, stop, step = rows.indices(num_rows)
+        if step != 1:
+            raise ValueError("Row slices of columnar XCom values must be contiguous")
+        return start, max(start, stop)
+
+    def _read_rows(self, start: int, stop: int, columns: Sequence[str] | None) -> pa.Table:
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        path = ObjectStoragePath(self.path)
+        if self.format == "arrow" and path.protocol == "file":
+            # Memory-mapped: slicing and projecting the table does not read anything
+            table = pa.ipc.open_file(pa.memory_map(path.path)).read_all()
+            if columns is not None:
+                table = table.select(list(columns))
+            return table.slice(start, stop - start)
+
+        with path.open("rb") as f:
+            if self.format == "parquet":
+                parquet_file = pq.ParquetFile(f)
+                lengths = [
+                    parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)
+                ]
+                groups, offset = self._overlapping_chunks(lengths, start, stop)
+                table = parquet_file.read_row_groups(groups, columns=columns)
+            else:
+                reader = pa.ipc.open_file(f)
+                batches = []
+                offset = batch_start = 0
+                for i in range(reader.num_record_batches):
+                    if batch_start >= stop:
+                        break
+                    batch = reader.get_batch(i)
+                    if batch_start + len(batch) > start:
+                        if not batches:
+                            offset = batch_start
+                        batches.append(batch)
+                    batch_start += len(batch)
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                if columns is not None:
+                    table = table.select(list(columns))
+        return table.slice(start - offset, stop - start)
+
+    @staticmethod
+    def _overlapping_chunks(lengths: list[int], start: int, stop: int) -> tuple[list[int], int]:
+        """Return the indexes of the chunks holding rows ``start`` to ``stop``, and the first row of them."""
+        indexes = []
+        offset = first_row = 0
+        for i, length in enumerate(lengths):
+            if offset + length > start and offset < stop:
+                if not indexes:
+                    first_row = offset
+                indexes.append(i)
+            offset += length
+        return indexes, first_row if indexes else start
+
+
+class ColumnarXComBackend(BaseXCom):
+    """
+    XCom backend writing tabular and array values to object storage instead of the database.
+
+    pandas DataFrames, pyarrow Tables and RecordBatches, and numpy arrays are written as Arrow IPC or
+    Parquet files under ``[core] xcom_columnar_path``, and the XCom row only stores a reference to the
+    file. Pulling such a value returns a :class:`ColumnarXComValue` handle that reads only the columns
+    and rows it is asked for. Any other value is stored in the database, as with :class:`BaseXCom`.
+    """
+
+    @staticmethod
+    def serialize_value(
+        value: Any,
+        *,
+        key: str | None = None,
+        task_id: str | None = None,
+        dag_id: str | None = None,
+        run_id: str | None = None,
+        map_index: int | None = None,
+    ) -> Any:
+        base_path = conf.get("core", "xcom_columnar_path", fallback="")
+        kind = _get_kind(value)
+        if kind is not None and base_path:
+            reference = ColumnarXComBackend._write_value(
+                value, kind, ObjectStoragePath(base_path), dag_id, run_id, task_id, map_index
+            )
+            if reference is not None:
+                value = {XCOM_REFERENCE_KEY: reference}
+        return BaseXCom.serialize_value(
+            value, key=key, task_id=task_id, dag_id=dag_id, run_id=run_id, map_index=map_index
+        )
+
+    @staticmethod
+    def deserialize_value(result: XCom) -> Any:
+        value = BaseXCom.deserialize_value(result)
+        if (reference := ColumnarXComBackend._get_reference(value)) is not None:
+            return ColumnarXComValue(**reference)
+        return value
+
+    def orm_deserialize_value(self) -> Any:
+        value = BaseXCom._deserialize_value(self, True)
+        if (reference := ColumnarXComBackend._get_reference(value)) is not None:
+            return reference["path"]
+        return value
+
+    @staticmethod
+    def purge(xcom: XCom, session: Session) -> None:
+        if not xcom.value:
+            return
+        if (reference := ColumnarXComBackend._get_reference(BaseXCom.deserialize_value(xcom))) is not None:
+            ObjectStoragePath(reference["path"]).unlink(missing_ok=True)
+
+    @staticmethod
+    def _get_reference(value: Any) -> dict[str, Any] | None:
+        if isinstance(value, dict) and len(value) == 1 and XCOM_REFERENCE_KEY in value:
+            return value[XCOM_REFERENCE_KEY]
+        return None
+
+    @staticmethod
+    def _write_value(
+        value: Any,
+        kind: str,
+        base_path: ObjectStoragePath,
+        dag_id: str | None,
+        run_id: str | None,
+        task_id: str | None,
+        map_index: int | None,
+    ) -> dict[str, Any] | None:
+        """Write ``value`` to a new file under ``base_path``; return None if it cannot be stored as Arrow."""
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        file_format = conf.get("core", "xcom_columnar_format", fallback="arrow").lower()
+        if file_format not in _SUFFIXES:
+            raise ValueError(f"Unsupported xcom_columnar_format: {file_format}")
+
+        reference: dict[str, Any] = {"format": file_format, "kind": kind}
+        try:
+            if kind == "pandas":
+                # Store the index even if it is a RangeIndex, so row slices keep their labels
+                table = pa.Table.from_pandas(value, preserve_index=True)
+                reference["index_columns"] = [
+                    column for column in table.column_names if column not in value.columns.astype(str)
+                ]
+            elif kind == "numpy":
+                if value.ndim == 0:
+                    return None
+                table = pa.table({_NUMPY_COLUMN: pa.array(value.reshape(-1))})
+                reference.update(shape=list(value.shape), dtype=value.dtype.str)
+            elif isinstance(value, pa.RecordBatch):
+                table = pa.Table.from_batches([value])
+            else:
+                table = value
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            # e.g. arrays of Python objects, which are stored in the database as usual
+            return None
+
+        path = base_path.joinpath(
+            *(str(part) for part in (dag_id, run_id, task_id, map_index) if part is not None),
+            f"{uuid.uuid4()}{_SUFFIXES[file_format]}",
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            if file_format == "parquet":
+                pq.write_table(table, f, row_group_size=_CHUNK_ROWS)
+            else:
+                with pa.ipc.new_file(f, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=_CHUNK_ROWS)
+
+        reference.update(
+            path=str(path),
+            num_rows=value.shape[0] if kind == "numpy" else table.num_rows,
+            columns=[
+                column for column in table.column_names if column not in reference.get("index_columns", [])
+            ]
+            if kind != "numpy"
+            else [],
+        )
+        return reference
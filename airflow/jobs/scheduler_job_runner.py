@@ -24,16 +24,26 @@ import signal
 import sys
 import time
 import warnings
-from collections import Counter, defaultdict, deque
-from contextlib import suppress
+from collections import ChainMap, Counter, defaultdict, deque
+from contextlib import contextmanager, nullcontext, suppress
 from dataclasses import dataclass
 from datetime import timedelta
-from functools import lru_cache, partial
+from functools import lru_cache, partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    ContextManager,
+    Generator,
+    Iterable,
+    Iterator,
+    NamedTuple,
+)
 
 from deprecated import deprecated
-from sqlalchemy import and_, delete, func, not_, or_, select, text, update
+from sqlalchemy import and_, bindparam, delete, func, not_, or_, select, text, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import lazyload, load_only, make_transient, selectinload
 from sqlalchemy.sql import expression
@@ -47,7 +57,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import Job, perform_heartbeat
 from airflow.models import Log
-from airflow.models.dag import DAG, DagModel
+from airflow.models.dag import DAG, DAG_PARTITION_BUCKETS, DagModel
 from airflow.models.dagbag import DagBag
 from airflow.models.dagrun import DagRun
 from airflow.models.dataset import (
@@ -67,8 +77,11 @@ from airflow.traces.tracer import Trace, span
 from airflow.utils import timezone
 from airflow.utils.dates import datetime_to_nano
 from airflow.utils.event_scheduler import EventScheduler
+from airflow.utils.hash_ring import HashRing
+from airflow.utils.helpers import chunks
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
+from airflow.utils.scheduler_profiling import PROFILE_SIGNAL, SchedulerLoopProfiler
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
     is_lock_not_available_error,
@@ -88,8 +101,9 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Query, Session
 
     from airflow.dag_processing.manager import DagFileProcessorAgent
-    from airflow.executors.base_executor import BaseExecutor
+    from airflow.executors.base_executor import BaseExecutor, EventBufferValueType
     from airflow.executors.executor_utils import ExecutorName
+    from airflow.models.pool import PoolStats
     from airflow.models.taskinstance import TaskInstanceKey
     from airflow.utils.sqlalchemy import (
         CommitProhibitorGuard,
@@ -126,6 +140,204 @@ class ConcurrencyMap:
         return instance
 
 
+class _ConcurrencyOverlay(ChainMap):
+    """
+    Copy-on-write view over a ledger counter.
+
+    Reads fall through to the underlying counter, writes (``+=``) land in the overlay only,
+    and missing keys count as zero like they do for :class:`~collections.Counter`.
+    """
+
+    def __missing__(self, key):
+        return 0
+
+
+class _LedgerEntry(NamedTuple):
+    pool: str
+    pool_slots: int
+    state: TaskInstanceState
+
+
+class ConcurrencyLedger(LoggingMixin):
+    """
+    Scheduler-resident accounting of the task instances that occupy concurrency and pool slots.
+
+    The ledger is seeded from the database once and then kept up to date from the state transitions
+    the scheduler performs itself (queueing TIs) and the executor events it receives, so the critical
+    section does not have to re-aggregate every running and queued task instance on each loop.
+    Transitions made by other processes (other schedulers, tasks deferring themselves, users clearing
+    or marking TIs) are only picked up by :meth:`reconcile`, which the scheduler runs periodically; the
+    scheduler does not use the ledger while other schedulers are running.
+    Changes made as part of a transaction are staged with :meth:`staged`, so that they only count once
+    the transaction committed.
+
+    :param reconcile_interval: How often (in seconds) the ledger should be reconciled against the database.
+    """
+
+    def __init__(self, reconcile_interval: float) -> None:
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        self._entries: dict[tuple[str, str, str, int], _LedgerEntry] = {}
+        self._concurrency = ConcurrencyMap(Counter(), Counter(), Counter())
+        self._pool_slots: dict[str, Counter[TaskInstanceState]] = defaultdict(Counter)
+        self._last_reconciled: float | None = None
+        self._staged: list[tuple[tuple[str, str, str, int], _LedgerEntry | None]] | None = None
+
+    @property
+    def is_seeded(self) -> bool:
+        return self._last_reconciled is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _apply(self, key: tuple[str, str, str, int], entry: _LedgerEntry, sign: int) -> None:
+        dag_id, task_id, run_id, _ = key
+        if entry.state in EXECUTION_STATES:
+            self._concurrency.dag_active_tasks_map[dag_id] += sign
+            self._concurrency.task_concurrency_map[(dag_id, task_id)] += sign
+            self._concurrency.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += sign
+        self._pool_slots[entry.pool][entry.state] += sign * entry.pool_slots
+
+    def _set_entry(self, key: tuple[str, str, str, int], entry: _LedgerEntry | None) -> None:
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self._apply(key, old_entry, -1)
+        if entry is not None:
+            self._entries[key] = entry
+            self._apply(key, entry, 1)
+
+    def _change(self, key: tuple[str, str, str, int], entry: _LedgerEntry | None) -> None:
+        if self._staged is not None:
+            self._staged.append((key, entry))
+        else:
+            self._set_entry(key, entry)
+
+    @contextmanager
+    def staged(self) -> Generator[None, None, None]:
+        """
+        Stage the changes made by :meth:`track` and :meth:`discard` until the end of the block.
+
+        The block wraps a transaction: the changes are applied when it exits after the commit, and
+        dropped if it raises, so that a rolled back transaction does not leave TIs counted.
+        """
+        self._staged = []
+        try:
+            yield
+        except BaseException:
+            self._staged = None
+            raise
+        staged, self._staged = self._staged, None
+        for key, entry in staged:
+            self._set_entry(key, entry)
+
+    def track(self, ti: TaskInstance, state: TaskInstanceState) -> None:
+        """Record that ``ti`` now occupies slots in ``state``, replacing any previous entry for it."""
+        self._change(ti.key.primary, _LedgerEntry(ti.pool, ti.pool_slots, state))
+
+    def sync(self, key: tuple[str, str, str, int], pool: str, pool_slots: int, state: str | None) -> None:
+        """
+        Set the entry of a TI from its state read from the DB.
+
+        The TI is tracked if it occupies slots in ``state``, like the pools count them: in an execution
+        state, or deferred. It is discarded otherwise.
+        """
+        if state in EXECUTION_STATES or state == TaskInstanceState.DEFERRED:
+            self._change(key, _LedgerEntry(pool, pool_slots, TaskInstanceState(state)))
+        else:
+            self._change(key, None)
+
+    def set_state(self, key: tuple[str, str, str, int], state: TaskInstanceState) -> None:
+        """Move an already tracked TI to ``state``; untracked keys are ignored until the next reconcile."""
+        entry = self._entries.get(key)
+        if entry is None or entry.state == state:
+            return
+        self._apply(key, entry, -1)
+        entry = self._entries[key] = entry._replace(state=state)
+        self._apply(key, entry, 1)
+
+    def discard(self, key: tuple[str, str, str, int]) -> None:
+        """Release the slots held by the TI with primary key ``key``, if it is tracked."""
+        self._change(key, None)
+
+    def concurrency_map(self) -> ConcurrencyMap:
+        """
+        Return the current concurrency map for the TIs in execution states.
+
+        The returned map is an overlay: increments made by the caller while picking TIs to queue do
+        not leak back into the ledger. Use :meth:`track` once the TIs have actually been queued.
+        """
+        return ConcurrencyMap(
+            _ConcurrencyOverlay({}, self._concurrency.dag_active_tasks_map),
+            _ConcurrencyOverlay({}, self._concurrency.task_concurrency_map),
+            _ConcurrencyOverlay({}, self._concurrency.task_dagrun_concurrency_map),
+        )
+
+    def slots_stats(self, *, lock_rows: bool = False, session: Session) -> dict[str, PoolStats]:
+        """
+        Get Pool stats like :meth:`~airflow.models.pool.Pool.slots_stats`, using the ledger for slot usage.
+
+        The pool rows themselves are still read (and optionally locked) from the database, so pool
+        size changes are picked up immediately and the critical section keeps its locking semantics.
+        Scheduled slots are not tracked by the ledger and are always reported as zero.
+        """
+        from airflow.models.pool import Pool, PoolStats
+
+        if not self.is_seeded:
+            self.reconcile(session=session)
+
+        query = select(Pool.pool, Pool.slots, Pool.include_deferred)
+        if lock_rows:
+            query = with_row_locks(query, session=session, nowait=True)
+
+        pools: dict[str, PoolStats] = {}
+        for pool_name, total_slots, include_deferred in session.execute(query):
+            if total_slots == -1:
+                total_slots = float("inf")  # type: ignore
+            used = self._pool_slots.get(pool_name, Counter())
+            stats = PoolStats(
+                total=total_slots,
+                running=used[TaskInstanceState.RUNNING],
+                queued=used[TaskInstanceState.QUEUED],
+                deferred=used[TaskInstanceState.DEFERRED],
+                scheduled=0,
+                open=0,
+            )
+            stats["open"] = stats["total"] - stats["running"] - stats["queued"]
+            if include_deferred:
+                stats["open"] -= stats["deferred"]
+            pools[pool_name] = stats
+        return pools
+
+    def reconcile(self, *, session: Session) -> None:
+        """Rebuild the ledger from the task instances currently occupying slots in the database."""
+        rows = session.execute(
+            select(TI.dag_id, TI.task_id, TI.run_id, TI.map_index, TI.pool, TI.pool_slots, TI.state).where(
+                TI.state.in_(EXECUTION_STATES | {TaskInstanceState.DEFERRED})
+            )
+        )
+        entries = {
+            (dag_id, task_id, run_id, map_index): _LedgerEntry(pool, pool_slots, state)
+            for dag_id, task_id, run_id, map_index, pool, pool_slots, state in rows
+        }
+        if self.is_seeded:
+            drift = sum(
+                1
+                for key in entries.keys() | self._entries.keys()
+                if entries.get(key) != self._entries.get(key)
+            )
+            if drift:
+                self.log.info("Concurrency ledger drifted by %d TIs, reconciled with the DB", drift)
+            Stats.gauge("scheduler.concurrency_ledger.drift", drift)
+
+        self._entries = entries
+        self._concurrency = ConcurrencyMap(Counter(), Counter(), Counter())
+        self._pool_slots = defaultdict(Counter)
+        for key, entry in entries.items():
+            self._apply(key, entry, 1)
+        self._last_reconciled = time.monotonic()
+        Stats.gauge("scheduler.concurrency_ledger.size", len(entries))
+
+
 def _is_parent_process() -> bool:
     """
     Whether this is a parent process.
@@ -253,6 +465,36 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         self.dagbag = DagBag(dag_folder=self.subdir, read_dags_from_db=True, load_op_links=False)
 
+        self._batch_dag_run_scheduling = conf.getboolean("scheduler", "batch_dag_run_scheduling")
+
+        self._bulk_process_executor_events = conf.getboolean("scheduler", "bulk_process_executor_events")
+        self._max_executor_events_per_loop = conf.getint("scheduler", "max_executor_events_per_loop")
+        # Executor events above max_executor_events_per_loop, left for the next loop
+        self._carried_over_executor_events: dict[
+            BaseExecutor, dict[TaskInstanceKey, EventBufferValueType]
+        ] = {}
+
+        # When partitioning is enabled, each live scheduler owns the DAG partition buckets that hash to it on
+        # a consistent hash ring of the live scheduler job ids. None means this scheduler considers every DAG.
+        self._partition_dags = conf.getboolean("scheduler", "partition_dags_by_scheduler")
+        self._partition_ring: HashRing[int] | None = None
+        self._owned_partition_buckets: set[int] | None = None
+
+        self._loop_profiler: SchedulerLoopProfiler | None = None
+        if conf.getboolean("scheduler", "enable_loop_profiling"):
+            self._loop_profiler = SchedulerLoopProfiler(
+                output_dir=conf.get("scheduler", "loop_profiling_output_dir"),
+                sample_seconds=conf.getfloat("scheduler", "loop_profiling_sample_seconds"),
+            )
+
+        self._concurrency_ledger: ConcurrencyLedger | None = None
+        if conf.getboolean("scheduler", "use_concurrency_ledger"):
+            self._concurrency_ledger = ConcurrencyLedger(
+                reconcile_interval=conf.getfloat("scheduler", "concurrency_ledger_reconcile_interval")
+            )
+        # Whether the ledger is not used because other schedulers are running
+        self._concurrency_ledger_suspended = False
+
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
         Stats.incr("scheduler_heartbeat", 1, 1)
@@ -262,6 +504,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         signal.signal(signal.SIGINT, self._exit_gracefully)
         signal.signal(signal.SIGTERM, self._exit_gracefully)
         signal.signal(signal.SIGUSR2, self._debug_dump)
+        if self._loop_profiler:
+            signal.signal(PROFILE_SIGNAL, self._start_profile_sampling)
 
     def _exit_gracefully(self, signum: int, frame: FrameType | None) -> None:
         """Clean up processor_agent to avoid leaving orphan processes."""
@@ -291,6 +535,31 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             executor.debug_dump()
             self.log.info("-" * 80)
 
+    def _start_profile_sampling(self, signum: int, frame: FrameType | None) -> None:
+        if not _is_parent_process() or not self._loop_profiler:
+            # Only the parent process runs the scheduler loop.
+            return
+        self._loop_profiler.handle_signal(signum, frame)
+
+    def _profile_phase(self, phase: str) -> ContextManager[None]:
+        """Time the enclosed block as ``phase`` when loop profiling is enabled."""
+        if self._loop_profiler:
+            return self._loop_profiler.phase(phase)
+        return nullcontext()
+
+    def _profiled_event(self, action: Callable) -> Callable:
+        """Wrap a timed event so that each of its runs is timed when loop profiling is enabled."""
+        if not self._loop_profiler:
+            return action
+        phase = f"timed_event.{action.__name__.lstrip('_')}"
+
+        @wraps(action)
+        def wrapper(*args, **kwargs):
+            with self._profile_phase(phase):
+                return action(*args, **kwargs)
+
+        return wrapper
+
     def __get_concurrency_maps(self, states: Iterable[TaskInstanceState], session: Session) -> ConcurrencyMap:
         """
         Get the concurrency maps.
@@ -344,7 +613,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        concurrency_ledger = self._get_concurrency_ledger(session=session)
+        if concurrency_ledger is not None:
+            pools = concurrency_ledger.slots_stats(lock_rows=True, session=session)
+        else:
+            pools = Pool.slots_stats(lock_rows=True, session=session)
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -359,7 +632,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
+        if concurrency_ledger is not None:
+            concurrency_map = concurrency_ledger.concurrency_map()
+        else:
+            concurrency_map = self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -392,6 +668,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .order_by(-TI.priority_weight, DR.execution_date, TI.map_index)
             )
 
+            if self._owned_partition_buckets is not None:
+                query = query.where(DM.partition_filter(self._owned_partition_buckets))
+
             if starved_pools:
                 query = query.where(not_(TI.pool.in_(starved_pools)))
 
@@ -662,6 +941,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
             for ti in executable_tis:
                 ti.emit_state_change_metric(TaskInstanceState.QUEUED)
+                if self._concurrency_ledger is not None:
+                    self._concurrency_ledger.track(ti, TaskInstanceState.QUEUED)
 
         for ti in executable_tis:
             make_transient(ti)
@@ -681,6 +962,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         for ti in task_instances:
             if ti.dag_run.state in State.finished_dr_states:
                 ti.set_state(None, session=session)
+                if self._concurrency_ledger is not None:
+                    self._concurrency_ledger.discard(ti.key.primary)
                 continue
             command = ti.command_as_list(
                 local=True,
@@ -740,7 +1023,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.debug("max_tis query size is less than or equal to zero. No query will be performed!")
             return 0
 
-        queued_tis = self._executable_task_instances_to_queued(max_tis, session=session)
+        with self._profile_phase("executable_task_instances_to_queued"):
+            queued_tis = self._executable_task_instances_to_queued(max_tis, session=session)
 
         # Sort queued TIs to there respective executor
         executor_to_queued_tis = self._executor_to_tis(queued_tis)
@@ -764,8 +1048,55 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         """Respond to executor events."""
         if not self._standalone_dag_processor and not self.processor_agent:
             raise ValueError("Processor agent is not started.")
+        event_buffer = self._pop_executor_events(executor)
+        with Stats.timer("scheduler.executor_events.drain_duration"):
+            if self._bulk_process_executor_events:
+                num_events = self._process_executor_events_in_bulk(executor, event_buffer, session)
+            else:
+                num_events = self._process_executor_event_buffer(executor, event_buffer, session)
+        return num_events + len(self._carried_over_executor_events.get(executor, ()))
+
+    def _pop_executor_events(self, executor: BaseExecutor) -> dict[TaskInstanceKey, EventBufferValueType]:
+        """
+        Return the executor events to process in this loop.
+
+        Events carried over from the previous loops come first. When there are more events than
+        ``[scheduler] max_executor_events_per_loop``, the newest ones are carried over to the next loop.
+        """
+        event_buffer = self._carried_over_executor_events.pop(executor, {})
+        event_buffer.update(executor.get_event_buffer())
+
+        executor_name = type(executor).__name__
+        Stats.gauge(f"scheduler.executor_events.buffer_depth.{executor_name}", len(event_buffer))
+        Stats.gauge(
+            "scheduler.executor_events.buffer_depth", len(event_buffer), tags={"executor": executor_name}
+        )
+
+        if self._max_executor_events_per_loop and len(event_buffer) > self._max_executor_events_per_loop:
+            events = list(event_buffer.items())
+            self._carried_over_executor_events[executor] = dict(events[self._max_executor_events_per_loop :])
+            event_buffer = dict(events[: self._max_executor_events_per_loop])
+            self.log.debug(
+                "Carrying over %d executor events to the next scheduler loop",
+                len(self._carried_over_executor_events[executor]),
+            )
+        return event_buffer
+
+    def _report_executor_event(self, ti_key: TaskInstanceKey, state: str) -> None:
+        self.log.info("Received executor event with state %s for task instance %s", state, ti_key)
+        if self._concurrency_ledger is not None:
+            if state == TaskInstanceState.RUNNING:
+                self._concurrency_ledger.set_state(ti_key.primary, TaskInstanceState.RUNNING)
+            elif state not in EXECUTION_STATES:
+                self._concurrency_ledger.discard(ti_key.primary)
+
+    def _process_executor_event_buffer(
+        self,
+        executor: BaseExecutor,
+        event_buffer: dict[TaskInstanceKey, EventBufferValueType],
+        session: Session,
+    ) -> int:
         ti_primary_key_to_try_number_map: dict[tuple[str, str, str, int], int] = {}
-        event_buffer = executor.get_event_buffer()
         tis_with_right_state: list[TaskInstanceKey] = []
 
         # Report execution
@@ -773,7 +1104,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # We create map (dag_id, task_id, execution_date) -> in-memory try_number
             ti_primary_key_to_try_number_map[ti_key.primary] = ti_key.try_number
 
-            self.log.info("Received executor event with state %s for task instance %s", state, ti_key)
+            self._report_executor_event(ti_key, state)
             if state in (
                 TaskInstanceState.FAILED,
                 TaskInstanceState.SUCCESS,
@@ -901,47 +1232,202 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # All of this could also happen if the state is "running",
             # but that is handled by the zombie detection.
 
-            ti_queued = ti.try_number == buffer_key.try_number and ti.state == TaskInstanceState.QUEUED
-            ti_requeued = (
-                ti.queued_by_job_id != self.job.id  # Another scheduler has queued this task again
-                or executor.has_task(ti)  # This scheduler has this task already
+            if self._is_executor_state_mismatch(executor, ti, buffer_key.try_number):
+                request = self._handle_executor_state_mismatch(executor, ti, state, info, session)
+                if request:
+                    executor.send_callback(request)
+
+            if self._concurrency_ledger is not None:
+                # The TI may still hold slots, e.g. when it deferred or was queued again
+                self._concurrency_ledger.sync(ti.key.primary, ti.pool, ti.pool_slots, ti.state)
+
+        return len(event_buffer)
+
+    def _is_executor_state_mismatch(self, executor: BaseExecutor, ti: TI, try_number: int) -> bool:
+        ti_queued = ti.try_number == try_number and ti.state == TaskInstanceState.QUEUED
+        ti_requeued = (
+            ti.queued_by_job_id != self.job.id  # Another scheduler has queued this task again
+            or executor.has_task(ti)  # This scheduler has this task already
+        )
+        return ti_queued and not ti_requeued
+
+    def _handle_executor_state_mismatch(
+        self, executor: BaseExecutor, ti: TI, state: str, info: Any, session: Session
+    ) -> TaskCallbackRequest | None:
+        """
+        Fail a TI the executor reported as finished while it is still queued.
+
+        :return: The callback request to send for the TI, if its task has failure or retry callbacks
+        """
+        Stats.incr(
+            "scheduler.tasks.killed_externally",
+            tags={"dag_id": ti.dag_id, "task_id": ti.task_id},
+        )
+        msg = (
+            "Executor %s reported that the task instance %s finished with state %s, but the task instance's state attribute is %s. "  # noqa: RUF100, UP031, flynt
+            "Learn more: https://airflow.apache.org/docs/apache-airflow/stable/troubleshooting.html#task-state-changed-externally"
+            % (executor, ti, state, ti.state)
+        )
+        if info is not None:
+            msg += " Extra info: %s" % info  # noqa: RUF100, UP031, flynt
+        self.log.error(msg)
+        session.add(Log(event="state mismatch", extra=msg, task_instance=ti.key))
+
+        # Get task from the Serialized DAG
+        try:
+            dag = self.dagbag.get_dag(ti.dag_id)
+            task = dag.get_task(ti.task_id)
+        except Exception:
+            self.log.exception("Marking task instance %s as %s", ti, state)
+            ti.set_state(state)
+            return None
+        ti.task = task
+        if task.on_retry_callback or task.on_failure_callback:
+            return TaskCallbackRequest(
+                full_filepath=ti.dag_model.fileloc,
+                simple_task_instance=SimpleTaskInstance.from_ti(ti),
+                msg=msg,
+                processor_subdir=ti.dag_model.processor_subdir,
             )
+        ti.handle_failure(error=msg, session=session)
+        return None
 
-            if ti_queued and not ti_requeued:
-                Stats.incr(
-                    "scheduler.tasks.killed_externally",
-                    tags={"dag_id": ti.dag_id, "task_id": ti.task_id},
+    def _process_executor_events_in_bulk(
+        self,
+        executor: BaseExecutor,
+        event_buffer: dict[TaskInstanceKey, EventBufferValueType],
+        session: Session,
+    ) -> int:
+        """
+        Respond to executor events without loading every task instance they are about.
+
+        The external executor ids of queued and running TIs are set with one executemany UPDATE, on the
+        rows that are not locked by another scheduler.
+        Of the finished TIs, only the columns logged are read, and only the ones still queued - the
+        candidates for a state mismatch - are loaded, the callback requests for the mismatched ones being
+        sent together at the end. Unlike :meth:`_process_executor_event_buffer`, this does not emit a span
+        per finished TI.
+        """
+        external_executor_ids: dict[tuple[str, str, str, int], Any] = {}
+        finished_events: dict[tuple[str, str, str, int], tuple[int, str, Any]] = {}
+        for ti_key, (state, info) in event_buffer.items():
+            self._report_executor_event(ti_key, state)
+            if state in (TaskInstanceState.QUEUED, TaskInstanceState.RUNNING):
+                external_executor_ids[ti_key.primary] = info
+            elif state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS):
+                finished_events[ti_key.primary] = (ti_key.try_number, state, info)
+
+        key_columns = (TI.dag_id, TI.task_id, TI.run_id, TI.map_index)
+        ti_table = TI.__table__
+        update_external_executor_id = (
+            ti_table.update()
+            .where(
+                ti_table.c.dag_id == bindparam("b_dag_id"),
+                ti_table.c.task_id == bindparam("b_task_id"),
+                ti_table.c.run_id == bindparam("b_run_id"),
+                ti_table.c.map_index == bindparam("b_map_index"),
+            )
+            .values(external_executor_id=bindparam("b_external_executor_id"))
+        )
+        ti_keys = list(external_executor_ids)
+        for ti_keys_chunk in chunks(ti_keys, self.job.max_tis_per_query or len(ti_keys)):
+            # Like _process_executor_event_buffer, skip the rows another scheduler holds
+            query = select(*key_columns).where(tuple_in_condition(key_columns, ti_keys_chunk))
+            locked_keys = session.execute(with_row_locks(query, of=TI, session=session, skip_locked=True))
+            parameters = [
+                {
+                    "b_dag_id": dag_id,
+                    "b_task_id": task_id,
+                    "b_run_id": run_id,
+                    "b_map_index": map_index,
+                    "b_external_executor_id": external_executor_ids[(dag_id, task_id, run_id, map_index)],
+                }
+                for dag_id, task_id, run_id, map_index in locked_keys
+            ]
+            if parameters:
+                session.execute(update_external_executor_id, parameters)
+
+        callback_requests: list[TaskCallbackRequest] = []
+        finished_keys = list(finished_events)
+        for finished_keys_chunk in chunks(finished_keys, self.job.max_tis_per_query or len(finished_keys)):
+            rows = session.execute(
+                select(
+                    *key_columns,
+                    TI.start_date,
+                    TI.end_date,
+                    TI.duration,
+                    TI.state,
+                    TI.max_tries,
+                    TI.job_id,
+                    TI.pool,
+                    TI.pool_slots,
+                    TI.queue,
+                    TI.priority_weight,
+                    TI.operator,
+                    TI.queued_dttm,
+                    TI.queued_by_job_id,
+                    TI.pid,
+                ).where(tuple_in_condition(key_columns, finished_keys_chunk))
+            )
+            queued_keys = []
+            for row in rows:
+                try_number, state, _ = finished_events[(row.dag_id, row.task_id, row.run_id, row.map_index)]
+                self.log.info(
+                    "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, "
+                    "run_start_date=%s, run_end_date=%s, "
+                    "run_duration=%s, state=%s, executor=%s, executor_state=%s, try_number=%s, "
+                    "max_tries=%s, job_id=%s, pool=%s, queue=%s, priority_weight=%d, operator=%s, "
+                    "queued_dttm=%s, queued_by_job_id=%s, pid=%s",
+                    row.dag_id,
+                    row.task_id,
+                    row.run_id,
+                    row.map_index,
+                    row.start_date,
+                    row.end_date,
+                    row.duration,
+                    row.state,
+                    executor,
+                    state,
+                    try_number,
+                    row.max_tries,
+                    row.job_id,
+                    row.pool,
+                    row.queue,
+                    row.priority_weight,
+                    row.operator,
+                    row.queued_dttm,
+                    row.queued_by_job_id,
+                    row.pid,
                 )
-                msg = (
-                    "Executor %s reported that the task instance %s finished with state %s, but the task instance's state attribute is %s. "  # noqa: RUF100, UP031, flynt
-                    "Learn more: https://airflow.apache.org/docs/apache-airflow/stable/troubleshooting.html#task-state-changed-externally"
-                    % (executor, ti, state, ti.state)
+                ti_primary_key = (row.dag_id, row.task_id, row.run_id, row.map_index)
+                if self._concurrency_ledger is not None:
+                    # The TI may still hold slots, e.g. when it deferred or was queued again
+                    self._concurrency_ledger.sync(ti_primary_key, row.pool, row.pool_slots, row.state)
+                if row.state == TaskInstanceState.QUEUED:
+                    queued_keys.append(ti_primary_key)
+            if not queued_keys:
+                continue
+            query = (
+                select(TI)
+                .where(
+                    tuple_in_condition(key_columns, queued_keys),
+                    TI.state == TaskInstanceState.QUEUED,
                 )
-                if info is not None:
-                    msg += " Extra info: %s" % info  # noqa: RUF100, UP031, flynt
-                self.log.error(msg)
-                session.add(Log(event="state mismatch", extra=msg, task_instance=ti.key))
-
-                # Get task from the Serialized DAG
-                try:
-                    dag = self.dagbag.get_dag(ti.dag_id)
-                    task = dag.get_task(ti.task_id)
-                except Exception:
-                    self.log.exception("Marking task instance %s as %s", ti, state)
-                    ti.set_state(state)
+                .options(selectinload(TI.dag_model))
+            )
+            # row lock the candidates to make sure the scheduler doesn't fail when we have multi-schedulers
+            for ti in session.scalars(with_row_locks(query, of=TI, session=session, skip_locked=True)):
+                try_number, state, info = finished_events[ti.key.primary]
+                if not self._is_executor_state_mismatch(executor, ti, try_number):
                     continue
-                ti.task = task
-                if task.on_retry_callback or task.on_failure_callback:
-                    request = TaskCallbackRequest(
-                        full_filepath=ti.dag_model.fileloc,
-                        simple_task_instance=SimpleTaskInstance.from_ti(ti),
-                        msg=msg,
-                        processor_subdir=ti.dag_model.processor_subdir,
-                    )
-                    executor.send_callback(request)
-                else:
-                    ti.handle_failure(error=msg, session=session)
-
+                request = self._handle_executor_state_mismatch(executor, ti, state, info, session)
+                if request:
+                    callback_requests.append(request)
+                if self._concurrency_ledger is not None:
+                    self._concurrency_ledger.sync(ti.key.primary, ti.pool, ti.pool_slots, ti.state)
+
+        for request in callback_requests:
+            executor.send_callback(request)
         return len(event_buffer)
 
     def _execute(self) -> int | None:
@@ -989,6 +1475,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 executor.callback_sink = callback_sink
                 executor.start()
 
+            if self._loop_profiler:
+                self._loop_profiler.install_query_listeners(settings.engine)
+
             self.register_signals()
 
             if self.processor_agent:
@@ -1081,42 +1570,58 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Check on start up, then every configured interval
         self.adopt_or_reset_orphaned_tasks()
 
+        if self._partition_dags:
+            self._refresh_dag_partition()
+            timers.call_regular_interval(
+                conf.getfloat("scheduler", "dag_partition_refresh_interval"),
+                self._profiled_event(self._refresh_dag_partition),
+            )
+
         timers.call_regular_interval(
             conf.getfloat("scheduler", "orphaned_tasks_check_interval", fallback=300.0),
-            self.adopt_or_reset_orphaned_tasks,
+            self._profiled_event(self.adopt_or_reset_orphaned_tasks),
         )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "trigger_timeout_check_interval", fallback=15.0),
-            self.check_trigger_timeouts,
+            self._profiled_event(self.check_trigger_timeouts),
         )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "pool_metrics_interval", fallback=5.0),
-            self._emit_pool_metrics,
+            self._profiled_event(self._emit_pool_metrics),
         )
 
+        if self._concurrency_ledger is not None:
+            timers.call_regular_interval(
+                self._concurrency_ledger.reconcile_interval,
+                self._profiled_event(self._reconcile_concurrency_ledger),
+            )
+
         timers.call_regular_interval(
             conf.getfloat("scheduler", "zombie_detection_interval", fallback=10.0),
-            self._find_and_purge_zombies,
+            self._profiled_event(self._find_and_purge_zombies),
         )
 
-        timers.call_regular_interval(60.0, self._update_dag_run_state_for_paused_dags)
+        timers.call_regular_interval(
+            60.0,
+            self._profiled_event(self._update_dag_run_state_for_paused_dags),
+        )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "task_queued_timeout_check_interval"),
-            self._handle_tasks_stuck_in_queued,
+            self._profiled_event(self._handle_tasks_stuck_in_queued),
         )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "parsing_cleanup_interval"),
-            self._orphan_unreferenced_datasets,
+            self._profiled_event(self._orphan_unreferenced_datasets),
         )
 
         if self._standalone_dag_processor:
             timers.call_regular_interval(
                 conf.getfloat("scheduler", "parsing_cleanup_interval"),
-                self._cleanup_stale_dags,
+                self._profiled_event(self._cleanup_stale_dags),
             )
 
         for loop_count in itertools.count(start=1):
@@ -1135,7 +1640,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 with create_session() as session:
                     # This will schedule for as many executors as possible.
-                    num_queued_tis = self._do_scheduling(session)
+                    with self._profile_phase("do_scheduling"):
+                        num_queued_tis = self._do_scheduling(session)
 
                     # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                     # either a no-op, or they will check-in on currently running tasks and send out new
@@ -1145,10 +1651,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                     session.expunge_all()
                     num_finished_events = 0
-                    for executor in self.job.executors:
-                        num_finished_events += self._process_executor_events(
-                            executor=executor, session=session
-                        )
+                    with self._profile_phase("process_executor_events"):
+                        for executor in self.job.executors:
+                            num_finished_events += self._process_executor_events(
+                                executor=executor, session=session
+                            )
 
                 for executor in self.job.executors:
                     try:
@@ -1174,6 +1681,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f seconds", timer.duration)
+            if self._loop_profiler:
+                self._loop_profiler.end_loop(timer.duration)
             if span.is_recording():
                 span.add_event(
                     name="Ran scheduling loop",
@@ -1241,7 +1750,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if settings.USE_JOB_SCHEDULE:
-                self._create_dagruns_for_dags(guard, session)
+                with self._profile_phase("create_dagruns_for_dags"):
+                    self._create_dagruns_for_dags(guard, session)
 
             self._start_queued_dagruns(session)
             guard.commit()
@@ -1265,7 +1775,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             else:
                 self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
-        with prohibit_commit(session) as guard:
+        # The TIs queued are only counted by the ledger once the transaction queueing them committed
+        ledger_staged = (
+            self._concurrency_ledger.staged() if self._concurrency_ledger is not None else nullcontext()
+        )
+        with ledger_staged, prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
             session.expunge_all()
             # END: schedule TIs
@@ -1304,12 +1818,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
     @retry_db_transaction
     def _get_next_dagruns_to_examine(self, state: DagRunState, session: Session) -> Query:
         """Get Next DagRuns to Examine with retries."""
-        return DagRun.next_dagruns_to_examine(state, session)
+        return DagRun.next_dagruns_to_examine(
+            state, session, partition_buckets=self._owned_partition_buckets
+        )
 
     @retry_db_transaction
     def _create_dagruns_for_dags(self, guard: CommitProhibitorGuard, session: Session) -> None:
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
-        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(session)
+        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(
+            session, partition_buckets=self._owned_partition_buckets
+        )
         all_dags_needing_dag_runs = set(query.all())
         dataset_triggered_dags = [
             dag for dag in all_dags_needing_dag_runs if dag.dag_id in dataset_triggered_dag_info
@@ -1619,7 +2137,24 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         session: Session,
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
         """Make scheduling decisions for all `dag_runs`."""
-        callback_tuples = [(run, self._schedule_dag_run(run, session=session)) for run in dag_runs]
+        if not self._batch_dag_run_scheduling:
+            callback_tuples = [(run, self._schedule_dag_run(run, session=session)) for run in dag_runs]
+            guard.commit()
+            return callback_tuples
+
+        # Load the TIs of every run up front and set all the resulting TIs to scheduled at the end,
+        # instead of doing both once per dag run.
+        dag_runs = list(dag_runs)
+        with Stats.timer("scheduler.dag_runs_prefetch_duration"):
+            DagRun.prefetch_task_instances(dag_runs, session=session)
+        schedulable_tis: list[TI] = []
+        callback_tuples = [
+            (run, self._schedule_dag_run(run, session=session, schedulable_tis_out=schedulable_tis))
+            for run in dag_runs
+        ]
+        DagRun.bulk_schedule_tis(
+            schedulable_tis, session=session, max_tis_per_query=self.job.max_tis_per_query
+        )
         guard.commit()
         return callback_tuples
 
@@ -1627,11 +2162,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self,
         dag_run: DagRun,
         session: Session,
+        schedulable_tis_out: list[TI] | None = None,
     ) -> DagCallbackRequest | None:
         """
         Make scheduling decisions about an individual dag run.
 
         :param dag_run: The DagRun to schedule
+        :param schedulable_tis_out: If given, the TIs that are ready to be scheduled are appended to this
+            list for the caller to schedule in bulk, instead of being scheduled right away
         :return: Callback that needs to be executed
         """
         trace_id = int(trace_utils.gen_trace_id(dag_run=dag_run, as_int=True))
@@ -1726,7 +2264,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         "schedulable_tis": [_ti.task_id for _ti in schedulable_tis],
                     },
                 )
-            dag_run.schedule_tis(schedulable_tis, session, max_tis_per_query=self.job.max_tis_per_query)
+            if schedulable_tis_out is not None:
+                schedulable_tis_out.extend(schedulable_tis)
+            else:
+                dag_run.schedule_tis(schedulable_tis, session, max_tis_per_query=self.job.max_tis_per_query)
 
             return callback_to_run
 
@@ -1742,6 +2283,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             return True
 
         dag_run.dag_hash = latest_version
+        # verify_integrity may add or remove TIs, so any prefetched TIs are outdated
+        dag_run._prefetched_tis = None
 
         # Refresh the DAG
         dag_run.dag = self.dagbag.get_dag(dag_id=dag_run.dag_id, session=session)
@@ -1844,6 +2387,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 )
             )
             self._reschedule_stuck_task(ti)
+            if self._concurrency_ledger is not None:
+                self._concurrency_ledger.discard(ti.key.primary)
         else:
             self.log.info(
                 "Task requeue attempts exceeded max; marking failed. task_instance=%s",
@@ -1857,6 +2402,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 )
             )
             ti.set_state(TaskInstanceState.FAILED, session=session)
+            if self._concurrency_ledger is not None:
+                self._concurrency_ledger.discard(ti.key.primary)
 
     @deprecated(
         reason="This is backcompat layer for older executor interface. Should be removed in 3.0",
@@ -1912,6 +2459,84 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             .count()
         )
 
+    def _get_alive_scheduler_ids(self, session: Session) -> set[int]:
+        """Return the ids of the scheduler jobs that heartbeated within the health check threshold."""
+        threshold = conf.getint("scheduler", "scheduler_health_check_threshold")
+        alive_scheduler_ids = set(
+            session.scalars(
+                select(Job.id).where(
+                    Job.job_type == "SchedulerJob",
+                    Job.state == JobState.RUNNING,
+                    Job.latest_heartbeat > timezone.utcnow() - timedelta(seconds=threshold),
+                )
+            )
+        )
+        alive_scheduler_ids.add(self.job.id)
+        return alive_scheduler_ids
+
+    def _get_concurrency_ledger(self, session: Session) -> ConcurrencyLedger | None:
+        """
+        Return the concurrency ledger if the critical section can use it, None otherwise.
+
+        The ledger only sees the task instances queued by this scheduler, so it is not used while other
+        schedulers are alive, and it is reconciled with the database before it is used again.
+        """
+        if self._concurrency_ledger is None:
+            return None
+        other_scheduler_ids = self._get_alive_scheduler_ids(session) - {self.job.id}
+        if other_scheduler_ids:
+            if not self._concurrency_ledger_suspended:
+                self.log.warning(
+                    "Not using the concurrency ledger while other schedulers are running (job ids %s)",
+                    sorted(other_scheduler_ids),
+                )
+                self._concurrency_ledger_suspended = True
+            return None
+        if self._concurrency_ledger_suspended:
+            self.log.info("No other scheduler is running, using the concurrency ledger again")
+            self._concurrency_ledger.reconcile(session=session)
+            self._concurrency_ledger_suspended = False
+        return self._concurrency_ledger
+
+    @provide_session
+    def _refresh_dag_partition(self, session: Session = NEW_SESSION) -> None:
+        """
+        Recompute which DAGs this scheduler owns when running with ``partition_dags_by_scheduler``.
+
+        The DAG partition buckets are spread over the scheduler jobs that heartbeated within
+        ``[scheduler] scheduler_health_check_threshold`` using a consistent hash ring, so when a scheduler
+        stops heartbeating (or a new one starts) only the buckets of that scheduler move to another one.
+        The DAGs are filtered by the bucket stored with them, so new DAGs have an owner right away.
+        Row locks are still taken as usual, so schedulers that briefly disagree on ownership while
+        rebalancing do not both act on the same rows.
+        """
+        alive_scheduler_ids = self._get_alive_scheduler_ids(session)
+
+        if self._partition_ring is None or self._partition_ring.nodes != alive_scheduler_ids:
+            self.log.info(
+                "Rebalancing DAGs across %d live scheduler(s): %s",
+                len(alive_scheduler_ids),
+                sorted(alive_scheduler_ids),
+            )
+            Stats.incr("scheduler.partition.rebalanced")
+            self._partition_ring = HashRing(alive_scheduler_ids)
+
+        self._owned_partition_buckets = {
+            bucket
+            for bucket in range(DAG_PARTITION_BUCKETS)
+            if self._partition_ring.get_node(str(bucket)) == self.job.id
+        }
+        Stats.gauge("scheduler.partition.schedulers", len(alive_scheduler_ids))
+        Stats.gauge("scheduler.partition.owned_buckets", len(self._owned_partition_buckets))
+
+    @provide_session
+    def _reconcile_concurrency_ledger(self, session: Session = NEW_SESSION) -> None:
+        """Resynchronize the in-memory concurrency ledger with the task instance states in the DB."""
+        if self._concurrency_ledger is None:
+            return
+        with Stats.timer("scheduler.concurrency_ledger.reconcile_duration"):
+            self._concurrency_ledger.reconcile(session=session)
+
     @provide_session
     def _emit_pool_metrics(self, session: Session = NEW_SESSION) -> None:
         from airflow.models.pool import Pool
@@ -2000,6 +2625,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         reset_tis_message.append(repr(ti))
                         ti.state = None
                         ti.queued_by_job_id = None
+                        if self._concurrency_ledger is not None:
+                            key = (ti.dag_id, ti.task_id, ti.run_id, ti.map_index)
+                            self._concurrency_ledger.discard(key)
 
                     for ti in set(tis_to_adopt_or_reset) - set(to_reset):
                         ti.queued_by_job_id = self.job.id
@@ -2118,6 +2746,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 self.log.warning("Cannot clean up zombie %r with non-existent executor %s", ti, ti.executor)
                 continue
             executor.change_state(ti.key, TaskInstanceState.FAILED, remove_running=True)
+            if self._concurrency_ledger is not None:
+                self._concurrency_ledger.discard(ti.key.primary)
             Stats.incr("zombies_killed", tags={"dag_id": ti.dag_id, "task_id": ti.task_id})
 
     # [END find_and_purge_zombies]
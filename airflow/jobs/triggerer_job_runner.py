@@ -17,28 +17,36 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import json
 import logging
 import os
+import pickle
 import signal
 import sys
 import threading
 import time
 import warnings
-from collections import deque
+from collections import Counter, deque
 from contextlib import suppress
 from copy import copy
 from queue import SimpleQueue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, cast
 
+from setproctitle import setproctitle
 from sqlalchemy import func, select
 
+from airflow import settings
 from airflow.configuration import conf
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import perform_heartbeat
 from airflow.models.trigger import Trigger
+from airflow.serialization.serialized_objects import BaseSerialization
 from airflow.stats import Stats
 from airflow.traces.tracer import Trace, span
 from airflow.triggers.base import TriggerEvent
+from airflow.triggers.temporal import DateTimeTrigger
 from airflow.typing_compat import TypedDict
 from airflow.utils import timezone
 from airflow.utils.log.file_task_handler import FileTaskHandler
@@ -53,10 +61,14 @@ from airflow.utils.log.trigger_handler import (
     ctx_trigger_end,
     ctx_trigger_id,
 )
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.module_loading import import_string
 from airflow.utils.session import NEW_SESSION, provide_session
 
 if TYPE_CHECKING:
+    import multiprocessing
+    from multiprocessing.connection import Connection as MultiprocessingConnection
+
     from sqlalchemy.orm import Session
 
     from airflow.jobs.job import Job
@@ -268,6 +280,14 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise ValueError(f"Capacity number {capacity} is invalid")
 
         self.health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+        self.load_balancing = conf.getboolean("triggerer", "enable_load_balancing")
+        self.max_loop_lag = conf.getfloat("triggerer", "max_loop_lag")
+        self.load_balancing_interval = conf.getfloat("triggerer", "load_balancing_interval")
+        self.load_balancing_tolerance = conf.getfloat("triggerer", "load_balancing_tolerance")
+        self.event_batch_size = conf.getint("triggerer", "event_batch_size")
+        self._balanced_capacity = self.capacity
+        self._last_load_balancing = time.monotonic()
+        self._last_cpu_time = time.process_time()
 
         should_queue = True
         if DISABLE_WRAPPER:
@@ -287,8 +307,12 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             self.log.warning("Skipping trigger logger queue listener; disabled by handler setting.")
         else:
             self.listener = setup_queue_listener()
-        # Set up runner async thread
-        self.trigger_runner = TriggerRunner()
+        # Set up runner async thread, or processes
+        self.trigger_runner: TriggerRunner | TriggerRunnerSupervisor
+        if (processes := conf.getint("triggerer", "runner_processes")) > 1:
+            self.trigger_runner = TriggerRunnerSupervisor(processes, self.listener)
+        else:
+            self.trigger_runner = TriggerRunner()
 
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
@@ -395,20 +419,72 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
     @span
     def load_triggers(self):
         """Query the database for the triggers we're supposed to be running and update the runner."""
-        Trigger.assign_unassigned(self.job.id, self.capacity, self.health_check_threshold)
+        capacity = self.balance_load() if self.load_balancing else self.capacity
+        Trigger.assign_unassigned(self.job.id, capacity, self.health_check_threshold)
         ids = Trigger.ids_for_triggerer(self.job.id)
         self.trigger_runner.update_triggers(set(ids))
 
+    def balance_load(self) -> int:
+        """
+        Report our load, hand triggers over to less loaded triggerers, and return the capacity to fill up to.
+
+        This only happens every ``[triggerer] load_balancing_interval``; the capacity computed last is
+        returned in between. While another triggerer has room and is less loaded than us, we take no new
+        triggers, and we release enough of ours to halve the load difference. Released triggers are
+        cancelled here when the trigger set is updated, and picked up by other triggerers.
+        """
+        now = time.monotonic()
+        if now - self._last_load_balancing < self.load_balancing_interval:
+            return self._balanced_capacity
+        cpu_time = time.process_time()
+        cpu_percent = 100 * (cpu_time - self._last_cpu_time) / (now - self._last_load_balancing)
+        self._last_load_balancing, self._last_cpu_time = now, cpu_time
+
+        trigger_count = len(self.trigger_runner.triggers)
+        loop_lag = self.trigger_runner.loop_lag
+        load = max(trigger_count / self.capacity, loop_lag / self.max_loop_lag, cpu_percent / 100)
+        Trigger.report_load(self.job.id, trigger_count, loop_lag, cpu_percent, load)
+        Stats.gauge("triggerer.load", load, tags={"hostname": self.job.hostname})
+        Stats.gauge("triggerer.loop_lag", loop_lag, tags={"hostname": self.job.hostname})
+
+        peer_loads = Trigger.get_triggerer_loads(self.health_check_threshold)
+        peer_loads.pop(self.job.id, None)
+        least_load = min(peer_loads.values(), default=None)
+        if least_load is None or least_load >= min(1.0, load - self.load_balancing_tolerance):
+            self._balanced_capacity = self.capacity
+            return self._balanced_capacity
+
+        self._balanced_capacity = 0
+        released = Trigger.release_triggers(
+            self.job.id, int(trigger_count * (load - least_load) / (2 * load))
+        )
+        if released:
+            self.log.info(
+                "Released %d triggers for less loaded triggerers (load %.2f, least loaded %.2f)",
+                released,
+                load,
+                least_load,
+            )
+            Stats.incr("triggers.released", released)
+        return self._balanced_capacity
+
     @span
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
+        Stats.gauge(f"triggers.pending_events.{self.job.hostname}", len(self.trigger_runner.events))
+        Stats.gauge(
+            "triggers.pending_events", len(self.trigger_runner.events), tags={"hostname": self.job.hostname}
+        )
         while self.trigger_runner.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.trigger_runner.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
+            # Get a batch of events and their trigger IDs
+            events = []
+            while self.trigger_runner.events and len(events) < self.event_batch_size:
+                events.append(self.trigger_runner.events.popleft())
+            # Tell the model to wake up their tasks
+            with Stats.timer("triggers.submit_events_duration"):
+                Trigger.submit_events(events=events)
             # Emit stat event
-            Stats.incr("triggers.succeeded")
+            Stats.incr("triggers.succeeded", len(events))
 
     @span
     def handle_failed_triggers(self):
@@ -430,6 +506,14 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         Stats.gauge(
             "triggers.running", len(self.trigger_runner.triggers), tags={"hostname": self.job.hostname}
         )
+        if isinstance(self.trigger_runner, TriggerRunnerSupervisor):
+            for child in self.trigger_runner.children:
+                Stats.gauge(f"triggers.running.{self.job.hostname}.{child.index}", len(child.triggers))
+                Stats.gauge(
+                    "triggers.running_per_runner",
+                    len(child.triggers),
+                    tags={"hostname": self.job.hostname, "runner": str(child.index)},
+                )
         span = Trace.get_current_span()
         span.set_attribute("trigger host", self.job.hostname)
         span.set_attribute("triggers running", len(self.trigger_runner.triggers))
@@ -438,11 +522,171 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
-    task: asyncio.Task
+    task: asyncio.Future
     name: str
     events: int
 
 
+class CoalescedTriggerRun:
+    """
+    A single run of a trigger, whose events are fanned out to every trigger subscribed to it.
+
+    The run starts with the first subscriber and is cancelled once the last one unsubscribes. Events are
+    kept so that triggers subscribing after an event was fired still receive it. The trigger run is an
+    instance of its own, not one of the subscribed triggers, which are still cleaned up by
+    :meth:`TriggerRunner.run_trigger` as usual; it logs to the triggerer log and is cleaned up by the run.
+
+    :param trigger: The trigger to run on behalf of all subscribers, not shared with any of them
+    """
+
+    def __init__(self, trigger: BaseTrigger) -> None:
+        self.trigger = trigger
+        self.history: list[tuple[str, Any]] = []
+        self.subscribers: set[asyncio.Queue] = set()
+        self.task: asyncio.Task | None = None
+        self.finished = False
+
+    async def subscribe(self, on_idle: Callable[[], None]) -> AsyncIterator[TriggerEvent]:
+        """Yield the events of the run, raising its error if it fails; ``on_idle`` is called when it stops."""
+        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        for item in self.history:
+            queue.put_nowait(item)
+        self.subscribers.add(queue)
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "event":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    return
+        finally:
+            self.subscribers.discard(queue)
+            if not self.subscribers:
+                self.finished = True
+                self.task.cancel()
+                on_idle()
+
+    def _publish(self, kind: str, value: Any) -> None:
+        self.history.append((kind, value))
+        for queue in self.subscribers:
+            queue.put_nowait((kind, value))
+
+    async def _run(self) -> None:
+        # The task copied the context of the first subscriber: log to the triggerer log instead of its log
+        ctx_indiv_trigger.set(None)
+        ctx_task_instance.set(None)
+        ctx_trigger_id.set(None)
+        try:
+            async for event in self.trigger.run():
+                self._publish("event", event)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            self._publish("error", e)
+        else:
+            self._publish("done", None)
+        finally:
+            with suppress(Exception):
+                await self.trigger.cleanup()
+
+
+class TriggerTimer:
+    """
+    Fire time-based triggers from a single timer, rather than running each of them as its own task.
+
+    Scheduled triggers are kept in a heap ordered by their moment. The timer sleeps until the earliest one
+    is due, and then fires every trigger due by that time in batches of ``batch_size``, so it wakes up
+    once per due time whatever the number of triggers waiting. Only
+    :class:`~airflow.triggers.temporal.DateTimeTrigger`, which ``TimeDeltaTrigger`` serializes to, is
+    handled; subclasses overriding ``run`` are not.
+
+    :param on_fire: Called with the trigger ID, the trigger and its event for each trigger that fires
+    """
+
+    # Wake up at least this often, in case the system clock changes
+    max_sleep = 60.0
+    # Most triggers fired without yielding to the event loop
+    batch_size = 1000
+
+    def __init__(self, on_fire: Callable[[int, DateTimeTrigger, TriggerEvent], None]) -> None:
+        self.on_fire = on_fire
+        self.heap: list[tuple[float, int, int, asyncio.Future, DateTimeTrigger]] = []
+        self.pending = 0
+        self.stop = False
+        self._counter = itertools.count()
+        self._wake = asyncio.Event()
+
+    @staticmethod
+    def supports(trigger: BaseTrigger) -> bool:
+        """Whether ``trigger`` can be scheduled on the timer."""
+        return isinstance(trigger, DateTimeTrigger) and type(trigger).run is DateTimeTrigger.run
+
+    def schedule(self, trigger_id: int, trigger: DateTimeTrigger) -> asyncio.Future:
+        """
+        Schedule ``trigger`` to fire at its moment.
+
+        :return: A future completed once the trigger fired; cancelling it unschedules the trigger.
+        """
+        future = asyncio.get_running_loop().create_future()
+        moment = trigger.moment.timestamp()
+        if not self.heap or moment < self.heap[0][0]:
+            self._wake.set()
+        heapq.heappush(self.heap, (moment, next(self._counter), trigger_id, future, trigger))
+        self.pending += 1
+        future.add_done_callback(self._unschedule)
+        return future
+
+    def _unschedule(self, future: asyncio.Future) -> None:
+        self.pending -= 1
+
+    def fire_due(self) -> int:
+        """Fire up to ``batch_size`` triggers whose moment has passed, returning how many fired."""
+        now = time.time()
+        fired = 0
+        while self.heap and self.heap[0][0] <= now and fired < self.batch_size:
+            _, _, trigger_id, future, trigger = heapq.heappop(self.heap)
+            if future.done():
+                # Cancelled
+                continue
+            try:
+                self.on_fire(trigger_id, trigger, trigger.get_event())
+            except Exception as e:
+                # Reported by cleanup_finished_triggers, like the errors of the triggers run as tasks
+                future.set_exception(e)
+                continue
+            future.set_result(None)
+            fired += 1
+        if len(self.heap) > 2 * self.pending + 1000:
+            # Drop the entries of cancelled triggers, which are otherwise only dropped once due
+            self.heap = [entry for entry in self.heap if not entry[3].done()]
+            heapq.heapify(self.heap)
+        if fired:
+            Stats.incr("triggers.timer.fired", fired)
+        return fired
+
+    async def run(self) -> None:
+        """Fire triggers as they become due until stopped."""
+        while not self.stop:
+            self.fire_due()
+            Stats.gauge("triggers.timer.pending", self.pending)
+            Stats.gauge("triggers.timer.heap_size", len(self.heap))
+            self._wake.clear()
+            delay = self.max_sleep
+            if self.heap:
+                delay = min(delay, max(self.heap[0][0] - time.time(), 0.0))
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), delay)
+            Stats.incr("triggers.timer.wakeups")
+
+    def close(self) -> None:
+        self.stop = True
+        self._wake.set()
+
+
 class TriggerRunner(threading.Thread, LoggingMixin):
     """
     Runtime environment for all triggers.
@@ -459,6 +703,9 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     # Cache for looking up triggers by classpath
     trigger_cache: dict[str, type[BaseTrigger]]
 
+    # Shared runs of identical triggers, by classpath and serialized kwargs
+    coalesced_runs: dict[str, CoalescedTriggerRun]
+
     # Inbound queue of new triggers
     to_create: deque[tuple[int, BaseTrigger]]
 
@@ -471,6 +718,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException]]
 
+    # Smoothed event loop lag in seconds, measured by the block watchdog
+    loop_lag: float
+
+    # Timer firing time-based triggers, if enabled; only set while the event loop runs
+    timer: TriggerTimer | None
+
     # Should-we-stop flag
     stop: bool = False
 
@@ -483,6 +736,10 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         self.events = deque()
         self.failed_triggers = deque()
         self.job_id = None
+        self.loop_lag = 0.0
+        self.coalesced_runs = {}
+        self.coalesce_triggers = conf.getboolean("triggerer", "coalesce_triggers")
+        self.timer = None
 
     def run(self):
         """Sync entrypoint - just run a run in an async loop."""
@@ -495,6 +752,10 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         Actual triggers run in their own separate coroutines.
         """
         watchdog = asyncio.create_task(self.block_watchdog())
+        timer_task = None
+        if conf.getboolean("triggerer", "temporal_trigger_timer"):
+            self.timer = TriggerTimer(on_fire=self.timer_fired)
+            timer_task = asyncio.create_task(self.timer.run())
         last_status = time.time()
         try:
             while not self.stop:
@@ -502,6 +763,8 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 await self.create_triggers()
                 await self.cancel_triggers()
                 await self.cleanup_finished_triggers()
+                if timer_task is not None and timer_task.done():
+                    timer_task = self.restart_timer(timer_task)
                 # Sleep for a bit
                 await asyncio.sleep(1)
                 # Every minute, log status
@@ -512,8 +775,22 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         except Exception:
             self.stop = True
             raise
-        # Wait for watchdog to complete
+        finally:
+            if self.timer is not None:
+                self.timer.close()
+        # Wait for watchdog and timer to complete
         await watchdog
+        if timer_task is not None:
+            await timer_task
+
+    def restart_timer(self, timer_task: asyncio.Task) -> asyncio.Task:
+        """Log why the timer task exited, and start it again so that the scheduled triggers still fire."""
+        if timer_task.cancelled():
+            self.log.error("The trigger timer was cancelled, restarting it")
+        else:
+            self.log.error("The trigger timer exited, restarting it", exc_info=timer_task.exception())
+        Stats.incr("triggers.timer.restarted")
+        return asyncio.create_task(cast(TriggerTimer, self.timer).run())
 
     async def create_triggers(self):
         """Drain the to_create queue and create all new triggers that have been requested in the DB."""
@@ -522,7 +799,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             if trigger_id not in self.triggers:
                 ti: TaskInstance = trigger_instance.task_instance
                 self.triggers[trigger_id] = {
-                    "task": asyncio.create_task(self.run_trigger(trigger_id, trigger_instance)),
+                    "task": self.start_trigger(trigger_id, trigger_instance),
                     "name": f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}/{ti.try_number} "
                     f"(ID {trigger_id})",
                     "events": 0,
@@ -531,6 +808,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
             await asyncio.sleep(0)
 
+    def start_trigger(self, trigger_id: int, trigger: BaseTrigger) -> asyncio.Future:
+        """Schedule ``trigger`` on the timer if it is time-based, or start a task running it otherwise."""
+        if self.timer is not None and self.timer.supports(trigger):
+            return self.timer.schedule(trigger_id, cast(DateTimeTrigger, trigger))
+        return asyncio.create_task(self.run_trigger(trigger_id, trigger))
+
     async def cancel_triggers(self):
         """
         Drain the to_cancel queue and ensure all triggers that are not in the DB are cancelled.
@@ -601,6 +884,8 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            # Smoothed delay of the event loop, reported as the load of the triggerer
+            self.loop_lag += 0.1 * (max(time_elapsed - 0.1, 0.0) - self.loop_lag)
             if time_elapsed > 0.2:
                 self.log.info(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -627,7 +912,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         self.log.info("trigger %s starting", name)
         try:
             self.set_individual_trigger_logging(trigger)
-            async for event in trigger.run():
+            async for event in self.trigger_events(trigger):
                 self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]["name"], event)
                 self.triggers[trigger_id]["events"] += 1
                 self.events.append((trigger_id, event))
@@ -651,6 +936,37 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             ctx_indiv_trigger.set(None)
             self.log.info("trigger %s completed", name)
 
+    def timer_fired(self, trigger_id: int, trigger: DateTimeTrigger, event: TriggerEvent) -> None:
+        """Push the event of a trigger fired by the timer into our outbound event deque."""
+        self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]["name"], event)
+        self.triggers[trigger_id]["events"] += 1
+        self.events.append((trigger_id, event))
+        if SEND_TRIGGER_END_MARKER:
+            self.set_individual_trigger_logging(trigger)
+            self.mark_trigger_end(trigger)
+            ctx_indiv_trigger.set(None)
+
+    def trigger_events(self, trigger: BaseTrigger) -> AsyncIterator[TriggerEvent]:
+        """
+        Return the events of ``trigger``.
+
+        Triggers that support coalescing and have the same classpath and kwargs share a single run, whose
+        events are fanned out to all of them. The run is of a new instance created from the kwargs, so
+        that it is not affected by the cleanup of the trigger that started it.
+        """
+        if not (self.coalesce_triggers and trigger.supports_coalescing):
+            return trigger.run()
+        classpath, kwargs = trigger.serialize()
+        key = f"{classpath}:{json.dumps(BaseSerialization.serialize(kwargs), sort_keys=True)}"
+        shared_run = self.coalesced_runs.get(key)
+        if shared_run is None or shared_run.finished:
+            shared_run = self.coalesced_runs[key] = CoalescedTriggerRun(type(trigger)(**kwargs))
+        return shared_run.subscribe(on_idle=lambda: self._forget_coalesced_run(key, shared_run))
+
+    def _forget_coalesced_run(self, key: str, shared_run: CoalescedTriggerRun) -> None:
+        if self.coalesced_runs.get(key) is shared_run:
+            del self.coalesced_runs[key]
+
     @staticmethod
     def mark_trigger_end(trigger):
         if not HANDLER_SUPPORTS_TRIGGERER:
@@ -751,3 +1067,197 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         if classpath not in self.trigger_cache:
             self.trigger_cache[classpath] = import_string(classpath)
         return self.trigger_cache[classpath]
+
+
+class _TriggerRunnerChild:
+    """A child process of :class:`TriggerRunnerSupervisor`, and what it last reported."""
+
+    def __init__(
+        self, index: int, process: multiprocessing.process.BaseProcess, conn: MultiprocessingConnection
+    ):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.requested: set[int] = set()
+        self.triggers: set[int] = set()
+        self.loop_lag = 0.0
+
+
+class TriggerRunnerSupervisor(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    Run triggers in several child processes, each with its own :class:`TriggerRunner` and event loop.
+
+    It offers the same interface as :class:`TriggerRunner` to the main thread of the triggerer. Each
+    trigger is assigned to the child running the fewest triggers, and stays there for as long as it is
+    requested. Once per second, each child sends back over its pipe the events and failures of its
+    triggers, the triggers it runs and its event loop lag; they are collected in ``update_triggers``.
+
+    :param processes: Number of child processes
+    :param listener: Log queue listener of the triggerer, restarted in the children
+    """
+
+    def __init__(self, processes: int, listener: logging.handlers.QueueListener | None = None):
+        super().__init__()
+        self.processes = processes
+        self.listener = listener
+        self.children: list[_TriggerRunnerChild] = []
+        self.assignments: dict[int, _TriggerRunnerChild] = {}
+        self.events: deque[tuple[int, TriggerEvent]] = deque()
+        self.failed_triggers: deque[tuple[int, BaseException]] = deque()
+        self.job_id: int | None = None
+        self.stop = False
+
+    @property
+    def triggers(self) -> dict[int, int]:
+        """Map the triggers running in the children to the index of their child."""
+        return {trigger_id: child.index for child in self.children for trigger_id in child.triggers}
+
+    @property
+    def loop_lag(self) -> float:
+        """Event loop lag of the most lagging child."""
+        return max((child.loop_lag for child in self.children), default=0.0)
+
+    def start(self) -> None:
+        """Start the child processes."""
+        context = self._get_multiprocessing_context()
+        for index in range(self.processes):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=type(self)._serve,
+                args=(
+                    child_conn,
+                    parent_conn,
+                    self.job_id,
+                    index,
+                    # A running listener cannot be pickled, so it is only passed to forked children
+                    self.listener if context.get_start_method() == "fork" else None,
+                ),
+                name=f"TriggerRunner-{index}",
+            )
+            process.start()
+            # Close the child side of the pipe now the child has started, so that reading from the parent
+            # side fails instead of blocking when the child dies.
+            child_conn.close()
+            self.children.append(_TriggerRunnerChild(index, process, parent_conn))
+
+    def is_alive(self) -> bool:
+        return bool(self.children) and all(child.process.is_alive() for child in self.children)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Ask the children to stop their triggers, and wait up to ``timeout`` seconds for them to exit."""
+        for child in self.children:
+            with suppress(OSError):
+                child.conn.send(None)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for child in self.children:
+            child.process.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            if child.process.is_alive():
+                self.log.warning("Trigger runner process %s did not exit in time, killing it", child.index)
+                child.process.kill()
+                child.process.join()
+            child.conn.close()
+
+    def update_triggers(self, requested_trigger_ids: set[int]) -> None:
+        """Collect what the children reported, and send each of them the triggers it should run."""
+        self._receive()
+        for trigger_id in self.assignments.keys() - requested_trigger_ids:
+            del self.assignments[trigger_id]
+        counts = Counter(self.assignments.values())
+        for trigger_id in requested_trigger_ids - self.assignments.keys():
+            child = min(self.children, key=lambda c: counts[c])
+            self.assignments[trigger_id] = child
+            counts[child] += 1
+
+        for child in self.children:
+            requested = {trigger_id for trigger_id, c in self.assignments.items() if c is child}
+            if requested != child.requested:
+                with suppress(OSError):
+                    child.conn.send(requested)
+                child.requested = requested
+
+    def _receive(self) -> None:
+        for child in self.children:
+            try:
+                while child.conn.poll():
+                    events, failed_triggers, running, loop_lag = child.conn.recv()
+                    self.events.extend(events)
+                    self.failed_triggers.extend(failed_triggers)
+                    child.triggers = set(running)
+                    child.loop_lag = loop_lag
+            except (EOFError, OSError):
+                # The child died; the main loop notices through is_alive()
+                continue
+
+    @staticmethod
+    def _serve(
+        conn: MultiprocessingConnection,
+        parent_conn: MultiprocessingConnection,
+        job_id: int | None,
+        index: int,
+        listener: logging.handlers.QueueListener | None,
+    ) -> None:
+        """Run the triggers received on ``conn`` until told to stop; runs in the child process."""
+        parent_conn.close()
+        del parent_conn
+        # The parent coordinates the shutdown
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        setproctitle(f"airflow triggerer -- runner {index}")
+        # Re-configure the ORM engine as there are issues with multiple processes
+        settings.configure_orm()
+        if listener is not None:
+            # The thread of the listener of the parent did not survive the fork
+            logging.handlers.QueueListener(
+                listener.queue, *listener.handlers, respect_handler_level=True
+            ).start()
+        elif not DISABLE_WRAPPER and configure_trigger_log_handler() and not DISABLE_LISTENER:
+            setup_queue_listener()
+
+        runner = TriggerRunner()
+        runner.job_id = job_id
+        runner.start()
+        # Triggers that exited are not started again while the parent still requests them, as it does
+        # until it has handled their events or failures.
+        requested: set[int] = set()
+        finished: set[int] = set()
+        running: set[int] = set()
+        try:
+            while runner.is_alive():
+                if conn.poll(1):
+                    try:
+                        message = conn.recv()
+                    except EOFError:
+                        break
+                    if message is None:
+                        break
+                    requested = message
+                    finished &= requested
+                    runner.update_triggers(requested - finished)
+                events = []
+                while runner.events:
+                    events.append(runner.events.popleft())
+                failed_triggers = []
+                while runner.failed_triggers:
+                    trigger_id, exc = runner.failed_triggers.popleft()
+                    failed_triggers.append((trigger_id, _make_picklable(exc)))
+                now_running = set(runner.triggers)
+                finished |= running - now_running
+                # A trigger can fire between two polls without ever being seen running
+                finished.update(trigger_id for trigger_id, _ in events)
+                finished.update(trigger_id for trigger_id, _ in failed_triggers)
+                running = now_running
+                conn.send((events, failed_triggers, list(running), runner.loop_lag))
+        finally:
+            runner.stop = True
+            runner.join(30)
+            settings.dispose_orm()
+            conn.close()
+
+
+def _make_picklable(exc: BaseException | None) -> BaseException | None:
+    """Return ``exc`` if it can be sent to another process, or a RuntimeError describing it."""
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
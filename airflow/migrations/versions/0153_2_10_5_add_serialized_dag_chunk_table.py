@@ -0,0 +1,56 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add serialized_dag_chunk table.
+
+Revision ID: 8b3e4f1a6c2d
+Revises: 5f2621c13b39
+Create Date: 2026-10-17 09:12:44.219513
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+import airflow
+
+# revision identifiers, used by Alembic.
+revision = "8b3e4f1a6c2d"
+down_revision = "5f2621c13b39"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+
+def upgrade():
+    """Add serialized_dag_chunk table."""
+    op.create_table(
+        "serialized_dag_chunk",
+        sa.Column("chunk_hash", sa.String(length=32), nullable=False),
+        sa.Column("data_compressed", sa.LargeBinary(), nullable=False),
+        sa.Column("last_updated", airflow.utils.sqlalchemy.UtcDateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("chunk_hash", name=op.f("serialized_dag_chunk_pkey")),
+    )
+
+
+def downgrade():
+    """Drop serialized_dag_chunk table."""
+    op.drop_table("serialized_dag_chunk")
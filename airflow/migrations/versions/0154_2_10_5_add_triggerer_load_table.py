@@ -0,0 +1,62 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add triggerer_load table.
+
+Revision ID: 3c7a9d2e5b14
+Revises: 8b3e4f1a6c2d
+Create Date: 2026-10-17 11:21:03.480716
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+import airflow
+
+# revision identifiers, used by Alembic.
+revision = "3c7a9d2e5b14"
+down_revision = "8b3e4f1a6c2d"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+
+def upgrade():
+    """Add triggerer_load table."""
+    op.create_table(
+        "triggerer_load",
+        sa.Column("triggerer_id", sa.Integer(), nullable=False),
+        sa.Column("trigger_count", sa.Integer(), nullable=False),
+        sa.Column("loop_lag", sa.Float(), nullable=False),
+        sa.Column("cpu_percent", sa.Float(), nullable=False),
+        sa.Column("load", sa.Float(), nullable=False),
+        sa.Column("updated_at", airflow.utils.sqlalchemy.UtcDateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["triggerer_id"], ["job.id"], name="triggerer_load_job_fkey", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("triggerer_id", name=op.f("triggerer_load_pkey")),
+    )
+
+
+def downgrade():
+    """Drop triggerer_load table."""
+    op.drop_table("triggerer_load")
@@ -0,0 +1,60 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add serialized_dag_change table.
+
+Revision ID: 5e1f0b9c7d23
+Revises: 3c7a9d2e5b14
+Create Date: 2026-10-17 11:52:40.118253
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+import airflow
+from airflow.migrations.db_types import StringID
+
+# revision identifiers, used by Alembic.
+revision = "5e1f0b9c7d23"
+down_revision = "3c7a9d2e5b14"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+
+def upgrade():
+    """Add serialized_dag_change table."""
+    op.create_table(
+        "serialized_dag_change",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("dag_id", StringID(), nullable=False),
+        sa.Column("dag_hash", sa.String(length=32), nullable=True),
+        sa.Column("created_at", airflow.utils.sqlalchemy.UtcDateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("serialized_dag_change_pkey")),
+    )
+    with op.batch_alter_table("serialized_dag_change", schema=None) as batch_op:
+        batch_op.create_index("idx_serialized_dag_change_created_at", ["created_at"], unique=False)
+
+
+def downgrade():
+    """Drop serialized_dag_change table."""
+    op.drop_table("serialized_dag_change")
@@ -0,0 +1,50 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add metadata_hash column to dag table.
+
+Revision ID: 8b3f6a1d2c47
+Revises: 5e1f0b9c7d23
+Create Date: 2026-10-17 14:08:12.530914
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b3f6a1d2c47"
+down_revision = "5e1f0b9c7d23"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+
+def upgrade():
+    """Add metadata_hash column to dag table."""
+    with op.batch_alter_table("dag", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("metadata_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade():
+    """Drop metadata_hash column from dag table."""
+    with op.batch_alter_table("dag", schema=None) as batch_op:
+        batch_op.drop_column("metadata_hash")
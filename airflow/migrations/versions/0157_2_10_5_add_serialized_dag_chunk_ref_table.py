@@ -0,0 +1,81 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add serialized_dag_chunk_ref table.
+
+Revision ID: c4d7e2a9f015
+Revises: 8b3f6a1d2c47
+Create Date: 2026-10-17 12:21:05.640127
+
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.migrations.db_types import StringID
+
+# revision identifiers, used by Alembic.
+revision = "c4d7e2a9f015"
+down_revision = "8b3f6a1d2c47"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+
+def upgrade():
+    """Add serialized_dag_chunk_ref table, with the chunks referenced by the stored serialized DAGs."""
+    ref_table = op.create_table(
+        "serialized_dag_chunk_ref",
+        sa.Column("dag_id", StringID(), nullable=False),
+        sa.Column("chunk_hash", sa.String(length=32), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "chunk_hash", name=op.f("serialized_dag_chunk_ref_pkey")),
+    )
+    with op.batch_alter_table("serialized_dag_chunk_ref", schema=None) as batch_op:
+        batch_op.create_index("idx_serialized_dag_chunk_ref_chunk_hash", ["chunk_hash"], unique=False)
+
+    serialized_dag = sa.table(
+        "serialized_dag",
+        sa.column("dag_id", sa.String),
+        sa.column("data", sa.Text),
+        sa.column("data_compressed", sa.LargeBinary),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(serialized_dag.c.dag_id, serialized_dag.c.data, serialized_dag.c.data_compressed)
+    )
+    refs = []
+    for dag_id, data, data_compressed in rows:
+        if data_compressed:
+            data = zlib.decompress(data_compressed)
+        if isinstance(data, (str, bytes)):
+            data = json.loads(data)
+        task_chunks = (data or {}).get("dag", {}).get("task_chunks") or {}
+        refs.extend({"dag_id": dag_id, "chunk_hash": chunk_hash} for chunk_hash in set(task_chunks.values()))
+    if refs:
+        op.bulk_insert(ref_table, refs)
+
+
+def downgrade():
+    """Drop serialized_dag_chunk_ref table."""
+    op.drop_table("serialized_dag_chunk_ref")
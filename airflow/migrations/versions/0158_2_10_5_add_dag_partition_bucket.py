@@ -0,0 +1,75 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add partition_bucket column to dag table.
+
+Revision ID: e7a1c3f9b852
+Revises: c4d7e2a9f015
+Create Date: 2026-10-17 12:31:05.624107
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.hashlib_wrapper import md5
+
+# revision identifiers, used by Alembic.
+revision = "e7a1c3f9b852"
+down_revision = "c4d7e2a9f015"
+branch_labels = None
+depends_on = None
+airflow_version = "2.10.5"
+
+# Same as airflow.models.dag.DAG_PARTITION_BUCKETS, copied so that the migration does not change with it
+DAG_PARTITION_BUCKETS = 256
+
+
+def upgrade():
+    """Add partition_bucket column to dag table, and compute it for the existing DAGs."""
+    with op.batch_alter_table("dag", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("partition_bucket", sa.Integer(), nullable=True))
+        batch_op.create_index("idx_dag_partition_bucket", ["partition_bucket"], unique=False)
+
+    dag = sa.table("dag", sa.column("dag_id", sa.String), sa.column("partition_bucket", sa.Integer))
+    conn = op.get_bind()
+    buckets = [
+        {
+            "b_dag_id": dag_id,
+            "b_partition_bucket": int.from_bytes(md5(dag_id.encode("utf-8")).digest()[:8], "big")
+            % DAG_PARTITION_BUCKETS,
+        }
+        for (dag_id,) in conn.execute(sa.select(dag.c.dag_id))
+    ]
+    if buckets:
+        conn.execute(
+            dag.update()
+            .where(dag.c.dag_id == sa.bindparam("b_dag_id"))
+            .values(partition_bucket=sa.bindparam("b_partition_bucket")),
+            buckets,
+        )
+
+
+def downgrade():
+    """Drop partition_bucket column from dag table."""
+    with op.batch_alter_table("dag", schema=None) as batch_op:
+        batch_op.drop_index("idx_dag_partition_bucket")
+        batch_op.drop_column("partition_bucket")
@@ -515,17 +515,28 @@ class Connection(Base, LoggingMixin):
         # check cache first
         # enabled only if SecretCache.init() has been called first
         try:
-            uri = SecretCache.get_connection_uri(conn_id)
-            return Connection(conn_id=conn_id, uri=uri)
+            uri = SecretCache.get_connection_uri(conn_id, refresh=lambda: cls._get_uri_from_backends(conn_id))
         except SecretCache.NotPresentException:
             pass  # continue business
+        else:
+            if uri is None:
+                raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
+            return Connection(conn_id=conn_id, uri=uri)
+
+        conn = cls._get_connection_from_backends(conn_id)
+        # we save misses as well
+        SecretCache.save_connection_uri(conn_id, conn.get_uri() if conn else None)
+        if conn:
+            return conn
+        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
+    @classmethod
+    def _get_connection_from_backends(cls, conn_id: str) -> Connection | None:
         # iterate over backends if not in cache (or expired)
         for secrets_backend in ensure_secrets_loaded():
             try:
                 conn = secrets_backend.get_connection(conn_id=conn_id)
                 if conn:
-                    SecretCache.save_connection_uri(conn_id, conn.get_uri())
                     return conn
             except Exception:
                 log.exception(
@@ -533,8 +544,12 @@ class Connection(Base, LoggingMixin):
                     "Checking subsequent secrets backend.",
                     type(secrets_backend).__name__,
                 )
+        return None
 
-        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
+    @classmethod
+    def _get_uri_from_backends(cls, conn_id: str) -> str | None:
+        conn = cls._get_connection_from_backends(conn_id)
+        return conn.get_uri() if conn else None
 
     def to_dict(self, *, prune_empty: bool = False, validate: bool = True) -> dict[str, Any]:
         """
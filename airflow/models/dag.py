@@ -67,6 +67,7 @@ from sqlalchemy import (
     String,
     Text,
     and_,
+    bindparam,
     case,
     func,
     not_,
@@ -135,6 +136,7 @@ from airflow.utils import timezone
 from airflow.utils.dag_cycle_tester import check_cycle
 from airflow.utils.dates import cron_presets, date_range as utils_date_range
 from airflow.utils.decorators import fixup_decorator_warning_stack
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import at_most_one, exactly_one, validate_instance_args, validate_key
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -155,6 +157,7 @@ if TYPE_CHECKING:
     from pendulum.tz.timezone import FixedTimezone, Timezone
     from sqlalchemy.orm.query import Query
     from sqlalchemy.orm.session import Session
+    from sqlalchemy.sql.elements import ColumnElement
 
     from airflow.decorators import TaskDecoratorCollection
     from airflow.models.dagbag import DagBag
@@ -3217,6 +3220,48 @@ class DAG(LoggingMixin):
         )
         return cls.bulk_write_to_db(dags=dags, session=session)
 
+    def _get_metadata_hash(self, processor_subdir: str | None) -> str:
+        """
+        Return a hash of the DAG-level fields ``bulk_write_to_db`` stores in the database.
+
+        The next dagrun fields are left out, as they depend on the runs of the DAG.
+        """
+        from airflow.datasets import Dataset
+
+        owner_dag = self.parent_dag if self.is_subdag else self
+        outlets = sorted(
+            (task.task_id, "dataset", outlet.uri)
+            if isinstance(outlet, Dataset)
+            else (task.task_id, "dataset-alias", outlet.name)
+            for task in self.tasks
+            for outlet in task.outlets
+            if isinstance(outlet, (Dataset, DatasetAlias))
+        )
+        metadata = {
+            "is_subdag": self.is_subdag,
+            "fileloc": owner_dag.fileloc,  # type: ignore
+            "root_dag_id": owner_dag.dag_id,  # type: ignore
+            "owners": owner_dag.owner,  # type: ignore
+            "processor_subdir": processor_subdir,
+            "default_view": self.default_view,
+            "dag_display_name": self._dag_display_property_value,
+            "description": self.description,
+            "max_active_tasks": self.max_active_tasks,
+            "max_active_runs": self.max_active_runs,
+            "max_consecutive_failed_dag_runs": self.max_consecutive_failed_dag_runs,
+            "has_task_concurrency_limits": any(
+                t.max_active_tis_per_dag is not None or t.max_active_tis_per_dagrun is not None
+                for t in self.tasks
+            ),
+            "schedule_interval": self.schedule_interval,
+            "timetable_description": self.timetable.description,
+            "dataset_expression": self.timetable.dataset_condition.as_expression(),
+            "tags": sorted(self.tags or ()),
+            "owner_links": sorted(self.owner_links.items()),
+            "outlets": outlets,
+        }
+        return md5(json.dumps(metadata, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
     @classmethod
     @provide_session
     def bulk_write_to_db(
@@ -3230,6 +3275,10 @@ class DAG(LoggingMixin):
 
         Note that this method can be called for both DAGs and SubDAGs. A SubDag is actually a SubDagOperator.
 
+        The DAG-level fields, tags, owner links and dataset references are only written for the DAGs whose
+        metadata hash differs from the one stored at the last write; the other DAGs only get their parse
+        time and next dagrun fields updated.
+
         :param dags: the DAG objects to save to the DB
         :return: None
         """
@@ -3238,27 +3287,41 @@ class DAG(LoggingMixin):
 
         log.info("Sync %s DAGs", len(dags))
         dag_by_ids = {dag.dag_id: dag for dag in dags}
-
         dag_ids = set(dag_by_ids)
-        query = (
-            select(DagModel)
-            .options(joinedload(DagModel.tags, innerjoin=False))
-            .where(DagModel.dag_id.in_(dag_ids))
-            .options(joinedload(DagModel.schedule_dataset_references))
-            .options(joinedload(DagModel.schedule_dataset_alias_references))
-            .options(joinedload(DagModel.task_outlet_dataset_references))
-        )
+        metadata_hashes = {dag.dag_id: dag._get_metadata_hash(processor_subdir) for dag in dags}
+
+        # Lock the rows of all the dags, but only load the columns needed to find the unchanged ones
+        query = select(
+            DagModel.dag_id,
+            DagModel.metadata_hash,
+            DagModel.is_active,
+            DagModel.has_import_errors,
+            DagModel.next_dagrun,
+            DagModel.next_dagrun_data_interval_start,
+            DagModel.next_dagrun_data_interval_end,
+            DagModel.next_dagrun_create_after,
+        ).where(DagModel.dag_id.in_(dag_ids))
         query = with_row_locks(query, of=DagModel, session=session)
-        orm_dags: list[DagModel] = session.scalars(query).unique().all()
-        existing_dags: dict[str, DagModel] = {x.dag_id: x for x in orm_dags}
-        missing_dag_ids = dag_ids.difference(existing_dags.keys())
+        existing_rows = {row.dag_id: row for row in session.execute(query)}
+        unchanged_dag_ids = {
+            dag_id
+            for dag_id, row in existing_rows.items()
+            if row.metadata_hash == metadata_hashes[dag_id] and row.is_active and not row.has_import_errors
+        }
+        changed_dag_ids = dag_ids - unchanged_dag_ids
+
+        orm_dags: list[DagModel] = []
+        if changed_existing_dag_ids := changed_dag_ids.intersection(existing_rows):
+            orm_dags = session.scalars(
+                select(DagModel).where(DagModel.dag_id.in_(changed_existing_dag_ids))
+            ).all()
+        missing_dag_ids = dag_ids.difference(existing_rows)
 
         for missing_dag_id in missing_dag_ids:
             orm_dag = DagModel(dag_id=missing_dag_id)
             dag = dag_by_ids[missing_dag_id]
             if dag.is_paused_upon_creation is not None:
                 orm_dag.is_paused = dag.is_paused_upon_creation
-            orm_dag.tags = []
             log.info("Creating ORM DAG for %s", dag.dag_id)
             session.add(orm_dag)
             orm_dags.append(orm_dag)
@@ -3268,13 +3331,20 @@ class DAG(LoggingMixin):
         # Skip these queries entirely if no DAGs can be scheduled to save time.
         if any(dag.timetable.can_be_scheduled for dag in dags):
             # Get the latest automated dag run for each existing dag as a single query (avoid n+1 query)
-            query = cls._get_latest_runs_stmt(dags=list(existing_dags.keys()))
+            query = cls._get_latest_runs_stmt(dags=list(existing_rows))
             latest_runs = {run.dag_id: run for run in session.scalars(query)}
 
             # Get number of active dagruns for all dags we are processing as a single query.
-            num_active_runs = DagRun.active_runs_of_dags(dag_ids=existing_dags, session=session)
+            num_active_runs = DagRun.active_runs_of_dags(dag_ids=existing_rows, session=session)
+
+        def get_last_automated_data_interval(dag: DAG) -> DataInterval | None:
+            last_automated_run: DagRun | None = latest_runs.get(dag.dag_id)
+            if last_automated_run is None:
+                return None
+            return dag.get_run_data_interval(last_automated_run)
 
         filelocs = []
+        parsed_at = timezone.utcnow()
 
         for orm_dag in sorted(orm_dags, key=lambda d: d.dag_id):
             dag = dag_by_ids[orm_dag.dag_id]
@@ -3290,7 +3360,7 @@ class DAG(LoggingMixin):
                 orm_dag.owners = dag.owner
             orm_dag.is_active = True
             orm_dag.has_import_errors = False
-            orm_dag.last_parsed_time = timezone.utcnow()
+            orm_dag.last_parsed_time = parsed_at
             orm_dag.default_view = dag.default_view
             orm_dag._dag_display_property_value = dag._dag_display_property_value
             orm_dag.description = dag.description
@@ -3306,218 +3376,249 @@ class DAG(LoggingMixin):
             orm_dag.dataset_expression = dag.timetable.dataset_condition.as_expression()
 
             orm_dag.processor_subdir = processor_subdir
+            orm_dag.metadata_hash = metadata_hashes[dag.dag_id]
 
-            last_automated_run: DagRun | None = latest_runs.get(dag.dag_id)
-            if last_automated_run is None:
-                last_automated_data_interval = None
-            else:
-                last_automated_data_interval = dag.get_run_data_interval(last_automated_run)
             if num_active_runs.get(dag.dag_id, 0) >= orm_dag.max_active_runs:
                 orm_dag.next_dagrun_create_after = None
             else:
-                orm_dag.calculate_dagrun_date_fields(dag, last_automated_data_interval)
-
-            dag_tags = set(dag.tags or {})
-            orm_dag_tags = list(orm_dag.tags or [])
-            for orm_tag in orm_dag_tags:
-                if orm_tag.name not in dag_tags:
-                    session.delete(orm_tag)
-                    orm_dag.tags.remove(orm_tag)
-            orm_tag_names = {t.name for t in orm_dag_tags}
-            for dag_tag in dag_tags:
-                if dag_tag not in orm_tag_names:
-                    dag_tag_orm = DagTag(name=dag_tag, dag_id=dag.dag_id)
-                    orm_dag.tags.append(dag_tag_orm)
-                    session.add(dag_tag_orm)
-
-            orm_dag_links = orm_dag.dag_owner_links or []
-            for orm_dag_link in orm_dag_links:
-                if orm_dag_link not in dag.owner_links:
-                    session.delete(orm_dag_link)
-            for owner_name, owner_link in dag.owner_links.items():
-                dag_owner_orm = DagOwnerAttributes(dag_id=dag.dag_id, owner=owner_name, link=owner_link)
-                session.add(dag_owner_orm)
+                orm_dag.calculate_dagrun_date_fields(dag, get_last_automated_data_interval(dag))
+
+        if unchanged_dag_ids:
+            session.execute(
+                update(DagModel)
+                .where(DagModel.dag_id.in_(unchanged_dag_ids))
+                .values(last_parsed_time=parsed_at)
+                .execution_options(synchronize_session=False)
+            )
+
+        # Only write the next dagrun fields of the unchanged dags which moved
+        next_dagrun_updates = []
+        for dag_id in sorted(unchanged_dag_ids):
+            dag = dag_by_ids[dag_id]
+            filelocs.append(dag.fileloc)
+            row = existing_rows[dag_id]
+            stored_fields = (
+                row.next_dagrun,
+                row.next_dagrun_data_interval_start,
+                row.next_dagrun_data_interval_end,
+                row.next_dagrun_create_after,
+            )
+            if num_active_runs.get(dag_id, 0) >= dag.max_active_runs:
+                next_dagrun_fields = (*stored_fields[:3], None)
+            elif (next_dagrun_info := dag.next_dagrun_info(get_last_automated_data_interval(dag))) is None:
+                next_dagrun_fields = (None, None, None, None)
+            else:
+                next_dagrun_fields = (
+                    next_dagrun_info.logical_date,
+                    next_dagrun_info.data_interval.start,
+                    next_dagrun_info.data_interval.end,
+                    next_dagrun_info.run_after,
+                )
+            if next_dagrun_fields == stored_fields:
+                continue
+            log.info(
+                "Setting next_dagrun for %s to %s, run_after=%s",
+                dag_id,
+                next_dagrun_fields[0],
+                next_dagrun_fields[3],
+            )
+            next_dagrun_updates.append(
+                {
+                    "b_dag_id": dag_id,
+                    "b_next_dagrun": next_dagrun_fields[0],
+                    "b_next_dagrun_data_interval_start": next_dagrun_fields[1],
+                    "b_next_dagrun_data_interval_end": next_dagrun_fields[2],
+                    "b_next_dagrun_create_after": next_dagrun_fields[3],
+                }
+            )
+        if next_dagrun_updates:
+            dag_table = DagModel.__table__
+            session.execute(
+                dag_table.update()
+                .where(dag_table.c.dag_id == bindparam("b_dag_id"))
+                .values(
+                    next_dagrun=bindparam("b_next_dagrun"),
+                    next_dagrun_data_interval_start=bindparam("b_next_dagrun_data_interval_start"),
+                    next_dagrun_data_interval_end=bindparam("b_next_dagrun_data_interval_end"),
+                    next_dagrun_create_after=bindparam("b_next_dagrun_create_after"),
+                ),
+                next_dagrun_updates,
+            )
 
         DagCode.bulk_sync_to_db(filelocs, session=session)
 
+        changed_dags = [dag_by_ids[dag_id] for dag_id in sorted(changed_dag_ids)]
+        if changed_dags:
+            # The rows referenced by the tags, owner links and dataset references must exist first
+            session.flush()
+            cls._sync_dag_tags_and_owner_links(changed_dags, session=session)
+            cls._sync_dataset_references(changed_dags, session=session)
+            # The relationships of these dags were written without the ORM, reload them on access
+            for orm_dag in orm_dags:
+                session.expire(
+                    orm_dag,
+                    [
+                        "tags",
+                        "dag_owner_links",
+                        "schedule_dataset_references",
+                        "schedule_dataset_alias_references",
+                        "task_outlet_dataset_references",
+                    ],
+                )
+
+        # Issue SQL/finish "Unit of Work", but let @provide_session commit (or if passed a session, let caller
+        # decide when to commit
+        session.flush()
+
+        for dag in dags:
+            cls.bulk_write_to_db(dag.subdags, processor_subdir=processor_subdir, session=session)
+
+    @staticmethod
+    def _sync_rows(
+        table,
+        columns: tuple[str, ...],
+        dag_ids: Collection[str],
+        needed: set[tuple],
+        session: Session,
+    ) -> set[tuple]:
+        """
+        Make the rows of ``table`` for ``dag_ids`` be exactly ``needed``, with one delete and one insert.
+
+        :param columns: Names of the columns of the tuples in ``needed``, starting with ``dag_id``
+        :return: The tuples which were deleted
+        """
+        table_columns = tuple(table.c[name] for name in columns)
+        stored = {
+            tuple(row) for row in session.execute(select(*table_columns).where(table.c.dag_id.in_(dag_ids)))
+        }
+        to_delete = stored - needed
+        if to_delete:
+            session.execute(table.delete().where(tuple_in_condition(table_columns, to_delete)))
+        if to_insert := needed - stored:
+            session.execute(table.insert(), [dict(zip(columns, values)) for values in to_insert])
+        return to_delete
+
+    @classmethod
+    def _sync_dag_tags_and_owner_links(cls, dags: Collection[DAG], session: Session) -> None:
+        """Write the tags and owner links of the given dags."""
+        dag_ids = [dag.dag_id for dag in dags]
+        cls._sync_rows(
+            DagTag.__table__,
+            ("dag_id", "name"),
+            dag_ids,
+            {(dag.dag_id, tag) for dag in dags for tag in dag.tags or ()},
+            session=session,
+        )
+        cls._sync_rows(
+            DagOwnerAttributes.__table__,
+            ("dag_id", "owner", "link"),
+            dag_ids,
+            {(dag.dag_id, owner, link) for dag in dags for owner, link in dag.owner_links.items()},
+            session=session,
+        )
+
+    @classmethod
+    def _sync_dataset_references(cls, dags: Collection[DAG], session: Session) -> None:
+        """Create the datasets and dataset aliases the given dags use, and write their references."""
         from airflow.datasets import Dataset
         from airflow.models.dataset import (
             DagScheduleDatasetAliasReference,
             DagScheduleDatasetReference,
+            DatasetDagRunQueue,
             DatasetModel,
             TaskOutletDatasetReference,
         )
 
-        dag_references: dict[str, set[tuple[Literal["dataset", "dataset-alias"], str]]] = defaultdict(set)
-        outlet_references = defaultdict(set)
+        schedule_dataset_refs: set[tuple[str, str]] = set()
+        schedule_alias_refs: set[tuple[str, str]] = set()
+        outlet_refs: set[tuple[str, str, str]] = set()
         # We can't use a set here as we want to preserve order
-        outlet_dataset_models: dict[DatasetModel, None] = {}
-        input_dataset_models: dict[DatasetModel, None] = {}
-        outlet_dataset_alias_models: set[DatasetAliasModel] = set()
-        input_dataset_alias_models: set[DatasetAliasModel] = set()
-
-        # here we go through dags and tasks to check for dataset references
-        # if there are now None and previously there were some, we delete them
-        # if there are now *any*, we add them to the above data structures, and
-        # later we'll persist them to the database.
+        dataset_models: dict[str, DatasetModel] = {}
+        dataset_alias_models: dict[str, DatasetAliasModel] = {}
+
         for dag in dags:
-            curr_orm_dag = existing_dags.get(dag.dag_id)
-            if not (dataset_condition := dag.timetable.dataset_condition):
-                if curr_orm_dag:
-                    if curr_orm_dag.schedule_dataset_references:
-                        curr_orm_dag.schedule_dataset_references = []
-                    if curr_orm_dag.schedule_dataset_alias_references:
-                        curr_orm_dag.schedule_dataset_alias_references = []
-            else:
+            if dataset_condition := dag.timetable.dataset_condition:
                 for _, dataset in dataset_condition.iter_datasets():
-                    dag_references[dag.dag_id].add(("dataset", dataset.uri))
-                    input_dataset_models[DatasetModel.from_public(dataset)] = None
-
+                    schedule_dataset_refs.add((dag.dag_id, dataset.uri))
+                    dataset_models.setdefault(dataset.uri, DatasetModel.from_public(dataset))
                 for dataset_alias in dataset_condition.iter_dataset_aliases():
-                    dag_references[dag.dag_id].add(("dataset-alias", dataset_alias.name))
-                    input_dataset_alias_models.add(DatasetAliasModel.from_public(dataset_alias))
-
-            curr_outlet_references = curr_orm_dag and curr_orm_dag.task_outlet_dataset_references
+                    schedule_alias_refs.add((dag.dag_id, dataset_alias.name))
+                    dataset_alias_models.setdefault(
+                        dataset_alias.name, DatasetAliasModel.from_public(dataset_alias)
+                    )
             for task in dag.tasks:
-                dataset_outlets: list[Dataset] = []
-                dataset_alias_outlets: set[DatasetAlias] = set()
                 for outlet in task.outlets:
                     if isinstance(outlet, Dataset):
-                        dataset_outlets.append(outlet)
+                        outlet_refs.add((dag.dag_id, task.task_id, outlet.uri))
+                        dataset_models.setdefault(outlet.uri, DatasetModel.from_public(outlet))
                     elif isinstance(outlet, DatasetAlias):
-                        dataset_alias_outlets.add(outlet)
-
-                if not dataset_outlets:
-                    if curr_outlet_references:
-                        this_task_outlet_refs = [
-                            x
-                            for x in curr_outlet_references
-                            if x.dag_id == dag.dag_id and x.task_id == task.task_id
-                        ]
-                        for ref in this_task_outlet_refs:
-                            curr_outlet_references.remove(ref)
-
-                for d in dataset_outlets:
-                    outlet_dataset_models[DatasetModel.from_public(d)] = None
-                    outlet_references[(task.dag_id, task.task_id)].add(d.uri)
-
-                for d_a in dataset_alias_outlets:
-                    outlet_dataset_alias_models.add(DatasetAliasModel.from_public(d_a))
-
-        all_dataset_models = outlet_dataset_models
-        all_dataset_models.update(input_dataset_models)
+                        dataset_alias_models.setdefault(outlet.name, DatasetAliasModel.from_public(outlet))
 
         # store datasets
-        stored_dataset_models: dict[str, DatasetModel] = {}
-        new_dataset_models: list[DatasetModel] = []
-        for dataset in all_dataset_models:
-            stored_dataset_model = session.scalar(
-                select(DatasetModel).where(DatasetModel.uri == dataset.uri).limit(1)
-            )
-            if stored_dataset_model:
+        dataset_ids: dict[str, int] = {}
+        if dataset_models:
+            for stored_dataset_model in session.scalars(
+                select(DatasetModel).where(DatasetModel.uri.in_(dataset_models))
+            ):
                 # Some datasets may have been previously unreferenced, and therefore orphaned by the
                 # scheduler. But if we're here, then we have found that dataset again in our DAGs, which
                 # means that it is no longer an orphan, so set is_orphaned to False.
-                stored_dataset_model.is_orphaned = expression.false()
-                stored_dataset_models[stored_dataset_model.uri] = stored_dataset_model
-            else:
-                new_dataset_models.append(dataset)
-        dataset_manager.create_datasets(dataset_models=new_dataset_models, session=session)
-        stored_dataset_models.update(
-            {dataset_model.uri: dataset_model for dataset_model in new_dataset_models}
-        )
-
-        del new_dataset_models
-        del all_dataset_models
+                if stored_dataset_model.is_orphaned:
+                    stored_dataset_model.is_orphaned = expression.false()
+                dataset_ids[stored_dataset_model.uri] = stored_dataset_model.id
+            new_dataset_models = [model for uri, model in dataset_models.items() if uri not in dataset_ids]
+            dataset_manager.create_datasets(dataset_models=new_dataset_models, session=session)
+            dataset_ids.update({dataset_model.uri: dataset_model.id for dataset_model in new_dataset_models})
 
         # store dataset aliases
-        all_datasets_alias_models = input_dataset_alias_models | outlet_dataset_alias_models
-        stored_dataset_alias_models: dict[str, DatasetAliasModel] = {}
-        new_dataset_alias_models: set[DatasetAliasModel] = set()
-        if all_datasets_alias_models:
-            all_dataset_alias_names = {
-                dataset_alias_model.name for dataset_alias_model in all_datasets_alias_models
-            }
-
-            stored_dataset_alias_models = {
-                dsa_m.name: dsa_m
-                for dsa_m in session.scalars(
-                    select(DatasetAliasModel).where(DatasetAliasModel.name.in_(all_dataset_alias_names))
-                ).fetchall()
-            }
-
-            if stored_dataset_alias_models:
-                new_dataset_alias_models = {
-                    dataset_alias_model
-                    for dataset_alias_model in all_datasets_alias_models
-                    if dataset_alias_model.name not in stored_dataset_alias_models.keys()
-                }
-            else:
-                new_dataset_alias_models = all_datasets_alias_models
-
+        dataset_alias_ids: dict[str, int] = {}
+        if dataset_alias_models:
+            dataset_alias_ids = dict(
+                session.execute(
+                    select(DatasetAliasModel.name, DatasetAliasModel.id).where(
+                        DatasetAliasModel.name.in_(dataset_alias_models)
+                    )
+                ).all()
+            )
+            new_dataset_alias_models = [
+                model for name, model in dataset_alias_models.items() if name not in dataset_alias_ids
+            ]
             session.add_all(new_dataset_alias_models)
-        session.flush()
-        stored_dataset_alias_models.update(
-            {
-                dataset_alias_model.name: dataset_alias_model
-                for dataset_alias_model in new_dataset_alias_models
-            }
+            session.flush()
+            dataset_alias_ids.update({model.name: model.id for model in new_dataset_alias_models})
+
+        # reconcile dag-schedule-on-dataset, dag-schedule-on-dataset-alias and task-outlet-dataset references
+        dag_ids = [dag.dag_id for dag in dags]
+        deleted_schedule_dataset_refs = cls._sync_rows(
+            DagScheduleDatasetReference.__table__,
+            ("dag_id", "dataset_id"),
+            dag_ids,
+            {(dag_id, dataset_ids[uri]) for dag_id, uri in schedule_dataset_refs},
+            session=session,
         )
-
-        del new_dataset_alias_models
-        del all_datasets_alias_models
-
-        # reconcile dag-schedule-on-dataset and dag-schedule-on-dataset-alias references
-        for dag_id, base_dataset_list in dag_references.items():
-            dag_refs_needed = {
-                DagScheduleDatasetReference(
-                    dataset_id=stored_dataset_models[base_dataset_identifier].id, dag_id=dag_id
-                )
-                if base_dataset_type == "dataset"
-                else DagScheduleDatasetAliasReference(
-                    alias_id=stored_dataset_alias_models[base_dataset_identifier].id, dag_id=dag_id
+        if deleted_schedule_dataset_refs:
+            queue_table = DatasetDagRunQueue.__table__
+            session.execute(
+                queue_table.delete().where(
+                    tuple_in_condition(
+                        (queue_table.c.target_dag_id, queue_table.c.dataset_id), deleted_schedule_dataset_refs
+                    )
                 )
-                for base_dataset_type, base_dataset_identifier in base_dataset_list
-            }
-
-            # if isinstance(base_dataset, Dataset)
-
-            dag_refs_stored = (
-                set(existing_dags.get(dag_id).schedule_dataset_references)  # type: ignore
-                | set(existing_dags.get(dag_id).schedule_dataset_alias_references)  # type: ignore
-                if existing_dags.get(dag_id)
-                else set()
             )
-            dag_refs_to_add = dag_refs_needed - dag_refs_stored
-            session.bulk_save_objects(dag_refs_to_add)
-            for obj in dag_refs_stored - dag_refs_needed:
-                session.delete(obj)
-
-        existing_task_outlet_refs_dict = defaultdict(set)
-        for dag_id, orm_dag in existing_dags.items():
-            for todr in orm_dag.task_outlet_dataset_references:
-                existing_task_outlet_refs_dict[(dag_id, todr.task_id)].add(todr)
-
-        # reconcile task-outlet-dataset references
-        for (dag_id, task_id), uri_list in outlet_references.items():
-            task_refs_needed = {
-                TaskOutletDatasetReference(
-                    dataset_id=stored_dataset_models[uri].id, dag_id=dag_id, task_id=task_id
-                )
-                for uri in uri_list
-            }
-            task_refs_stored = existing_task_outlet_refs_dict[(dag_id, task_id)]
-            task_refs_to_add = {x for x in task_refs_needed if x not in task_refs_stored}
-            session.bulk_save_objects(task_refs_to_add)
-            for obj in task_refs_stored - task_refs_needed:
-                session.delete(obj)
-
-        # Issue SQL/finish "Unit of Work", but let @provide_session commit (or if passed a session, let caller
-        # decide when to commit
-        session.flush()
-
-        for dag in dags:
-            cls.bulk_write_to_db(dag.subdags, processor_subdir=processor_subdir, session=session)
+        cls._sync_rows(
+            DagScheduleDatasetAliasReference.__table__,
+            ("dag_id", "alias_id"),
+            dag_ids,
+            {(dag_id, dataset_alias_ids[name]) for dag_id, name in schedule_alias_refs},
+            session=session,
+        )
+        cls._sync_rows(
+            TaskOutletDatasetReference.__table__,
+            ("dag_id", "task_id", "dataset_id"),
+            dag_ids,
+            {(dag_id, task_id, dataset_ids[uri]) for dag_id, task_id, uri in outlet_refs},
+            session=session,
+        )
 
     @classmethod
     def _get_latest_runs_stmt(cls, dags: list[str]) -> Select:
@@ -3742,6 +3843,19 @@ class DAG(LoggingMixin):
                 yield owner, link
 
 
+DAG_PARTITION_BUCKETS = 256
+"""Number of buckets the DAGs are hashed into to split them between schedulers."""
+
+
+def dag_partition_bucket(dag_id: str) -> int:
+    """Return the bucket ``dag_id`` hashes into, stored in :attr:`DagModel.partition_bucket`."""
+    return int.from_bytes(md5(dag_id.encode("utf-8")).digest()[:8], "big") % DAG_PARTITION_BUCKETS
+
+
+def _default_partition_bucket(context) -> int:
+    return dag_partition_bucket(context.get_current_parameters()["dag_id"])
+
+
 class DagTag(Base):
     """A tag name per dag, to allow quick filtering in the DAG view."""
 
@@ -3849,6 +3963,10 @@ class DagModel(Base):
 
     has_task_concurrency_limits = Column(Boolean, nullable=False)
     has_import_errors = Column(Boolean(), default=False, server_default="0")
+    # Hash of the DAG-level fields written by ``DAG.bulk_write_to_db``, to skip the DAGs that did not change
+    metadata_hash = Column(String(32), nullable=True)
+    # Bucket the DAG is hashed into, by which ``[scheduler] partition_dags_by_scheduler`` splits the DAGs
+    partition_bucket = Column(Integer, nullable=True, default=_default_partition_bucket)
 
     # The logical date of the next dag run.
     next_dagrun = Column(UtcDateTime)
@@ -3863,6 +3981,7 @@ class DagModel(Base):
     __table_args__ = (
         Index("idx_root_dag_id", root_dag_id, unique=False),
         Index("idx_next_dagrun_create_after", next_dagrun_create_after, unique=False),
+        Index("idx_dag_partition_bucket", partition_bucket, unique=False),
     )
 
     parent_dag = relationship(
@@ -4062,13 +4181,29 @@ class DagModel(Base):
                 dag_model.is_active = False
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
+    def partition_filter(cls, partition_buckets: Collection[int]) -> ColumnElement[bool]:
+        """
+        Return the criterion selecting the DAGs in the given partition buckets.
+
+        DAGs with no bucket stored, e.g. written by an older version, are in bucket 0.
+        """
+        criterion = cls.partition_bucket.in_(partition_buckets)
+        if 0 in partition_buckets:
+            criterion = or_(criterion, cls.partition_bucket.is_(None))
+        return criterion
+
+    @classmethod
+    def dags_needing_dagruns(
+        cls, session: Session, partition_buckets: Collection[int] | None = None
+    ) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
         This will return a resultset of rows that is row-level-locked with a "SELECT ... FOR UPDATE" query,
         you should ensure that any scheduling decisions are made in a single transaction -- as soon as the
         transaction is committed it will be unlocked.
+
+        :param partition_buckets: If given, only consider the DAGs in these partition buckets
         """
         from airflow.models.serialized_dag import SerializedDagModel
 
@@ -4083,7 +4218,14 @@ class DagModel(Base):
                 return None
 
         # this loads all the DDRQ records.... may need to limit num dags
-        all_records = session.scalars(select(DatasetDagRunQueue)).all()
+        ddrq_query = select(DatasetDagRunQueue)
+        if partition_buckets is not None:
+            ddrq_query = ddrq_query.where(
+                DatasetDagRunQueue.target_dag_id.in_(
+                    select(cls.dag_id).where(cls.partition_filter(partition_buckets))
+                )
+            )
+        all_records = session.scalars(ddrq_query).all()
         by_dag = defaultdict(list)
         for r in all_records:
             by_dag[r.target_dag_id].append(r)
@@ -4140,6 +4282,8 @@ class DagModel(Base):
             .order_by(cls.next_dagrun_create_after)
             .limit(cls.NUM_DAGS_PER_DAGRUN_QUERY)
         )
+        if partition_buckets is not None:
+            query = query.where(cls.partition_filter(partition_buckets))
 
         return (
             session.scalars(with_row_locks(query, of=cls, session=session, skip_locked=True)),
@@ -166,6 +166,15 @@ class DagBag(LoggingMixin):
         self.dags_last_fetched: dict[str, datetime] = {}
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: dict[str, str] = {}
+        # Only used by read_dags_from_db=True, to find the changed DAGs from the serialized_dag_change table
+        self.use_dag_change_feed = read_dags_from_db and conf.getboolean("core", "serialized_dag_change_feed")
+        self._dag_changes_read_at: datetime | None = None
+        self._dag_hashes_compared_at: datetime | None = None
+        # All the changes up to this id were read
+        self._dag_change_id = 0
+        # The changes read after _dag_change_id, which may still have gaps
+        self._read_dag_change_ids: set[int] = set()
+        self._changed_dag_ids: set[str] = set()
 
         self.dagbag_import_error_tracebacks = conf.getboolean("core", "dagbag_import_error_tracebacks")
         self.dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
@@ -216,11 +225,27 @@ class DagBag(LoggingMixin):
             # Import here so that serialized dag is only imported when serialization is enabled
             from airflow.models.serialized_dag import SerializedDagModel
 
+            if self.use_dag_change_feed:
+                self._read_dag_changes(session=session)
+
             if dag_id not in self.dags:
                 # Load from DB if not (yet) in the bag
                 self._add_dag_from_db(dag_id=dag_id, session=session)
                 return self.dags.get(dag_id)
 
+            if self.use_dag_change_feed:
+                if (
+                    dag_id in self._changed_dag_ids
+                    and self._add_dag_from_db(dag_id=dag_id, session=session) is None
+                ):
+                    self.log.warning("Serialized DAG %s no longer exists", dag_id)
+                    self._changed_dag_ids.discard(dag_id)
+                    del self.dags[dag_id]
+                    self.dags_last_fetched.pop(dag_id, None)
+                    self.dags_hash.pop(dag_id, None)
+                    return None
+                return self.dags.get(dag_id)
+
             # If DAG is in the DagBag, check the following
             # 1. if time has come to check if DAG is updated (controlled by min_serialized_dag_fetch_secs)
             # 2. check the last_updated and hash columns in SerializedDag table to see if
@@ -291,7 +316,63 @@ class DagBag(LoggingMixin):
                 del self.dags[dag_id]
         return self.dags.get(dag_id)
 
-    def _add_dag_from_db(self, dag_id: str, session: Session):
+    def _read_dag_changes(self, session: Session) -> None:
+        """
+        Find the DAGs of the bag whose serialized version changed, from the ``serialized_dag_change`` table.
+
+        This replaces checking each DAG every ``[core] min_serialized_dag_fetch_interval`` with a single
+        query for all of them, which only returns the changes made since the previous one. The hashes of
+        all the DAGs are still compared every ``DAG_CHANGE_RETENTION - DAG_CHANGE_SETTLE_TIME``, to catch
+        the changes committed too long after they were recorded to be read from the feed.
+        """
+        from airflow.models.serialized_dag import (
+            DAG_CHANGE_RETENTION,
+            DAG_CHANGE_SETTLE_TIME,
+            SerializedDagChange,
+            SerializedDagModel,
+        )
+
+        now = timezone.utcnow()
+        read_at = self._dag_changes_read_at
+        if read_at and now < read_at + timedelta(seconds=settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL):
+            return
+        self._dag_changes_read_at = now
+
+        compared_at = self._dag_hashes_compared_at
+        if not compared_at or now > compared_at + DAG_CHANGE_RETENTION - DAG_CHANGE_SETTLE_TIME:
+            # Changes may have been deleted since the last read, or missed: compare the hashes of all the
+            # DAGs instead
+            self._dag_hashes_compared_at = now
+            self._dag_change_id = SerializedDagChange.get_settled_id(session=session)
+            self._read_dag_change_ids.clear()
+            if self.dags_hash:
+                dag_hashes = SerializedDagModel.get_dag_hashes(session=session)
+                self._changed_dag_ids.update(
+                    dag_id
+                    for dag_id, dag_hash in self.dags_hash.items()
+                    if dag_hashes.get(dag_id) != dag_hash
+                )
+            return
+
+        settled = True
+        for change_id, dag_id, dag_hash, change_settled in SerializedDagChange.get_changes_since(
+            self._dag_change_id, session=session
+        ):
+            # Changes with a lower id may still be committed after recent ones, so they are read again
+            # until they settle
+            settled = settled and bool(change_settled)
+            if settled:
+                self._dag_change_id = change_id
+            if change_id in self._read_dag_change_ids:
+                continue
+            self._read_dag_change_ids.add(change_id)
+            if dag_id in self.dags_hash and dag_hash != self.dags_hash[dag_id]:
+                self._changed_dag_ids.add(dag_id)
+        self._read_dag_change_ids = {
+            change_id for change_id in self._read_dag_change_ids if change_id > self._dag_change_id
+        }
+
+    def _add_dag_from_db(self, dag_id: str, session: Session) -> DAG | None:
         """Add DAG to DagBag from DB."""
         from airflow.models.serialized_dag import SerializedDagModel
 
@@ -306,6 +387,8 @@ class DagBag(LoggingMixin):
         self.dags[dag.dag_id] = dag
         self.dags_last_fetched[dag.dag_id] = timezone.utcnow()
         self.dags_hash[dag.dag_id] = row.dag_hash
+        self._changed_dag_ids.discard(dag.dag_id)
+        return dag
 
     def process_file(self, filepath, only_if_updated=True, safe_mode=True):
         """Given a path to a python module or zip file, import the module and look for dag objects within."""
@@ -21,7 +21,18 @@ import itertools
 import os
 import warnings
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, Sequence, TypeVar, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
 import re2
 from sqlalchemy import (
@@ -158,6 +169,10 @@ class DagRun(Base, LoggingMixin):
     else:
         dag: DAG | None = None
 
+    # Task instances bulk-loaded by ``prefetch_task_instances``. They are consumed by the next call to
+    # ``task_instance_scheduling_decisions`` instead of querying the TIs of this run again.
+    _prefetched_tis: list[TI] | None = None
+
     __table_args__ = (
         Index("dag_id_state", dag_id, _state),
         UniqueConstraint("dag_id", "execution_date", name="dag_run_dag_id_execution_date_key"),
@@ -204,6 +219,12 @@ class DagRun(Base, LoggingMixin):
         fallback=20,
     )
 
+    PRECOMPUTE_UPSTREAM_STATES = airflow_conf.getboolean(
+        "scheduler",
+        "precompute_upstream_states",
+        fallback=True,
+    )
+
     def __init__(
         self,
         dag_id: str | None = None,
@@ -389,6 +410,7 @@ class DagRun(Base, LoggingMixin):
         state: DagRunState,
         session: Session,
         max_number: int | None = None,
+        partition_buckets: Collection[int] | None = None,
     ) -> Query:
         """
         Return the next DagRuns that the scheduler should attempt to schedule.
@@ -397,6 +419,7 @@ class DagRun(Base, LoggingMixin):
         query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
         the transaction is committed it will be unlocked.
 
+        :param partition_buckets: If given, only consider runs of the DAGs in these partition buckets
         """
         from airflow.models.dag import DagModel
 
@@ -411,6 +434,8 @@ class DagRun(Base, LoggingMixin):
             .join(DagModel, DagModel.dag_id == cls.dag_id)
             .where(DagModel.is_paused == false(), DagModel.is_active == true())
         )
+        if partition_buckets is not None:
+            query = query.where(DagModel.partition_filter(partition_buckets))
         if state == DagRunState.QUEUED:
             # For dag runs in the queued state, we check if they have reached the max_active_runs limit
             # and if so we drop them
@@ -435,6 +460,32 @@ class DagRun(Base, LoggingMixin):
             with_row_locks(query.limit(max_number), of=cls, session=session, skip_locked=True)
         )
 
+    @classmethod
+    def prefetch_task_instances(cls, dag_runs: Iterable[DagRun], session: Session) -> None:
+        """
+        Load the task instances of all given dag runs with a single query.
+
+        The TIs are attached to their dag run and used (once) by the next call to
+        :meth:`task_instance_scheduling_decisions`, which saves one query per dag run when the
+        scheduler examines many runs in the same loop.
+
+        :param dag_runs: The dag runs to load task instances for
+        :param session: SQLAlchemy ORM Session
+        """
+        runs_by_key = {(dr.dag_id, dr.run_id): dr for dr in dag_runs}
+        if not runs_by_key:
+            return
+        tis_by_run: dict[tuple[str, str], list[TI]] = defaultdict(list)
+        tis = session.scalars(
+            select(TI)
+            .options(joinedload(TI.dag_run))
+            .where(tuple_in_condition((TI.dag_id, TI.run_id), list(runs_by_key)))
+        )
+        for ti in tis:
+            tis_by_run[(ti.dag_id, ti.run_id)].append(ti)
+        for key, dag_run in runs_by_key.items():
+            dag_run._prefetched_tis = tis_by_run[key]
+
     @classmethod
     @provide_session
     def find(
@@ -964,7 +1015,13 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def task_instance_scheduling_decisions(self, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+        if self._prefetched_tis is not None:
+            tis, self._prefetched_tis = self._prefetched_tis, None
+            task_ids = DagRun._get_partial_task_ids(self.dag)
+            if task_ids is not None:
+                tis = [ti for ti in tis if ti.task_id in task_ids]
+        else:
+            tis = self.get_task_instances(session=session, state=State.task_states)
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: DAG, tis: list[TI]) -> Iterable[TI]:
@@ -1043,6 +1100,7 @@ class DagRun(Base, LoggingMixin):
             flag_upstream_failed=True,
             ignore_unmapped_tasks=True,  # Ignore this Dep, as we will expand it if we can.
             finished_tis=finished_tis,
+            precompute_upstream_states=self.PRECOMPUTE_UPSTREAM_STATES,
         )
 
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
@@ -1128,6 +1186,7 @@ class DagRun(Base, LoggingMixin):
             ignore_in_retry_period=True,
             ignore_in_reschedule_period=True,
             finished_tis=finished_tis,
+            precompute_upstream_states=self.PRECOMPUTE_UPSTREAM_STATES,
         )
         # there might be runnable tasks that are up for retry and for some reason(retry delay, etc.) are
         # not ready yet, so we set the flags to count them in
@@ -1563,37 +1622,7 @@ class DagRun(Base, LoggingMixin):
         All the TIs should belong to this DagRun, but this code is in the hot-path, this is not checked -- it
         is the caller's responsibility to call this function only with TIs from a single dag run.
         """
-        # Get list of TI IDs that do not need to executed, these are
-        # tasks using EmptyOperator and without on_execute_callback / on_success_callback
-        dummy_ti_ids = []
-        schedulable_ti_ids = []
-        for ti in schedulable_tis:
-            if TYPE_CHECKING:
-                assert ti.task
-            if (
-                ti.task.inherits_from_empty_operator
-                and not ti.task.on_execute_callback
-                and not ti.task.on_success_callback
-                and not ti.task.outlets
-            ):
-                dummy_ti_ids.append((ti.task_id, ti.map_index))
-            # check "start_trigger_args" to see whether the operator supports start execution from triggerer
-            # if so, we'll then check "start_from_trigger" to see whether this feature is turned on and defer
-            # this task.
-            # if not, we'll add this "ti" into "schedulable_ti_ids" and later execute it to run in the worker
-            elif ti.task.start_trigger_args is not None:
-                context = ti.get_template_context()
-                start_from_trigger = ti.task.expand_start_from_trigger(context=context, session=session)
-
-                if start_from_trigger:
-                    ti.start_date = timezone.utcnow()
-                    if ti.state != TaskInstanceState.UP_FOR_RESCHEDULE:
-                        ti.try_number += 1
-                    ti.defer_task(exception=None, session=session)
-                else:
-                    schedulable_ti_ids.append((ti.task_id, ti.map_index))
-            else:
-                schedulable_ti_ids.append((ti.task_id, ti.map_index))
+        schedulable_ti_ids, dummy_ti_ids = DagRun._partition_schedulable_tis(schedulable_tis, session)
 
         count = 0
 
@@ -1607,18 +1636,12 @@ class DagRun(Base, LoggingMixin):
                     .where(
                         TI.dag_id == self.dag_id,
                         TI.run_id == self.run_id,
-                        tuple_in_condition((TI.task_id, TI.map_index), schedulable_ti_ids_chunk),
-                    )
-                    .values(
-                        state=TaskInstanceState.SCHEDULED,
-                        try_number=case(
-                            (
-                                or_(TI.state.is_(None), TI.state != TaskInstanceState.UP_FOR_RESCHEDULE),
-                                TI.try_number + 1,
-                            ),
-                            else_=TI.try_number,
+                        tuple_in_condition(
+                            (TI.task_id, TI.map_index),
+                            ((task_id, map_index) for _, _, task_id, map_index in schedulable_ti_ids_chunk),
                         ),
                     )
+                    .values(**DagRun._scheduled_ti_values())
                     .execution_options(synchronize_session=False)
                 ).rowcount
 
@@ -1631,15 +1654,12 @@ class DagRun(Base, LoggingMixin):
                     .where(
                         TI.dag_id == self.dag_id,
                         TI.run_id == self.run_id,
-                        tuple_in_condition((TI.task_id, TI.map_index), dummy_ti_ids_chunk),
-                    )
-                    .values(
-                        state=TaskInstanceState.SUCCESS,
-                        start_date=timezone.utcnow(),
-                        end_date=timezone.utcnow(),
-                        duration=0,
-                        try_number=TI.try_number + 1,
+                        tuple_in_condition(
+                            (TI.task_id, TI.map_index),
+                            ((task_id, map_index) for _, _, task_id, map_index in dummy_ti_ids_chunk),
+                        ),
                     )
+                    .values(**DagRun._dummy_ti_values())
                     .execution_options(
                         synchronize_session=False,
                     )
@@ -1647,6 +1667,106 @@ class DagRun(Base, LoggingMixin):
 
         return count
 
+    @staticmethod
+    @provide_session
+    def bulk_schedule_tis(
+        schedulable_tis: Iterable[TI],
+        session: Session = NEW_SESSION,
+        max_tis_per_query: int | None = None,
+    ) -> int:
+        """
+        Set the given task instances, which may belong to any number of dag runs, in to the scheduled state.
+
+        This behaves like :meth:`schedule_tis`, but issues one UPDATE per chunk of ``max_tis_per_query``
+        TIs for all dag runs together instead of one per dag run.
+        """
+        schedulable_ti_ids, dummy_ti_ids = DagRun._partition_schedulable_tis(schedulable_tis, session)
+        key_columns = (TI.dag_id, TI.run_id, TI.task_id, TI.map_index)
+
+        count = 0
+        for ti_ids, values in (
+            (schedulable_ti_ids, DagRun._scheduled_ti_values()),
+            (dummy_ti_ids, DagRun._dummy_ti_values()),
+        ):
+            if not ti_ids:
+                continue
+            for ti_ids_chunk in chunks(ti_ids, max_tis_per_query or len(ti_ids)):
+                count += session.execute(
+                    update(TI)
+                    .where(tuple_in_condition(key_columns, ti_ids_chunk))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+        return count
+
+    @staticmethod
+    def _partition_schedulable_tis(
+        schedulable_tis: Iterable[TI], session: Session
+    ) -> tuple[list[tuple[str, str, str, int]], list[tuple[str, str, str, int]]]:
+        """
+        Split TIs about to be scheduled into the ones to execute and the ones that can skip execution.
+
+        TIs of tasks that start execution from the triggerer are deferred right away and are part of
+        neither list.
+
+        :return: Primary keys of the TIs to set to scheduled, and of the TIs to set straight to success.
+        """
+        # Get list of TI IDs that do not need to executed, these are
+        # tasks using EmptyOperator and without on_execute_callback / on_success_callback
+        dummy_ti_ids = []
+        schedulable_ti_ids = []
+        for ti in schedulable_tis:
+            if TYPE_CHECKING:
+                assert ti.task
+            if (
+                ti.task.inherits_from_empty_operator
+                and not ti.task.on_execute_callback
+                and not ti.task.on_success_callback
+                and not ti.task.outlets
+            ):
+                dummy_ti_ids.append((ti.dag_id, ti.run_id, ti.task_id, ti.map_index))
+            # check "start_trigger_args" to see whether the operator supports start execution from triggerer
+            # if so, we'll then check "start_from_trigger" to see whether this feature is turned on and defer
+            # this task.
+            # if not, we'll add this "ti" into "schedulable_ti_ids" and later execute it to run in the worker
+            elif ti.task.start_trigger_args is not None:
+                context = ti.get_template_context()
+                start_from_trigger = ti.task.expand_start_from_trigger(context=context, session=session)
+
+                if start_from_trigger:
+                    ti.start_date = timezone.utcnow()
+                    if ti.state != TaskInstanceState.UP_FOR_RESCHEDULE:
+                        ti.try_number += 1
+                    ti.defer_task(exception=None, session=session)
+                else:
+                    schedulable_ti_ids.append((ti.dag_id, ti.run_id, ti.task_id, ti.map_index))
+            else:
+                schedulable_ti_ids.append((ti.dag_id, ti.run_id, ti.task_id, ti.map_index))
+        return schedulable_ti_ids, dummy_ti_ids
+
+    @staticmethod
+    def _scheduled_ti_values() -> dict[str, Any]:
+        return {
+            "state": TaskInstanceState.SCHEDULED,
+            "try_number": case(
+                (
+                    or_(TI.state.is_(None), TI.state != TaskInstanceState.UP_FOR_RESCHEDULE),
+                    TI.try_number + 1,
+                ),
+                else_=TI.try_number,
+            ),
+        }
+
+    @staticmethod
+    def _dummy_ti_values() -> dict[str, Any]:
+        return {
+            "state": TaskInstanceState.SUCCESS,
+            "start_date": timezone.utcnow(),
+            "end_date": timezone.utcnow(),
+            "duration": 0,
+            "try_number": TI.try_number + 1,
+        }
+
     @provide_session
     def get_log_template(self, *, session: Session = NEW_SESSION) -> LogTemplate | LogTemplatePydantic:
         return DagRun._get_log_template(log_template_id=self.log_template_id, session=session)
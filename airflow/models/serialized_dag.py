@@ -20,13 +20,30 @@
 from __future__ import annotations
 
 import logging
+import threading
 import zlib
+from collections import OrderedDict
 from datetime import timedelta
-from typing import TYPE_CHECKING, Collection
+from typing import TYPE_CHECKING, Collection, Iterable
 
 import sqlalchemy_jsonfield
-from sqlalchemy import BigInteger, Column, Index, LargeBinary, String, and_, exc, or_, select
-from sqlalchemy.orm import backref, foreign, relationship
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    and_,
+    case,
+    delete,
+    exc,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import backref, foreign, object_session, relationship
 from sqlalchemy.sql.expression import func, literal
 
 from airflow.api_internal.internal_api_call import internal_api_call
@@ -37,10 +54,17 @@ from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
 from airflow.serialization.dag_dependency import DagDependency
 from airflow.serialization.serialized_objects import SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, MIN_SERIALIZED_DAG_UPDATE_INTERVAL, json
+from airflow.settings import (
+    CHUNK_SERIALIZED_DAGS,
+    COMPRESS_SERIALIZED_DAGS,
+    LAZY_DESERIALIZE_DAG_TASKS,
+    MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+    json,
+)
+from airflow.utils import json as json_utils
 from airflow.utils import timezone
 from airflow.utils.hashlib_wrapper import md5
-from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
 
 if TYPE_CHECKING:
@@ -53,6 +77,260 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+TASK_CHUNKS_KEY = "task_chunks"
+"""Key of the ``dag`` section of a chunked serialized DAG mapping task ids to the hash of their chunk."""
+
+CHUNK_GC_GRACE_PERIOD = timedelta(hours=1)
+"""How long a chunk is kept after it was last referenced by a manifest being written."""
+
+CHUNK_CACHE_SIZE = 20_000
+"""Number of chunks kept decoded in each process, shared by all the DAGs and versions that use them."""
+
+
+def _insert_missing(model: type[Base], rows: list[dict], *, session: Session) -> None:
+    """Insert ``rows``, skipping the ones whose primary key is taken, e.g. by a concurrent writer."""
+    if not rows:
+        return
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name in ("postgresql", "sqlite"):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        session.execute(dialect_insert(model).on_conflict_do_nothing(), rows)
+    elif dialect_name == "mysql":
+        session.execute(insert(model).prefix_with("IGNORE"), rows)
+    else:
+        for row in rows:
+            try:
+                with session.begin_nested():
+                    session.execute(insert(model), row)
+            except exc.IntegrityError:
+                log.debug("Skipping %s %s, already present", model.__tablename__, row, exc_info=True)
+
+
+class SerializedDagChunk(Base):
+    """
+    The serialized form of a task, stored once by the hash of its content.
+
+    When ``[core] chunk_serialized_dags`` is enabled, the ``serialized_dag`` table only holds a manifest:
+    the serialized DAG without its tasks, and the hash of the chunk of each task. Tasks that did not change
+    between two versions of a DAG - or that are identical across DAGs - share their chunk, so writing a new
+    version only adds the chunks of the tasks that changed.
+    """
+
+    __tablename__ = "serialized_dag_chunk"
+
+    chunk_hash = Column(String(32), primary_key=True)
+    data_compressed = Column(LargeBinary, nullable=False)
+    # Updated whenever a manifest written references the chunk, so that the chunks of a manifest being
+    # written are not deleted as unreferenced.
+    last_updated = Column(UtcDateTime, nullable=False)
+
+    @staticmethod
+    def encode(task_data: dict) -> tuple[str, bytes]:
+        """Return the hash and the compressed content of the chunk of a serialized task."""
+        task_data_json = json.dumps(task_data, sort_keys=True).encode("utf-8")
+        return md5(task_data_json).hexdigest(), zlib.compress(task_data_json)
+
+    @classmethod
+    def write_chunks(cls, chunks: dict[str, bytes], *, session: Session) -> int:
+        """
+        Store the chunks that are not stored yet, and mark the others as in use.
+
+        Identical tasks of different DAGs share their chunk, so other DAG processors may be adding the
+        same chunks at the same time: the chunks already added are skipped.
+
+        :param chunks: compressed content of the chunks, by hash
+        :return: The number of chunks added, or that were added concurrently
+        """
+        now = timezone.utcnow()
+        existing = set(session.scalars(select(cls.chunk_hash).where(cls.chunk_hash.in_(chunks))))
+        if existing:
+            session.execute(
+                update(cls)
+                .where(cls.chunk_hash.in_(existing))
+                .values(last_updated=now)
+                .execution_options(synchronize_session=False)
+            )
+        new_chunks = [
+            {"chunk_hash": chunk_hash, "data_compressed": data, "last_updated": now}
+            for chunk_hash, data in chunks.items()
+            if chunk_hash not in existing
+        ]
+        _insert_missing(cls, new_chunks, session=session)
+        return len(new_chunks)
+
+    # Decoded chunks, by hash, in least recently used order. A chunk never changes, so the decoded task is
+    # shared by all the DAGs read, and must not be modified.
+    _cache: OrderedDict[str, dict] = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def read_chunks(cls, chunk_hashes: Collection[str], *, session: Session) -> dict[str, dict]:
+        """Return the serialized tasks stored in the given chunks, by hash."""
+        chunks = {}
+        with cls._cache_lock:
+            for chunk_hash in chunk_hashes:
+                if chunk_hash in cls._cache:
+                    cls._cache.move_to_end(chunk_hash)
+                    chunks[chunk_hash] = cls._cache[chunk_hash]
+        missing = [chunk_hash for chunk_hash in chunk_hashes if chunk_hash not in chunks]
+        if not missing:
+            return chunks
+        read = {
+            chunk_hash: json_utils.loads(zlib.decompress(data))
+            for chunk_hash, data in session.execute(
+                select(cls.chunk_hash, cls.data_compressed).where(cls.chunk_hash.in_(missing))
+            )
+        }
+        with cls._cache_lock:
+            cls._cache.update(read)
+            while len(cls._cache) > CHUNK_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        chunks.update(read)
+        return chunks
+
+    @classmethod
+    @provide_session
+    def remove_unreferenced_chunks(cls, grace_period: timedelta, session: Session = NEW_SESSION) -> int:
+        """
+        Delete the chunks no serialized DAG references anymore.
+
+        :param grace_period: only delete chunks not marked as in use for at least this long, to leave
+            alone the chunks of manifests being written concurrently.
+        :return: The number of chunks deleted
+        """
+        referenced = select(SerializedDagChunkRef.chunk_hash).where(
+            SerializedDagChunkRef.chunk_hash == cls.chunk_hash
+        )
+        return session.execute(
+            delete(cls)
+            .where(cls.last_updated < timezone.utcnow() - grace_period, ~referenced.exists())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+
+class SerializedDagChunkRef(Base):
+    """The chunks referenced by each serialized DAG, to find the unused chunks without reading manifests."""
+
+    __tablename__ = "serialized_dag_chunk_ref"
+
+    dag_id = Column(String(ID_LEN), primary_key=True)
+    chunk_hash = Column(String(32), primary_key=True)
+
+    __table_args__ = (Index("idx_serialized_dag_chunk_ref_chunk_hash", chunk_hash, unique=False),)
+
+    @classmethod
+    def set_references(cls, dag_id: str, chunk_hashes: Collection[str], *, session: Session) -> None:
+        """Make the chunks referenced by a DAG be exactly ``chunk_hashes``."""
+        stored = set(session.scalars(select(cls.chunk_hash).where(cls.dag_id == dag_id)))
+        if removed := stored.difference(chunk_hashes):
+            session.execute(
+                delete(cls)
+                .where(cls.dag_id == dag_id, cls.chunk_hash.in_(removed))
+                .execution_options(synchronize_session=False)
+            )
+        added = [{"dag_id": dag_id, "chunk_hash": chunk_hash} for chunk_hash in chunk_hashes]
+        _insert_missing(cls, [row for row in added if row["chunk_hash"] not in stored], session=session)
+
+    @classmethod
+    def remove_references(cls, dag_ids: Collection[str], *, session: Session) -> None:
+        """Delete the references of the given DAGs."""
+        session.execute(
+            delete(cls).where(cls.dag_id.in_(dag_ids)).execution_options(synchronize_session=False)
+        )
+
+
+DAG_CHANGE_RETENTION = timedelta(hours=1)
+"""How long changes are kept in the ``serialized_dag_change`` table."""
+
+DAG_CHANGE_SETTLE_TIME = timedelta(minutes=1)
+"""
+How long after a change was recorded it is assumed that all the changes with a lower id are committed too.
+
+Ids are allocated when the rows are inserted, not when they are committed, so a reader can see a change
+before another one with a lower id. Readers keep re-reading changes younger than this to catch these.
+The creation dates of the changes are taken from the database clock, and compared against it, so that
+they do not depend on the clocks of the hosts writing and reading them. A change committed more than this
+after it was inserted can still be missed, which is why readers also compare the hashes of all their DAGs
+every ``DAG_CHANGE_RETENTION - DAG_CHANGE_SETTLE_TIME``.
+"""
+
+
+class SerializedDagChange(Base):
+    """
+    Feed of the changes to the serialized_dag table.
+
+    A row is added whenever a serialized DAG is written or deleted, with an increasing id. Processes
+    holding DAGs deserialized from the database find out which of them changed with a single query on
+    the changes with a higher id than the last one they read, instead of checking every DAG.
+    """
+
+    __tablename__ = "serialized_dag_change"
+
+    id = Column(Integer, primary_key=True)
+    dag_id = Column(String(ID_LEN), nullable=False)
+    # Hash of the new serialized DAG, None if it was deleted
+    dag_hash = Column(String(32), nullable=True)
+    created_at = Column(UtcDateTime, nullable=False)
+
+    __table_args__ = (Index("idx_serialized_dag_change_created_at", created_at, unique=False),)
+
+    @classmethod
+    def record(cls, changes: Iterable[tuple[str, str | None]], *, session: Session) -> None:
+        """
+        Record changes to serialized DAGs.
+
+        :param changes: The id and new hash of each DAG changed; None for the hash of deleted DAGs
+        """
+        session.add_all(
+            cls(dag_id=dag_id, dag_hash=dag_hash, created_at=func.now()) for dag_id, dag_hash in changes
+        )
+
+    @staticmethod
+    def _db_now(*, session: Session) -> datetime:
+        """Return the current time of the database, which dates the changes."""
+        now = session.scalar(select(func.now()))
+        if now.tzinfo is None:
+            # SQLite and MySQL return the UTC time without time zone
+            return now.replace(tzinfo=timezone.utc)
+        return timezone.convert_to_utc(now)
+
+    @classmethod
+    def get_settled_id(cls, *, session: Session) -> int:
+        """Return the id of the latest change older than ``DAG_CHANGE_SETTLE_TIME``, or 0."""
+        settled_before = cls._db_now(session=session) - DAG_CHANGE_SETTLE_TIME
+        return session.scalar(select(func.max(cls.id)).where(cls.created_at < settled_before)) or 0
+
+    @classmethod
+    def get_changes_since(
+        cls, change_id: int, *, session: Session
+    ) -> list[tuple[int, str, str | None, bool]]:
+        """
+        Return the changes after ``change_id``, by id.
+
+        :return: The id, DAG id and DAG hash of each change, and whether it is older than
+            ``DAG_CHANGE_SETTLE_TIME``
+        """
+        settled_before = cls._db_now(session=session) - DAG_CHANGE_SETTLE_TIME
+        query = select(
+            cls.id,
+            cls.dag_id,
+            cls.dag_hash,
+            case((cls.created_at < settled_before, literal(True)), else_=literal(False)),
+        ).where(cls.id > change_id)
+        return session.execute(query.order_by(cls.id)).all()
+
+    @classmethod
+    def remove_old_changes(cls, *, session: Session) -> None:
+        """Delete the changes older than ``DAG_CHANGE_RETENTION``."""
+        session.execute(
+            delete(cls)
+            .where(cls.created_at < cls._db_now(session=session) - DAG_CHANGE_RETENTION)
+            .execution_options(synchronize_session=False)
+        )
+
 
 class SerializedDagModel(Base):
     """
@@ -118,11 +396,22 @@ class SerializedDagModel(Base):
 
         self.dag_hash = md5(dag_data_json).hexdigest()
 
+        # Compressed content of the chunks of the tasks, by hash, to write along with the manifest
+        self._chunks: dict[str, bytes] = {}
+        manifest = dag_data
+        if CHUNK_SERIALIZED_DAGS:
+            task_chunks = {}
+            for task_data in dag_data["dag"]["tasks"]:
+                chunk_hash, chunk = SerializedDagChunk.encode(task_data)
+                task_chunks[task_data["__var"]["task_id"]] = chunk_hash
+                self._chunks[chunk_hash] = chunk
+            manifest = {**dag_data, "dag": {**dag_data["dag"], "tasks": [], TASK_CHUNKS_KEY: task_chunks}}
+
         if COMPRESS_SERIALIZED_DAGS:
             self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
+            self._data_compressed = zlib.compress(json.dumps(manifest, sort_keys=True).encode("utf-8"))
         else:
-            self._data = dag_data
+            self._data = manifest
             self._data_compressed = None
 
         # serve as cache so no need to decompress and load, when accessing data field
@@ -180,7 +469,17 @@ class SerializedDagModel(Base):
             return False
 
         log.debug("Writing Serialized DAG: %s to the DB", dag.dag_id)
+        if new_serialized_dag._chunks:
+            num_chunks = SerializedDagChunk.write_chunks(new_serialized_dag._chunks, session=session)
+            log.debug(
+                "Wrote %d new chunks out of %d for DAG %s",
+                num_chunks,
+                len(new_serialized_dag._chunks),
+                dag.dag_id,
+            )
+        SerializedDagChunkRef.set_references(dag.dag_id, new_serialized_dag._chunks, session=session)
         session.merge(new_serialized_dag)
+        SerializedDagChange.record([(dag.dag_id, new_serialized_dag.dag_hash)], session=session)
         log.debug("DAG: %s written to the DB", dag.dag_id)
         return True
 
@@ -211,17 +510,69 @@ class SerializedDagModel(Base):
                 )
         return dags
 
+    @property
+    def manifest(self) -> dict:
+        """
+        The data as stored in the ``data`` column.
+
+        This is the serialized DAG itself, or only its manifest when the DAG is chunked.
+        """
+        if self._data_compressed:
+            return json_utils.loads(zlib.decompress(self._data_compressed))
+        return self._data
+
     @property
     def data(self) -> dict | None:
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "__data_cache") or self.__data_cache is None:
-            if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
-            else:
-                self.__data_cache = self._data
+            data = self.manifest
+            if data and data["dag"].get(TASK_CHUNKS_KEY) is not None:
+                data = self._assemble(data)
+            self.__data_cache = data
 
         return self.__data_cache
 
+    def _assemble(self, manifest: dict) -> dict:
+        """Return the serialized DAG of a chunked manifest, with the tasks read from their chunks."""
+        task_chunks: dict[str, str] = manifest["dag"][TASK_CHUNKS_KEY]
+        session = object_session(self)
+        if session is None:
+            with create_session() as session:
+                chunks = SerializedDagChunk.read_chunks(set(task_chunks.values()), session=session)
+        else:
+            chunks = SerializedDagChunk.read_chunks(set(task_chunks.values()), session=session)
+        dag_data = {key: value for key, value in manifest["dag"].items() if key != TASK_CHUNKS_KEY}
+        dag_data["tasks"] = [chunks[chunk_hash] for chunk_hash in task_chunks.values()]
+        return {**manifest, "dag": dag_data}
+
+    @classmethod
+    @provide_session
+    def get_serialized_task(cls, dag_id: str, task_id: str, session: Session = NEW_SESSION) -> dict | None:
+        """
+        Get the serialized form of a single task of a DAG.
+
+        For a chunked DAG only the chunk of the task is read, not the whole DAG.
+
+        :param dag_id: the DAG of the task
+        :param task_id: the task to fetch
+        :param session: ORM Session
+        :return: The serialized task, or None if the DAG or the task is not found
+        """
+        row = session.scalar(select(cls).where(cls.dag_id == dag_id))
+        if row is None:
+            return None
+        manifest = row.manifest
+        task_chunks = manifest["dag"].get(TASK_CHUNKS_KEY)
+        if task_chunks is None:
+            return next(
+                (task for task in manifest["dag"]["tasks"] if task["__var"]["task_id"] == task_id), None
+            )
+        if task_id not in task_chunks:
+            return None
+        return SerializedDagChunk.read_chunks([task_chunks[task_id]], session=session).get(
+            task_chunks[task_id]
+        )
+
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
@@ -232,7 +583,7 @@ class SerializedDagModel(Base):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return SerializedDAG.from_dict(data)
+        return SerializedDAG.from_dict(data, lazy=LAZY_DESERIALIZE_DAG_TASKS)
 
     @classmethod
     @provide_session
@@ -244,6 +595,8 @@ class SerializedDagModel(Base):
         :param session: ORM Session.
         """
         session.execute(cls.__table__.delete().where(cls.dag_id == dag_id))
+        SerializedDagChunkRef.remove_references([dag_id], session=session)
+        SerializedDagChange.record([(dag_id, None)], session=session)
 
     @classmethod
     @internal_api_call
@@ -267,18 +620,22 @@ class SerializedDagModel(Base):
             "Deleting Serialized DAGs (for which DAG files are deleted) from %s table ", cls.__tablename__
         )
 
-        session.execute(
-            cls.__table__.delete().where(
-                and_(
-                    cls.fileloc_hash.notin_(alive_fileloc_hashes),
-                    cls.fileloc.notin_(alive_dag_filelocs),
-                    or_(
-                        cls.processor_subdir.is_(None),
-                        cls.processor_subdir == processor_subdir,
-                    ),
-                )
-            )
+        deleted_condition = and_(
+            cls.fileloc_hash.notin_(alive_fileloc_hashes),
+            cls.fileloc.notin_(alive_dag_filelocs),
+            or_(
+                cls.processor_subdir.is_(None),
+                cls.processor_subdir == processor_subdir,
+            ),
         )
+        deleted_dag_ids = session.scalars(select(cls.dag_id).where(deleted_condition)).all()
+        if deleted_dag_ids:
+            session.execute(cls.__table__.delete().where(deleted_condition))
+            SerializedDagChunkRef.remove_references(deleted_dag_ids, session=session)
+            SerializedDagChange.record(((dag_id, None) for dag_id in deleted_dag_ids), session=session)
+        SerializedDagChange.remove_old_changes(session=session)
+        if CHUNK_SERIALIZED_DAGS:
+            SerializedDagChunk.remove_unreferenced_chunks(grace_period=CHUNK_GC_GRACE_PERIOD, session=session)
 
     @classmethod
     @provide_session
@@ -378,6 +735,17 @@ class SerializedDagModel(Base):
         """
         return session.scalar(select(cls.dag_hash).where(cls.dag_id == dag_id))
 
+    @classmethod
+    def get_dag_hashes(cls, *, session: Session) -> dict[str, str]:
+        """
+        Get the hash of every serialized DAG.
+
+        :meta private:
+        :param session: ORM Session
+        :return: The hash of each DAG, by DAG ID
+        """
+        return dict(session.execute(select(cls.dag_id, cls.dag_hash)).all())
+
     @classmethod
     def get_latest_version_hash_and_updated_datetime(
         cls,
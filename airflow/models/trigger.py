@@ -20,7 +20,7 @@ import datetime
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any, Iterable
 
-from sqlalchemy import Column, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import Column, Float, ForeignKey, Integer, String, Text, delete, func, or_, select, update
 from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
 
@@ -28,6 +28,7 @@ from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
 from airflow.utils import timezone
+from airflow.utils.helpers import chunks
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
@@ -38,7 +39,32 @@ if TYPE_CHECKING:
     from sqlalchemy.sql import Select
 
     from airflow.serialization.pydantic.trigger import TriggerPydantic
-    from airflow.triggers.base import BaseTrigger
+    from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+SUBMIT_EVENTS_CHUNK_SIZE = 500
+"""Number of triggers whose task instances are loaded by a single query when submitting events."""
+
+
+class TriggererLoad(Base):
+    """
+    Load of an alive triggerer, as it last reported it.
+
+    ``load`` summarizes the other columns: it is the highest of the trigger count relative to the
+    capacity of the triggerer, the event loop lag relative to ``[triggerer] max_loop_lag``, and the CPU
+    usage relative to one core. A triggerer with a load of 1 or more is saturated.
+    """
+
+    __tablename__ = "triggerer_load"
+
+    triggerer_id = Column(
+        Integer, ForeignKey("job.id", name="triggerer_load_job_fkey", ondelete="CASCADE"), primary_key=True
+    )
+    trigger_count = Column(Integer, nullable=False)
+    loop_lag = Column(Float, nullable=False)
+    cpu_percent = Column(Float, nullable=False)
+    load = Column(Float, nullable=False)
+    updated_at = Column(UtcDateTime, nullable=False)
 
 
 class Trigger(Base):
@@ -207,6 +233,43 @@ class Trigger(Base):
         ):
             event.handle_submit(task_instance=task_instance)
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Take events from triggers, trigger all dependent tasks to resume, and delete the fired triggers.
+
+        This does the same as calling :meth:`submit_event` for each event, but in a single transaction
+        loading the task instances of many triggers at once. Only the first event of a trigger is
+        submitted, as its task instances are no longer deferred afterwards.
+        """
+        first_events: dict[int, TriggerEvent] = {}
+        for trigger_id, event in events:
+            first_events.setdefault(trigger_id, event)
+        for trigger_ids in chunks(list(first_events), SUBMIT_EVENTS_CHUNK_SIZE):
+            for task_instance in session.scalars(
+                select(TaskInstance).where(
+                    TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
+                )
+            ):
+                first_events[task_instance.trigger_id].handle_submit(
+                    task_instance=task_instance, session=session
+                )
+            session.flush()
+            # The triggers are not needed anymore unless other task instances still depend on them;
+            # clean_unused would delete them next, but this saves it finding them.
+            session.execute(
+                delete(Trigger)
+                .where(
+                    Trigger.id.in_(trigger_ids),
+                    ~select(TaskInstance.trigger_id).where(TaskInstance.trigger_id == Trigger.id).exists(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+
     @classmethod
     @internal_api_call
     @provide_session
@@ -289,6 +352,88 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def report_load(
+        cls,
+        triggerer_id: int,
+        trigger_count: int,
+        loop_lag: float,
+        cpu_percent: float,
+        load: float,
+        session: Session = NEW_SESSION,
+    ) -> None:
+        """Record the current load of a triggerer, for other triggerers to balance triggers with it."""
+        session.merge(
+            TriggererLoad(
+                triggerer_id=triggerer_id,
+                trigger_count=trigger_count,
+                loop_lag=loop_lag,
+                cpu_percent=cpu_percent,
+                load=load,
+                updated_at=timezone.utcnow(),
+            )
+        )
+        session.commit()
+
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def get_triggerer_loads(
+        cls, health_check_threshold: int, session: Session = NEW_SESSION
+    ) -> dict[int, float]:
+        """Return the load of each alive triggerer that reported it, by triggerer id."""
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return dict(
+            session.execute(
+                select(TriggererLoad.triggerer_id, TriggererLoad.load)
+                .join(Job, Job.id == TriggererLoad.triggerer_id)
+                .where(
+                    Job.end_date.is_(None),
+                    Job.latest_heartbeat
+                    > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+                    Job.job_type == "TriggererJob",
+                )
+            ).all()
+        )
+
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def release_triggers(cls, triggerer_id: int, count: int, session: Session = NEW_SESSION) -> int:
+        """
+        Unassign up to ``count`` triggers of a triggerer, so that other triggerers pick them up.
+
+        The most recently created triggers are released first. The triggerer cancels them the next time
+        it loads its triggers; an event they fire before that is still handled, and whichever copy of a
+        trigger fires last finds its task instance already resumed, so no event is lost.
+
+        :return: The number of triggers released
+        """
+        if count <= 0:
+            return 0
+        trigger_ids = session.scalars(
+            with_row_locks(
+                select(cls.id)
+                .where(cls.triggerer_id == triggerer_id)
+                .order_by(cls.created_date.desc())
+                .limit(count),
+                session,
+                skip_locked=True,
+            )
+        ).all()
+        if trigger_ids:
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(trigger_ids), cls.triggerer_id == triggerer_id)
+                .values(triggerer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+        session.commit()
+        return len(trigger_ids)
+
     @classmethod
     def get_sorted_triggers(cls, capacity: int, alive_triggerer_ids: list[int] | Select, session: Session):
         """
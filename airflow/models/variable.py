@@ -342,10 +342,16 @@ class Variable(Base, LoggingMixin):
         # check cache first
         # enabled only if SecretCache.init() has been called first
         try:
-            return SecretCache.get_variable(key)
+            return SecretCache.get_variable(key, refresh=lambda: Variable._get_variable_from_backends(key))
         except SecretCache.NotPresentException:
             pass  # continue business
 
+        var_val = Variable._get_variable_from_backends(key)
+        SecretCache.save_variable(key, var_val)  # we save None as well
+        return var_val
+
+    @staticmethod
+    def _get_variable_from_backends(key: str) -> str | None:
         var_val = None
         # iterate over backends if not in cache (or expired)
         for secrets_backend in ensure_secrets_loaded():
@@ -359,6 +365,4 @@ class Variable(Base, LoggingMixin):
                     "Checking subsequent secrets backend.",
                     type(secrets_backend).__name__,
                 )
-
-        SecretCache.save_variable(key, var_val)  # we save None as well
         return var_val
@@ -22,8 +22,9 @@ import json
 import logging
 import pickle
 import warnings
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Iterable, cast, overload
+from collections import OrderedDict
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence, cast, overload
 
 from sqlalchemy import (
     Column,
@@ -49,10 +50,11 @@ from airflow.models.base import COLLATION_ARGS, ID_LEN, TaskInstanceDependencies
 from airflow.utils import timezone
 from airflow.utils.db import LazySelectSequence
 from airflow.utils.helpers import exactly_one, is_container
-from airflow.utils.json import XComDecoder, XComEncoder
+from airflow.utils.json import XComDecoder, XComEncoder, loads_xcom
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
+from airflow.utils.task_instance_session import is_current_task_instance_session
 
 # XCom constants below are needed for providers backward compatibility,
 # which should import the constants directly after apache-airflow>=2.6.0
@@ -709,10 +711,10 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
             try:
                 return pickle.loads(result.value)
             except pickle.UnpicklingError:
-                return json.loads(result.value.decode("UTF-8"), cls=XComDecoder, object_hook=object_hook)
+                return loads_xcom(result.value, object_hook=object_hook)
         else:
             # Since xcom_pickling is disabled, we should only try to deserialize with JSON
-            return json.loads(result.value.decode("UTF-8"), cls=XComDecoder, object_hook=object_hook)
+            return loads_xcom(result.value, object_hook=object_hook)
 
     @staticmethod
     def deserialize_value(result: XCom) -> Any:
@@ -731,13 +733,63 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
         return BaseXCom._deserialize_value(self, True)
 
 
+XCOM_READAHEAD_SIZE = 1000
+"""Number of values fetched at once when the items of a lazy XCom sequence are accessed in order."""
+
+
+class _XComValueCache:
+    """
+    Deserialized values of lazy XCom sequences, bounded by the total size of their serialized form.
+
+    The least recently used values are evicted first.
+
+    :meta private:
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._values: OrderedDict[tuple[str, int], tuple[Any, int]] = OrderedDict()
+        self._size = 0
+
+    def __contains__(self, key: tuple[str, int]) -> bool:
+        return key in self._values
+
+    def get(self, key: tuple[str, int]) -> Any:
+        """Return the value cached for ``key``; raise KeyError if there is none."""
+        value, _ = self._values[key]
+        self._values.move_to_end(key)
+        return value
+
+    def put(self, key: tuple[str, int], value: Any, size: int) -> None:
+        """Cache ``value``, whose serialized form is ``size`` bytes, evicting other values if needed."""
+        if size > self.max_bytes:
+            return
+        if key in self._values:
+            self._size -= self._values.pop(key)[1]
+        self._values[key] = (value, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._values.popitem(last=False)
+            self._size -= evicted_size
+
+
 class LazyXComSelectSequence(LazySelectSequence[Any]):
     """
     List-like interface to lazily access XCom values.
 
+    Within a task process, deserialized values are cached in the task instance session, up to
+    ``[core] xcom_value_cache_size_mb``. Iterating fetches :data:`XCOM_READAHEAD_SIZE` values per query,
+    and accessing items one by one, in order, reads ahead up to :data:`XCOM_READAHEAD_SIZE` rows instead
+    of one. The rows read ahead are only deserialized when their item is accessed, and fewer of them are
+    read when their serialized values would not fit in the cache.
+
     :meta private:
     """
 
+    _next_index: int | None = None
+    _readahead_start = 0
+    _readahead_rows: Sequence[Row] = ()
+
     @staticmethod
     def _rebuild_select(stmt: TextClause) -> Select:
         return select(XCom.value).from_statement(stmt)
@@ -746,6 +798,80 @@ class LazyXComSelectSequence(LazySelectSequence[Any]):
     def _process_row(row: Row) -> Any:
         return XCom.deserialize_value(row)
 
+    @cached_property
+    def _cache_key(self) -> str:
+        return str(self._select_asc.compile(self._session.get_bind(), compile_kwargs={"literal_binds": True}))
+
+    def _get_cache(self) -> _XComValueCache | None:
+        # Only cache in the task process, where the XComs pulled from upstream tasks cannot change
+        if not is_current_task_instance_session(self._session):
+            return None
+        if (cache := self._session.info.get("xcom_value_cache")) is None:
+            max_bytes = conf.getint("core", "xcom_value_cache_size_mb") * 1024 * 1024
+            if max_bytes <= 0:
+                return None
+            cache = self._session.info["xcom_value_cache"] = _XComValueCache(max_bytes)
+        return cache
+
+    def _process_cached_row(self, row: Row, index: int, cache: _XComValueCache) -> Any:
+        try:
+            return cache.get((self._cache_key, index))
+        except KeyError:
+            pass
+        value = self._process_row(row)
+        cache.put((self._cache_key, index), value, len(row.value or b""))
+        return value
+
+    def _iter_cached(self, cache: _XComValueCache) -> Iterator[Any]:
+        start = 0
+        while True:
+            stmt = self._select_asc.slice(start, start + XCOM_READAHEAD_SIZE)
+            rows = self._session.execute(stmt).all()
+            for index, row in enumerate(rows, start):
+                yield self._process_cached_row(row, index, cache)
+            start += len(rows)
+            if len(rows) < XCOM_READAHEAD_SIZE:
+                break
+        self._len = start
+
+    def __iter__(self) -> Iterator[Any]:
+        if (cache := self._get_cache()) is None:
+            return super().__iter__()
+        if self._len is not None:
+            try:
+                return iter([cache.get((self._cache_key, index)) for index in range(self._len)])
+            except KeyError:
+                pass
+        return self._iter_cached(cache)
+
+    def _readahead_size(self, cache: _XComValueCache) -> int:
+        if not self._readahead_rows:
+            return XCOM_READAHEAD_SIZE
+        # Do not read ahead more rows than the cache can hold, judging by the size of the last ones
+        row_size = sum(len(row.value or b"") for row in self._readahead_rows) / len(self._readahead_rows)
+        return max(1, min(XCOM_READAHEAD_SIZE, int(cache.max_bytes // max(row_size, 1))))
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if not isinstance(key, int) or (cache := self._get_cache()) is None:
+            return super().__getitem__(key)
+        if key < 0:
+            if self._len is None:
+                return super().__getitem__(key)
+            key += self._len
+        try:
+            return cache.get((self._cache_key, key))
+        except KeyError:
+            pass
+        offset = key - self._readahead_start
+        if not 0 <= offset < len(self._readahead_rows):
+            size = self._readahead_size(cache) if key == self._next_index else 1
+            rows = self._session.execute(self._select_asc.slice(key, key + size)).all() if key >= 0 else []
+            if not rows:
+                raise IndexError(key)
+            self._readahead_start, self._readahead_rows, offset = key, rows, 0
+        self._next_index = key + 1
+        return self._process_cached_row(self._readahead_rows[offset], key, cache)
+
 
 def _patch_outdated_serializer(clazz: type[BaseXCom], params: Iterable[str]) -> None:
     """
@@ -17,30 +17,50 @@
 # under the License.
 from __future__ import annotations
 
-import datetime
-import multiprocessing
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Callable
 
 from airflow.configuration import conf
-from airflow.utils import timezone
+from airflow.stats import Stats
+
+log = logging.getLogger(__name__)
 
 
 class SecretCache:
-    """A static class to manage the global secret cache."""
+    """
+    A static class to manage the node-local secret cache.
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
-    _ttl: datetime.timedelta
+    The cache has two levels: a dict in the current process, and a SQLite database on local storage shared
+    by all the Airflow processes of the node, so that a value looked up by one DAG file processor or task
+    is reused by the others. Each entry expires on its own, keys that were not found are cached for a
+    shorter time, and entries that expired recently are still served while a single process refreshes them
+    in the background. Values are encrypted with the Fernet key, and the cache is not enabled without one.
+    """
 
-    class NotPresentException(Exception):
-        """Raised when a key is not present in the cache."""
+    _LOCAL_TTL = 5.0
+    """Seconds an entry is kept in the process before the shared store is read again."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            self.value = value
-            self.date = timezone.utcnow()
+    _REFRESH_TIMEOUT = 30.0
+    """Seconds other processes wait for the process refreshing a stale entry before trying themselves."""
 
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            return timezone.utcnow() - self.date > ttl
+    _path: str | None = None
+    _connection: sqlite3.Connection | None = None
+    _connection_pid: int | None = None
+    _local: dict[str, tuple[str | None, float]] = {}
+    _lock = threading.Lock()
+    _ttl: float
+    _negative_ttl: float
+    _stale: float
+
+    class NotPresentException(Exception):
+        """Raised when a key is not present in the cache."""
 
     _VARIABLE_PREFIX = "__v_"
     _CONNECTION_PREFIX = "__c_"
@@ -52,79 +72,237 @@ class SecretCache:
 
         Safe to call several times.
         """
-        if cls._cache is not None:
+        if cls._path is not None:
             return
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
-        ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
-        cls._ttl = datetime.timedelta(seconds=ttl_seconds)
+        cls._ttl = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
+        cls._negative_ttl = conf.getint(section="secrets", key="cache_negative_ttl_seconds", fallback=60)
+        cls._stale = conf.getint(section="secrets", key="cache_stale_seconds", fallback=0)
+
+        from airflow.models.crypto import get_fernet
+
+        if not get_fernet().is_encrypted:
+            log.warning("The secrets cache is disabled, as it requires a Fernet key to encrypt the values")
+            return
+        path = conf.get(section="secrets", key="cache_path", fallback="")
+        try:
+            if not path:
+                directory = os.path.join(
+                    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+                    f"airflow-secrets-cache-{os.getuid()}",
+                )
+                with suppress(FileExistsError):
+                    os.mkdir(directory, 0o700)
+                # The directory is in a world-writable one: it could have been created by another user
+                cls._check_private(os.lstat(directory), directory)
+                path = os.path.join(directory, "cache.db")
+            # The cache holds secrets: only the user running Airflow may read it
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+            try:
+                cls._check_private(os.fstat(fd), path)
+            finally:
+                os.close(fd)
+            cls._path = path
+            cls._execute(
+                "CREATE TABLE IF NOT EXISTS secrets (key TEXT PRIMARY KEY, value TEXT, "
+                "expires_at REAL NOT NULL, refreshing_until REAL NOT NULL)",
+                raise_errors=True,
+            )
+        except (OSError, sqlite3.Error):
+            log.warning("Could not open the secrets cache at %s, it is disabled", path, exc_info=True)
+            cls._path = None
+
+    @staticmethod
+    def _check_private(stat: os.stat_result, path: str) -> None:
+        """Raise OSError unless ``stat`` is of a file or directory only the current user can access."""
+        if stat.st_uid != os.getuid():
+            raise OSError(f"{path} is not owned by the current user")
+        if stat.st_mode & 0o077:
+            raise OSError(f"{path} is accessible to other users (mode {oct(stat.st_mode & 0o777)})")
 
     @classmethod
     def reset(cls):
         """Use for test purposes only."""
-        cls._cache = None
+        cls._path = None
+        cls._connection = None
+        cls._local = {}
 
     @classmethod
-    def get_variable(cls, key: str) -> str | None:
+    def get_variable(cls, key: str, refresh: Callable[[], str | None] | None = None) -> str | None:
         """
         Try to get the value associated with the key from the cache.
 
+        :param refresh: Returns the current value of the Variable; if given, a value that expired less than
+            ``[secrets] cache_stale_seconds`` ago is returned, and refreshed in the background.
         :return: The saved value (which can be None) if present in cache and not expired,
             a NotPresent exception otherwise.
         """
-        return cls._get(key, cls._VARIABLE_PREFIX)
+        return cls._get(key, cls._VARIABLE_PREFIX, refresh)
 
     @classmethod
-    def get_connection_uri(cls, conn_id: str) -> str:
+    def get_connection_uri(cls, conn_id: str, refresh: Callable[[], str | None] | None = None) -> str | None:
         """
         Try to get the uri associated with the conn_id from the cache.
 
-        :return: The saved uri if present in cache and not expired,
-            a NotPresent exception otherwise.
+        :param refresh: Returns the current uri of the connection; if given, a uri that expired less than
+            ``[secrets] cache_stale_seconds`` ago is returned, and refreshed in the background.
+        :return: The saved uri, or None if the connection is known not to exist, if present in cache and
+            not expired, a NotPresent exception otherwise.
         """
-        val = cls._get(conn_id, cls._CONNECTION_PREFIX)
-        if val:  # there shouldn't be any empty entries in the connections cache, but we enforce it here.
-            return val
-        raise cls.NotPresentException
+        return cls._get(conn_id, cls._CONNECTION_PREFIX, refresh)
 
     @classmethod
-    def _get(cls, key: str, prefix: str) -> str | None:
-        if cls._cache is None:
+    def _get(cls, key: str, prefix: str, refresh: Callable[[], str | None] | None) -> str | None:
+        if cls._path is None:
             # using an exception for misses allow to meaningfully cache None values
             raise cls.NotPresentException
 
-        val = cls._cache.get(f"{prefix}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
+        cache_key = f"{prefix}{key}"
+        now = time.time()
+        local = cls._local.get(cache_key)
+        if local is not None and local[1] > now:
+            cls._incr("hit", prefix)
+            return local[0]
+
+        cursor = cls._execute(
+            "SELECT value, expires_at, refreshing_until FROM secrets WHERE key = ?", cache_key
+        )
+        row = cursor.fetchone() if cursor is not None else None
+        if row is None:
+            cls._incr("miss", prefix)
+            raise cls.NotPresentException
+        encrypted_value, expires_at, refreshing_until = row
+        try:
+            value = cls._decrypt(encrypted_value)
+        except Exception:
+            # e.g. written with another Fernet key
+            cls._incr("miss", prefix)
+            raise cls.NotPresentException
+        if expires_at > now:
+            cls._local[cache_key] = (value, min(expires_at, now + cls._LOCAL_TTL))
+            cls._incr("hit", prefix)
+            return value
+        if refresh is not None and now < expires_at + cls._stale:
+            if refreshing_until < now:
+                # Only the process that claims the entry refreshes it
+                cursor = cls._execute(
+                    "UPDATE secrets SET refreshing_until = ? WHERE key = ? AND refreshing_until < ?",
+                    now + cls._REFRESH_TIMEOUT,
+                    cache_key,
+                    now,
+                )
+                if cursor is not None and cursor.rowcount == 1:
+                    threading.Thread(
+                        target=cls._refresh,
+                        args=(key, prefix, refresh),
+                        name="secrets-cache-refresh",
+                        daemon=True,
+                    ).start()
+            cls._incr("stale", prefix)
+            return value
+        cls._incr("miss", prefix)
         raise cls.NotPresentException
 
     @classmethod
-    def save_variable(cls, key: str, value: str | None):
-        """Save the value for that key in the cache, if initialized."""
-        cls._save(key, value, cls._VARIABLE_PREFIX)
+    def _refresh(cls, key: str, prefix: str, refresh: Callable[[], str | None]) -> None:
+        try:
+            value = refresh()
+        except Exception:
+            log.warning("Failed to refresh the cached value of %s", key, exc_info=True)
+            return
+        cls._save(key, value, prefix)
 
     @classmethod
-    def save_connection_uri(cls, conn_id: str, uri: str):
-        """Save the uri representation for that connection in the cache, if initialized."""
-        if uri is None:
-            # connections raise exceptions if not present, so we shouldn't have any None value to save.
-            return
-        cls._save(conn_id, uri, cls._CONNECTION_PREFIX)
+    def save_variable(cls, key: str, value: str | None, ttl: float | None = None):
+        """
+        Save the value for that key in the cache, if initialized.
+
+        :param ttl: Seconds the value is valid for; defaults to ``[secrets] cache_ttl_seconds``, or
+            ``[secrets] cache_negative_ttl_seconds`` if the value is None.
+        """
+        cls._save(key, value, cls._VARIABLE_PREFIX, ttl)
+
+    @classmethod
+    def save_connection_uri(cls, conn_id: str, uri: str | None, ttl: float | None = None):
+        """
+        Save the uri representation for that connection in the cache, if initialized.
+
+        :param uri: The uri of the connection, or None if it does not exist
+        :param ttl: Seconds the uri is valid for; defaults to ``[secrets] cache_ttl_seconds``, or
+            ``[secrets] cache_negative_ttl_seconds`` if the uri is None.
+        """
+        cls._save(conn_id, uri, cls._CONNECTION_PREFIX, ttl)
 
     @classmethod
-    def _save(cls, key: str, value: str | None, prefix: str):
-        if cls._cache is not None:
-            cls._cache[f"{prefix}{key}"] = cls._CacheValue(value)
+    def _save(cls, key: str, value: str | None, prefix: str, ttl: float | None = None):
+        if cls._path is None:
+            return
+        if ttl is None:
+            ttl = cls._ttl if value is not None else cls._negative_ttl
+        cache_key = f"{prefix}{key}"
+        now = time.time()
+        cls._execute(
+            "INSERT OR REPLACE INTO secrets (key, value, expires_at, refreshing_until) VALUES (?, ?, ?, 0)",
+            cache_key,
+            cls._encrypt(value),
+            now + ttl,
+        )
+        cls._local[cache_key] = (value, now + min(ttl, cls._LOCAL_TTL))
+        if random.random() < 0.01:
+            cls._execute("DELETE FROM secrets WHERE expires_at < ?", now - cls._stale)
 
     @classmethod
     def invalidate_variable(cls, key: str):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
-        if cls._cache is not None:
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{key}", None)
+        cls._invalidate(key, cls._VARIABLE_PREFIX)
+
+    @classmethod
+    def invalidate_connection(cls, conn_id: str):
+        """Invalidate (actually removes) the uri stored in the cache for that connection."""
+        cls._invalidate(conn_id, cls._CONNECTION_PREFIX)
+
+    @classmethod
+    def _invalidate(cls, key: str, prefix: str):
+        if cls._path is not None:
+            cls._local.pop(f"{prefix}{key}", None)
+            cls._execute("DELETE FROM secrets WHERE key = ?", f"{prefix}{key}")
+
+    @classmethod
+    def _execute(cls, statement: str, *parameters: Any, raise_errors: bool = False) -> sqlite3.Cursor | None:
+        """Run ``statement`` on the shared store; errors only disable the cache for this lookup."""
+        try:
+            with cls._lock:
+                if cls._connection is None or cls._connection_pid != os.getpid():
+                    # SQLite connections must not be used across forks
+                    cls._connection = sqlite3.connect(
+                        cls._path, timeout=1, isolation_level=None, check_same_thread=False
+                    )
+                    cls._connection.execute("PRAGMA journal_mode=WAL")
+                    cls._connection.execute("PRAGMA synchronous=NORMAL")
+                    cls._connection_pid = os.getpid()
+                return cls._connection.execute(statement, parameters)
+        except sqlite3.Error:
+            if raise_errors:
+                raise
+            log.debug("Secrets cache query failed", exc_info=True)
+            return None
+
+    @staticmethod
+    def _encrypt(value: str | None) -> str | None:
+        from airflow.models.crypto import get_fernet
+
+        return None if value is None else get_fernet().encrypt(value.encode()).decode()
+
+    @staticmethod
+    def _decrypt(value: str | None) -> str | None:
+        from airflow.models.crypto import get_fernet
+
+        return None if value is None else get_fernet().decrypt(value.encode()).decode()
+
+    @classmethod
+    def _incr(cls, result: str, prefix: str) -> None:
+        kind = "variable" if prefix == cls._VARIABLE_PREFIX else "connection"
+        Stats.incr(f"secrets.cache.{result}.{kind}")
+        Stats.incr(f"secrets.cache.{result}", tags={"kind": kind})
@@ -21,7 +21,6 @@ from __future__ import annotations
 import collections.abc
 import datetime
 import enum
-import inspect
 import logging
 import warnings
 import weakref
@@ -31,6 +30,7 @@ from typing import TYPE_CHECKING, Any, Collection, Iterable, Mapping, NamedTuple
 
 import attrs
 import lazy_object_proxy
+import pendulum
 from dateutil import relativedelta
 from pendulum.tz.timezone import FixedTimezone, Timezone
 
@@ -79,6 +79,7 @@ from airflow.task.priority_strategy import (
     airflow_priority_weight_strategies_classes,
 )
 from airflow.triggers.base import BaseTrigger, StartTriggerArgs
+from airflow.utils import json as json_utils
 from airflow.utils.code_utils import get_python_source
 from airflow.utils.context import (
     ConnectionAccessor,
@@ -505,6 +506,10 @@ def add_pydantic_class_type_mapping(attribute_type: str, orm_class, pydantic_cla
     _class_to_type[orm_class] = attribute_type
 
 
+# Types serialized as they are, compared exactly: subclasses such as enums are handled separately
+_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 class BaseSerialization:
     """BaseSerialization provides utils for serialization."""
 
@@ -544,7 +549,7 @@ class BaseSerialization:
     @classmethod
     def from_json(cls, serialized_obj: str) -> BaseSerialization | dict | list | set | tuple:
         """Deserialize json_str and reconstructs all DAGs and operators it contains."""
-        return cls.from_dict(json.loads(serialized_obj))
+        return cls.from_dict(json_utils.loads(serialized_obj))
 
     @classmethod
     def from_dict(cls, serialized_obj: dict[Encoding, Any]) -> BaseSerialization | dict | list | set | tuple:
@@ -595,6 +600,9 @@ class BaseSerialization:
         serialized_object: dict[str, Any] = {}
         keys_to_serialize = object_to_serialize.get_serialized_fields()
         for key in keys_to_serialize:
+            if key == "params":
+                # Serialized with _serialize_params_dict by the callers
+                continue
             # None is ignored in serialized form and is added back in deserialization.
             value = getattr(object_to_serialize, key, None)
             if cls._is_excluded(value, key, object_to_serialize):
@@ -641,21 +649,22 @@ class BaseSerialization:
                 "Setting use_pydantic_models = True requires AIP-44 (in progress) feature flag to be true. "
                 "This parameter will be removed eventually when new serialization is used by AIP-44"
             )
+        var_type = type(var)
+        if var_type in _JSON_TYPES:
+            return var
+        serializer = cls._SERIALIZERS_BY_TYPE.get(var_type)
+        if serializer is not None:
+            return getattr(cls, serializer)(var, strict=strict, use_pydantic_models=use_pydantic_models)
+
         if cls._is_primitive(var):
             # enum.IntEnum is an int instance, it causes json dumps error so we use its value.
             if isinstance(var, enum.Enum):
                 return var.value
             return var
         elif isinstance(var, dict):
-            return cls._encode(
-                {
-                    str(k): cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models)
-                    for k, v in var.items()
-                },
-                type_=DAT.DICT,
-            )
+            return cls._serialize_dict(var, strict=strict, use_pydantic_models=use_pydantic_models)
         elif isinstance(var, list):
-            return [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var]
+            return cls._serialize_list(var, strict=strict, use_pydantic_models=use_pydantic_models)
         elif var.__class__.__name__ == "V1Pod" and _has_kubernetes() and isinstance(var, k8s.V1Pod):
             json_pod = PodGenerator.serialize_pod(var)
             return cls._encode(json_pod, type_=DAT.POD)
@@ -679,9 +688,9 @@ class BaseSerialization:
             var._needs_expansion = var.get_needs_expansion()
             return cls._encode(SerializedBaseOperator.serialize_operator(var), type_=DAT.OP)
         elif isinstance(var, cls._datetime_types):
-            return cls._encode(var.timestamp(), type_=DAT.DATETIME)
+            return cls._serialize_datetime(var)
         elif isinstance(var, datetime.timedelta):
-            return cls._encode(var.total_seconds(), type_=DAT.TIMEDELTA)
+            return cls._serialize_timedelta(var)
         elif isinstance(var, (Timezone, FixedTimezone)):
             return cls._encode(encode_timezone(var), type_=DAT.TIMEZONE)
         elif isinstance(var, relativedelta.relativedelta):
@@ -718,25 +727,9 @@ class BaseSerialization:
         elif callable(var):
             return str(get_python_source(var))
         elif isinstance(var, set):
-            # FIXME: casts set to list in customized serialization in future.
-            try:
-                return cls._encode(
-                    sorted(
-                        cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var
-                    ),
-                    type_=DAT.SET,
-                )
-            except TypeError:
-                return cls._encode(
-                    [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var],
-                    type_=DAT.SET,
-                )
+            return cls._serialize_set(var, strict=strict, use_pydantic_models=use_pydantic_models)
         elif isinstance(var, tuple):
-            # FIXME: casts tuple to list in customized serialization in future.
-            return cls._encode(
-                [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var],
-                type_=DAT.TUPLE,
-            )
+            return cls._serialize_tuple(var, strict=strict, use_pydantic_models=use_pydantic_models)
         elif isinstance(var, TaskGroup):
             return TaskGroupSerialization.serialize_task_group(var)
         elif isinstance(var, Param):
@@ -784,6 +777,63 @@ class BaseSerialization:
         else:
             return cls.default_serialization(strict, var)
 
+    @classmethod
+    def _serialize_dict(cls, var: dict, *, strict: bool, use_pydantic_models: bool) -> dict[Encoding, Any]:
+        return cls._encode(
+            {
+                str(k): cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models)
+                for k, v in var.items()
+            },
+            type_=DAT.DICT,
+        )
+
+    @classmethod
+    def _serialize_list(cls, var: list, *, strict: bool, use_pydantic_models: bool) -> list:
+        return [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var]
+
+    @classmethod
+    def _serialize_set(cls, var: set, *, strict: bool, use_pydantic_models: bool) -> dict[Encoding, Any]:
+        # FIXME: casts set to list in customized serialization in future.
+        try:
+            return cls._encode(
+                sorted(cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var),
+                type_=DAT.SET,
+            )
+        except TypeError:
+            return cls._encode(
+                [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var],
+                type_=DAT.SET,
+            )
+
+    @classmethod
+    def _serialize_tuple(cls, var: tuple, *, strict: bool, use_pydantic_models: bool) -> dict[Encoding, Any]:
+        # FIXME: casts tuple to list in customized serialization in future.
+        return cls._encode(
+            [cls.serialize(v, strict=strict, use_pydantic_models=use_pydantic_models) for v in var],
+            type_=DAT.TUPLE,
+        )
+
+    @classmethod
+    def _serialize_datetime(cls, var: datetime.datetime, **kwargs) -> dict[Encoding, Any]:
+        return cls._encode(var.timestamp(), type_=DAT.DATETIME)
+
+    @classmethod
+    def _serialize_timedelta(cls, var: datetime.timedelta, **kwargs) -> dict[Encoding, Any]:
+        return cls._encode(var.total_seconds(), type_=DAT.TIMEDELTA)
+
+    # The serializer of the types whose serialization only depends on their type, by exact type, so that the
+    # most common values skip the isinstance checks of serialize; subclasses of these types still go through
+    # them, as they can be handled differently.
+    _SERIALIZERS_BY_TYPE: dict[type, str] = {
+        dict: "_serialize_dict",
+        list: "_serialize_list",
+        set: "_serialize_set",
+        tuple: "_serialize_tuple",
+        datetime.datetime: "_serialize_datetime",
+        pendulum.DateTime: "_serialize_datetime",
+        datetime.timedelta: "_serialize_timedelta",
+    }
+
     @classmethod
     def default_serialization(cls, strict, var) -> str:
         log.debug("Cast type %s to str in serialization.", type(var))
@@ -931,7 +981,9 @@ class BaseSerialization:
         ``field = field or {}`` set.
         """
         if attrname in cls._CONSTRUCTOR_PARAMS and (
-            cls._CONSTRUCTOR_PARAMS[attrname] is value or (value in [{}, []])
+            cls._CONSTRUCTOR_PARAMS[attrname] is value
+            # Only empty values are compared: comparing a ParamsDict resolves all its params
+            or ((not isinstance(value, collections.abc.Sized) or not len(value)) and value in [{}, []])
         ):
             return True
         return False
@@ -1093,6 +1145,9 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         if v.default is not v.empty
     }
 
+    # BaseOperator fields which cannot be templated, though some of them are allowed anyway
+    _FORBIDDEN_TEMPLATE_FIELDS = frozenset(signature(BaseOperator.__init__).parameters) - {"email"}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # task_type is used by UI to display the correct class type, because UI only
@@ -1187,12 +1242,9 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         # Store all template_fields as they are if there are JSON Serializable
         # If not, store them as strings
         # And raise an exception if the field is not templateable
-        forbidden_fields = set(inspect.signature(BaseOperator.__init__).parameters.keys())
-        # Though allow some of the BaseOperator fields to be templated anyway
-        forbidden_fields.difference_update({"email"})
         if op.template_fields:
             for template_field in op.template_fields:
-                if template_field in forbidden_fields:
+                if template_field in cls._FORBIDDEN_TEMPLATE_FIELDS:
                     raise AirflowException(
                         dedent(
                             f"""Cannot template BaseOperator field:
@@ -1244,16 +1296,18 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         done in ``set_task_dag_references`` instead, which is called after the
         DAG is hydrated.
         """
-        if "label" not in encoded_op:
-            # Handle deserialization of old data before the introduction of TaskGroup
-            encoded_op["label"] = encoded_op["task_id"]
+        if "label" not in encoded_op or "_operator_name" not in encoded_op:
+            # Handle deserialization of old data before the introduction of TaskGroup and operator names,
+            # without modifying the serialized DAG, which may be shared
+            encoded_op = {
+                "label": encoded_op["task_id"],
+                "_operator_name": encoded_op["_task_type"],
+                **encoded_op,
+            }
 
         # Extra Operator Links defined in Plugins
         op_extra_links_from_plugin = {}
 
-        if "_operator_name" not in encoded_op:
-            encoded_op["_operator_name"] = encoded_op["_task_type"]
-
         # We don't want to load Extra Operator links in Scheduler
         if cls._load_operator_extra_links:
             from airflow import plugins_manager
@@ -1366,13 +1420,15 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         setattr(op, "start_from_trigger", bool(encoded_op.get("start_from_trigger", False)))
 
     @staticmethod
-    def set_task_dag_references(task: Operator, dag: DAG) -> None:
+    def set_task_dag_references(task: Operator, dag: DAG, set_upstream: bool = True) -> None:
         """
         Handle DAG references on an operator.
 
         The operator should have been mostly populated earlier by calling
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
+
+        :param set_upstream: Whether to add the task to the upstream tasks of its downstream tasks
         """
         task.dag = dag
 
@@ -1388,6 +1444,8 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
+        if not set_upstream:
+            return
         for task_id in task.downstream_task_ids:
             # Bypass set_upstream etc here - it does more than we want
             dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
@@ -1682,13 +1740,20 @@ class SerializedDAG(DAG, BaseSerialization):
             raise SerializationError(f"Failed to serialize DAG {dag.dag_id!r}: {e}")
 
     @classmethod
-    def deserialize_dag(cls, encoded_dag: dict[str, Any]) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+    def deserialize_dag(cls, encoded_dag: dict[str, Any], *, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy: Only deserialize each task when it is first accessed, rather than all of them now
+        """
         dag = SerializedDAG(dag_id=encoded_dag["_dag_id"], schedule=None)
 
         for k, v in encoded_dag.items():
             if k == "_downstream_task_ids":
                 v = set(v)
+            elif k == "tasks" and lazy:
+                k = "task_dict"
+                v = _LazyTaskDict(v, dag, load_op_links=cls._load_operator_extra_links)
             elif k == "tasks":
                 SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
                 tasks = {}
@@ -1754,8 +1819,9 @@ class SerializedDAG(DAG, BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for task in dag.task_dict.values():
-            SerializedBaseOperator.set_task_dag_references(task, dag)
+        if not lazy:
+            for task in dag.task_dict.values():
+                SerializedBaseOperator.set_task_dag_references(task, dag)
 
         return dag
 
@@ -1777,12 +1843,16 @@ class SerializedDAG(DAG, BaseSerialization):
         return json_dict
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, *, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy: Only deserialize each operator when it is first accessed, rather than all of them now
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver != cls.SERIALIZER_VERSION:
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
-        return cls.deserialize_dag(serialized_obj["dag"])
+        return cls.deserialize_dag(serialized_obj["dag"], lazy=lazy)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -1853,14 +1923,24 @@ class TaskGroupSerialization(BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: (
-                set_ref(task_dict[val])
-                if _type == DAT.OP
-                else cls.deserialize_task_group(val, group, task_dict, dag=dag)
-            )
-            for label, (_type, val) in encoded_group["children"].items()
-        }
+        if isinstance(task_dict, _LazyTaskDict):
+            children: dict[str, str | TaskGroup] = {}
+            for label, (_type, val) in encoded_group["children"].items():
+                if _type == DAT.OP:
+                    task_dict.set_task_group(val, group)
+                    children[label] = val
+                else:
+                    children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+            group.children = _LazyTaskGroupChildren(children, task_dict)  # type: ignore[assignment]
+        else:
+            group.children = {
+                label: (
+                    set_ref(task_dict[val])
+                    if _type == DAT.OP
+                    else cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                )
+                for label, (_type, val) in encoded_group["children"].items()
+            }
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
@@ -1868,6 +1948,114 @@ class TaskGroupSerialization(BaseSerialization):
         return group
 
 
+class _LazyTaskDict(collections.abc.MutableMapping):
+    """
+    The ``task_dict`` of a DAG deserialized lazily.
+
+    It holds the serialized tasks by task id, and only deserializes a task the first time it is accessed,
+    so that using a few tasks of a large DAG does not pay for deserializing all of them. The relationships
+    that ``set_task_dag_references`` sets from the other tasks are indexed upfront from the serialized
+    tasks instead.
+    """
+
+    def __init__(self, encoded_tasks: list[dict[str, Any]], dag: SerializedDAG, load_op_links: bool):
+        # Serialized task, until it is deserialized and replaced by the operator
+        self._entries: dict[str, dict[str, Any] | Operator] = {}
+        self._upstream_task_ids: dict[str, set[str]] = collections.defaultdict(set)
+        for obj in encoded_tasks:
+            encoded_op = obj[Encoding.VAR] if obj.get(Encoding.TYPE) == DAT.OP else obj
+            self._entries[encoded_op["task_id"]] = encoded_op
+            # _downstream_task_ids is the name in old serialized DAGs
+            for downstream_task_id in (
+                encoded_op.get("downstream_task_ids") or encoded_op.get("_downstream_task_ids") or ()
+            ):
+                self._upstream_task_ids[downstream_task_id].add(encoded_op["task_id"])
+        self._task_groups: dict[str, TaskGroup] = {}
+        self._dag = dag
+        self._load_op_links = load_op_links
+
+    def set_task_group(self, task_id: str, group: TaskGroup) -> None:
+        """Set the group of a task, when it is deserialized."""
+        self._task_groups[task_id] = group
+        task = self._entries.get(task_id)
+        if task is not None and not isinstance(task, dict):
+            task.task_group = weakref.proxy(group)
+
+    def __getitem__(self, task_id: str) -> Operator:
+        task = self._entries[task_id]
+        if not isinstance(task, dict):
+            return task
+        SerializedBaseOperator._load_operator_extra_links = self._load_op_links
+        op = SerializedBaseOperator.deserialize_operator(task)
+        self._entries[task_id] = op
+        SerializedBaseOperator.set_task_dag_references(op, self._dag, set_upstream=False)
+        op.upstream_task_ids.update(self._upstream_task_ids.get(task_id, ()))
+        if task_id in self._task_groups:
+            op.task_group = weakref.proxy(self._task_groups[task_id])
+        return op
+
+    def __setitem__(self, task_id: str, task: Operator) -> None:
+        self._entries[task_id] = task
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._entries[task_id]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._entries
+
+    def __copy__(self) -> dict[str, Operator]:
+        # A lazy copy would deserialize tasks again, as different operators
+        return dict(self.items())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Operator]:
+        import copy
+
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
+class _LazyTaskGroupChildren(collections.abc.MutableMapping):
+    """The ``children`` of a task group of a lazily deserialized DAG, with tasks resolved by their id."""
+
+    def __init__(self, children: dict[str, str | TaskGroup], task_dict: Mapping[str, Operator]):
+        # Task id of the task children, or the task group
+        self._children = children
+        self._task_dict = task_dict
+
+    def __getitem__(self, label: str) -> DAGNode:
+        child = self._children[label]
+        return self._task_dict[child] if isinstance(child, str) else child
+
+    def __setitem__(self, label: str, child: DAGNode) -> None:
+        self._children[label] = child  # type: ignore[assignment]
+
+    def __delitem__(self, label: str) -> None:
+        del self._children[label]
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._children
+
+    def __copy__(self) -> _LazyTaskGroupChildren:
+        return _LazyTaskGroupChildren(dict(self._children), self._task_dict)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
 def _has_kubernetes() -> bool:
     global HAS_KUBERNETES
     if "HAS_KUBERNETES" in globals():
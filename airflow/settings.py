@@ -820,6 +820,13 @@ MIN_SERIALIZED_DAG_UPDATE_INTERVAL = conf.getint("core", "min_serialized_dag_upd
 # If set to True, serialized DAGs is compressed before writing to DB,
 COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
 
+# If set to True, the tasks of serialized DAGs are stored in a separate table, once per distinct task,
+# and the serialized_dag table only holds a manifest referencing them.
+CHUNK_SERIALIZED_DAGS = conf.getboolean("core", "chunk_serialized_dags", fallback=False)
+
+# If set to True, the tasks of DAGs read from the DB are only deserialized when they are first used.
+LAZY_DESERIALIZE_DAG_TASKS = conf.getboolean("core", "lazy_deserialize_dag_tasks", fallback=True)
+
 # Fetching serialized DAG can not be faster than a minimum interval to reduce database
 # read rate. This config controls when your DAGs are updated in the Webserver
 MIN_SERIALIZED_DAG_FETCH_INTERVAL = conf.getint("core", "min_serialized_dag_fetch_interval", fallback=10)
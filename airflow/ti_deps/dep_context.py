@@ -17,7 +17,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import attr
 
@@ -66,6 +66,9 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param precompute_upstream_states: Count the states of ``finished_tis`` per task once, and evaluate
+        trigger rules of task instances outside mapped task groups from those counts instead of
+        scanning all finished task instances for every task instance
     """
 
     deps: set = attr.ib(factory=set)
@@ -79,11 +82,15 @@ class DepContext:
     ignore_ti_state: bool = False
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
+    precompute_upstream_states: bool = False
     description: str | None = None
 
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    finished_ti_states_cache: Any = attr.ib(default=None, init=False, repr=False, eq=False)
+    """Per-task state counts of ``finished_tis``, maintained by ``TriggerRuleDep``"""
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -19,8 +19,8 @@ from __future__ import annotations
 
 import collections.abc
 import functools
-from collections import Counter
-from typing import TYPE_CHECKING, Iterator, KeysView, NamedTuple
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Iterable, Iterator, KeysView, NamedTuple
 
 from sqlalchemy import and_, func, or_, select
 
@@ -86,6 +86,33 @@ class _UpstreamTIStates(NamedTuple):
             skipped_setup=setup_counter.get(TaskInstanceState.SKIPPED, 0),
         )
 
+    @classmethod
+    def sum_of(
+        cls, states_by_task: dict[str, _UpstreamTIStates], task_ids: Iterable[str]
+    ) -> _UpstreamTIStates:
+        """
+        Add up precomputed per-task states for the given upstream tasks.
+
+        :param states_by_task: states of the finished tis of each task, as built by ``states_by_task``
+        :param task_ids: ids of the upstream tasks to take into account
+        """
+        totals = [0] * len(cls._fields)
+        for task_id in task_ids:
+            task_states = states_by_task.get(task_id)
+            if task_states is None:
+                continue
+            for i, count in enumerate(task_states):
+                totals[i] += count
+        return cls._make(totals)
+
+    @classmethod
+    def states_by_task(cls, finished_tis: Iterable[TaskInstance]) -> dict[str, _UpstreamTIStates]:
+        """Count the states of all finished tis of a dag run, once for each task."""
+        tis_by_task: dict[str, list[TaskInstance]] = defaultdict(list)
+        for ti in finished_tis:
+            tis_by_task[ti.task_id].append(ti)
+        return {task_id: cls.calculate(iter(tis)) for task_id, tis in tis_by_task.items()}
+
 
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
@@ -201,6 +228,32 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
+        def _calculate_upstream_states(relevant_ids: set[str] | KeysView[str]) -> _UpstreamTIStates:
+            """
+            Count the states of the finished relevant upstream tis of the current ti.
+
+            When ``precompute_upstream_states`` is set and the current task is not in a mapped task
+            group, every ti of a relevant upstream task is relevant, so the counts are added up from
+            per-task counts computed once for the whole dag run instead of scanning all finished tis.
+            """
+            if TYPE_CHECKING:
+                assert ti.task
+
+            finished_tis = dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+            if dep_context.precompute_upstream_states and ti.task.get_closest_mapped_task_group() is None:
+                # finished_tis may be extended by the caller between evaluations, e.g. after expansion.
+                cache = dep_context.finished_ti_states_cache
+                if cache is None or cache[0] is not finished_tis or cache[1] != len(finished_tis):
+                    states_by_task = _UpstreamTIStates.states_by_task(finished_tis)
+                    dep_context.finished_ti_states_cache = (finished_tis, len(finished_tis), states_by_task)
+                else:
+                    states_by_task = cache[2]
+                return _UpstreamTIStates.sum_of(states_by_task, relevant_ids)
+
+            return _UpstreamTIStates.calculate(
+                x for x in finished_tis if _is_relevant_upstream(upstream=x, relevant_ids=relevant_ids)
+            )
+
         def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnOperators]:
             # Optimization: If the current task is not in a mapped task group,
             # it depends on all upstream task instances.
@@ -249,12 +302,7 @@ class TriggerRuleDep(BaseTIDep):
             task = ti.task
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(relevant_ids=indirect_setups.keys())
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -341,12 +389,7 @@ class TriggerRuleDep(BaseTIDep):
             upstream_tasks = {t.task_id: t for t in task.upstream_list}
             trigger_rule = task.trigger_rule
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=ti.task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(relevant_ids=ti.task.upstream_task_ids)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
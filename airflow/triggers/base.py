@@ -62,6 +62,13 @@ class BaseTrigger(abc.ABC, LoggingMixin):
     let them be re-instantiated elsewhere.
     """
 
+    supports_coalescing: bool = False
+    """
+    Whether triggers of this class with the same kwargs can share a single run in the triggerer.
+
+    Only set this if ``run`` depends on nothing but the kwargs, and has no side effects.
+    """
+
     def __init__(self, **kwargs):
         # these values are set by triggerer when preparing to run the instance
         # when run, they are injected into logger record.
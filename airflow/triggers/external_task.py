@@ -55,6 +55,8 @@ class WorkflowTrigger(BaseTrigger):
     :param soft_fail: If True, the trigger will not fail the entire DAG on external task failure.
     """
 
+    supports_coalescing = True
+
     def __init__(
         self,
         external_dag_id: str,
@@ -262,6 +264,8 @@ class DagStateTrigger(BaseTrigger):
         The default value is 5.0 sec.
     """
 
+    supports_coalescing = True
+
     def __init__(
         self,
         dag_id: str,
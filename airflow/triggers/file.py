@@ -38,6 +38,8 @@ class FileTrigger(BaseTrigger):
     :param poke_interval: Time that the job should wait in between each try
     """
 
+    supports_coalescing = True
+
     def __init__(
         self,
         filepath: str,
@@ -40,6 +40,8 @@ class DateTimeTrigger(BaseTrigger):
         reached or resume the task after time condition reached.
     """
 
+    supports_coalescing = True
+
     def __init__(self, moment: datetime.datetime, *, end_from_trigger: bool = False) -> None:
         super().__init__()
         if not isinstance(moment, datetime.datetime):
@@ -78,12 +80,15 @@ class DateTimeTrigger(BaseTrigger):
         while self.moment > pendulum.instance(timezone.utcnow()):
             self.log.info("sleeping 1 second...")
             await asyncio.sleep(1)
+        yield self.get_event()
+
+    def get_event(self) -> TriggerEvent:
+        """Return the event fired once the moment is reached."""
         if self.end_from_trigger:
             self.log.info("Sensor time condition reached; marking task successful and exiting")
-            yield TaskSuccessEvent()
-        else:
-            self.log.info("yielding event with payload %r", self.moment)
-            yield TriggerEvent(self.moment)
+            return TaskSuccessEvent()
+        self.log.info("yielding event with payload %r", self.moment)
+        return TriggerEvent(self.moment)
 
 
 class TimeDeltaTrigger(DateTimeTrigger):
@@ -120,6 +120,7 @@ _REVISION_HEADS_MAP = {
     "2.9.2": "686269002441",
     "2.10.0": "22ed7efa9da2",
     "2.10.3": "5f2621c13b39",
+    "2.10.5": "e7a1c3f9b852",
 }
 
 
@@ -936,9 +937,11 @@ def check_and_run_migrations():
 
 def _reserialize_dags(*, session: Session) -> None:
     from airflow.models.dagbag import DagBag
-    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.models.serialized_dag import SerializedDagChunk, SerializedDagChunkRef, SerializedDagModel
 
     session.execute(delete(SerializedDagModel).execution_options(synchronize_session=False))
+    session.execute(delete(SerializedDagChunkRef).execution_options(synchronize_session=False))
+    session.execute(delete(SerializedDagChunk).execution_options(synchronize_session=False))
     dagbag = DagBag(collect_dags=False)
     dagbag.collect_dags(only_if_updated=False)
     dagbag.sync_to_db(session=session)
@@ -24,13 +24,15 @@ See:
 from __future__ import annotations
 
 import csv
+import gzip
 import logging
 import os
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, column, false, func, inspect, select, table, text
+from sqlalchemy import and_, column, false, func, inspect, or_, select, table, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
@@ -142,25 +144,38 @@ def _check_for_rows(*, query: Query, print_rows=False):
     return num_entities
 
 
+EXPORT_BATCH_SIZE = 10_000
+"""Number of rows fetched at a time when exporting an archive table."""
+
+
 def _dump_table_to_file(*, target_table, file_path, export_format, session):
     if export_format == "csv":
-        with open(file_path, "w") as f:
-            csv_writer = csv.writer(f)
-            cursor = session.execute(text(f"SELECT * FROM {target_table}"))
-            csv_writer.writerow(cursor.keys())
-            csv_writer.writerows(cursor.fetchall())
+        open_file = open
+    elif export_format == "csv.gz":
+        open_file = gzip.open
     else:
         raise AirflowException(f"Export format {export_format} is not supported.")
+    # Stream the rows with a server-side cursor, rather than loading the whole table in memory
+    cursor = session.execute(text(f"SELECT * FROM {target_table}").execution_options(stream_results=True))
+    with open_file(file_path, "wt", newline="") as f:
+        csv_writer = csv.writer(f)
+        csv_writer.writerow(cursor.keys())
+        for rows in cursor.partitions(EXPORT_BATCH_SIZE):
+            csv_writer.writerows(rows)
 
 
-def _do_delete(*, query, orm_model, skip_archive, session):
+def _archive_table_name(table_name: str, timestamp: DateTime) -> str:
     import re2
 
+    timestamp_str = re2.sub(r"[^\d]", "", timestamp.isoformat())[:14]
+    return f"{ARCHIVE_TABLE_PREFIX}{table_name}__{timestamp_str}"
+
+
+def _do_delete(*, query, orm_model, skip_archive, session):
     print("Performing Delete...")
     # using bulk delete
     # create a new table and copy the rows there
-    timestamp_str = re2.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
-    target_table_name = f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}"
+    target_table_name = _archive_table_name(orm_model.name, timezone.utcnow())
     print(f"Moving data to table {target_table_name}")
     bind = session.get_bind()
     dialect_name = bind.dialect.name
@@ -203,6 +218,111 @@ def _do_delete(*, query, orm_model, skip_archive, session):
     print("Finished Performing Delete")
 
 
+def _do_delete_in_batches(
+    *,
+    orm_model,
+    recency_column,
+    keep_last,
+    keep_last_filters,
+    keep_last_group_by,
+    clean_before_timestamp,
+    num_rows,
+    batch_size,
+    max_rows_per_second,
+    skip_archive,
+    session,
+):
+    """
+    Archive and delete the rows in batches of at most ``batch_size`` rows, committing after each batch.
+
+    The rows are walked in primary key order, so each batch reads the key index from where the previous
+    one stopped. Every committed batch is final: if the clean is interrupted, running it again with the
+    same ``clean_before_timestamp`` carries on where it stopped, appending to the same archive table.
+    """
+    print(f"Performing Delete in batches of {batch_size} rows...")
+    bind = session.get_bind()
+    dialect_name = bind.dialect.name
+    source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+    pk_names = [col.name for col in source_table.primary_key.columns]
+    base_table = aliased(table(orm_model.name, *[column(col.name) for col in source_table.c]), name="base")
+    query = _build_query(
+        orm_model=orm_model,
+        recency_column=recency_column,
+        keep_last=keep_last,
+        keep_last_filters=keep_last_filters,
+        keep_last_group_by=keep_last_group_by,
+        clean_before_timestamp=clean_before_timestamp,
+        session=session,
+        base_table=base_table,
+    )
+    base_pk_cols = [base_table.c[name] for name in pk_names]
+    source_pk_cols = [source_table.c[name] for name in pk_names]
+    query = query.with_entities(*base_pk_cols).order_by(*base_pk_cols)
+
+    target_table = None
+    if not skip_archive:
+        # Named after the cutoff rather than the current time, so that a rerun resumes into the same table
+        target_table_name = _archive_table_name(orm_model.name, clean_before_timestamp)
+        if not inspect(bind).has_table(target_table_name):
+            if dialect_name == "mysql":
+                session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
+            else:
+                session.execute(CreateTableAs(target_table_name, select(source_table).where(false())))
+            session.commit()
+            print(f"Moving data to table {target_table_name}")
+        else:
+            print(f"Resuming, moving data to existing table {target_table_name}")
+        target_table = reflect_tables([target_table_name], session).tables[target_table_name]
+
+    last_key = None
+    deleted = 0
+    started_at = time.monotonic()
+    while True:
+        batch_query = query
+        if last_key is not None:
+            batch_query = batch_query.filter(_after_key(base_pk_cols, last_key))
+        keys = [tuple(row) for row in batch_query.limit(batch_size).all()]
+        if not keys:
+            break
+        last_key = keys[-1]
+        if len(source_pk_cols) == 1:
+            in_batch = source_pk_cols[0].in_([key[0] for key in keys])
+        else:
+            in_batch = tuple_(*source_pk_cols).in_(keys)
+        if target_table is not None:
+            session.execute(
+                target_table.insert().from_select(
+                    [col.name for col in source_table.c], select(source_table).where(in_batch)
+                )
+            )
+        session.execute(source_table.delete().where(in_batch))
+        session.commit()
+
+        deleted += len(keys)
+        elapsed = time.monotonic() - started_at
+        if max_rows_per_second:
+            # Hold the rate down to the target, averaged since the start
+            time.sleep(max(deleted / max_rows_per_second - elapsed, 0))
+            elapsed = time.monotonic() - started_at
+        print(
+            f"Deleted {deleted} of {num_rows} rows from {orm_model.name} "
+            f"({deleted / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+    print(f"Finished Performing Delete, {deleted} rows in {time.monotonic() - started_at:.1f}s")
+
+
+def _after_key(pk_cols, key):
+    """
+    Return the condition selecting the rows whose primary key is after ``key``.
+
+    Written as a disjunction rather than a tuple comparison, which not all databases support.
+    """
+    conditions = []
+    for i, col in enumerate(pk_cols):
+        conditions.append(and_(*[pk_cols[j] == key[j] for j in range(i)], col > key[i]))
+    return or_(*conditions)
+
+
 def _subquery_keep_last(*, recency_column, keep_last_filters, group_by_columns, max_date_colname, session):
     subquery = select(*group_by_columns, func.max(recency_column).label(max_date_colname))
 
@@ -240,10 +360,12 @@ def _build_query(
     keep_last_group_by,
     clean_before_timestamp,
     session,
+    base_table=None,
     **kwargs,
 ):
     base_table_alias = "base"
-    base_table = aliased(orm_model, name=base_table_alias)
+    if base_table is None:
+        base_table = aliased(orm_model, name=base_table_alias)
     query = session.query(base_table).with_entities(text(f"{base_table_alias}.*"))
     base_table_recency_col = base_table.c[recency_column.name]
     conditions = [base_table_recency_col < clean_before_timestamp]
@@ -280,6 +402,8 @@ def _cleanup_table(
     dry_run=True,
     verbose=False,
     skip_archive=False,
+    batch_size=None,
+    max_rows_per_second=None,
     session,
     **kwargs,
 ):
@@ -300,7 +424,22 @@ def _cleanup_table(
     num_rows = _check_for_rows(query=query, print_rows=False)
 
     if num_rows and not dry_run:
-        _do_delete(query=query, orm_model=orm_model, skip_archive=skip_archive, session=session)
+        if batch_size:
+            _do_delete_in_batches(
+                orm_model=orm_model,
+                recency_column=recency_column,
+                keep_last=keep_last,
+                keep_last_filters=keep_last_filters,
+                keep_last_group_by=keep_last_group_by,
+                clean_before_timestamp=clean_before_timestamp,
+                num_rows=num_rows,
+                batch_size=batch_size,
+                max_rows_per_second=max_rows_per_second,
+                skip_archive=skip_archive,
+                session=session,
+            )
+        else:
+            _do_delete(query=query, orm_model=orm_model, skip_archive=skip_archive, session=session)
 
     session.commit()
 
@@ -399,6 +538,8 @@ def run_cleanup(
     verbose: bool = False,
     confirm: bool = True,
     skip_archive: bool = False,
+    batch_size: int | None = None,
+    max_rows_per_second: int | None = None,
     session: Session = NEW_SESSION,
 ):
     """
@@ -418,6 +559,10 @@ def run_cleanup(
     :param verbose: If true, may provide more detailed output.
     :param confirm: Require user input to confirm before processing deletions.
     :param skip_archive: Set to True if you don't want the purged rows preservied in an archive table.
+    :param batch_size: Optional. Archive and delete at most this many rows per transaction, so that an
+        interrupted cleanup keeps the batches already done and can be run again to finish.
+    :param max_rows_per_second: Optional. With ``batch_size``, wait between batches to delete at most
+        this many rows per second.
     :param session: Session representing connection to the metadata database.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
@@ -441,6 +586,8 @@ def run_cleanup(
                     verbose=verbose,
                     **table_config.__dict__,
                     skip_archive=skip_archive,
+                    batch_size=batch_size,
+                    max_rows_per_second=max_rows_per_second,
                     session=session,
                 )
                 session.commit()
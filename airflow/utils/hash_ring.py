@@ -0,0 +1,58 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import bisect
+from typing import Generic, Iterable, TypeVar
+
+from airflow.utils.hashlib_wrapper import md5
+
+T = TypeVar("T")
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing(Generic[T]):
+    """
+    Consistent hash ring assigning string keys to a set of nodes.
+
+    Each node is placed on the ring ``replicas`` times, so keys are spread evenly and adding or
+    removing a node only moves the keys of that node. The hash is stable across processes, so
+    every process building a ring from the same nodes agrees on the owner of each key.
+
+    :param nodes: The nodes to distribute keys over. Their ``str()`` must be unique.
+    :param replicas: Number of points each node gets on the ring.
+    """
+
+    def __init__(self, nodes: Iterable[T], replicas: int = 64) -> None:
+        points = sorted((_hash(f"{node}-{i}"), node) for node in set(nodes) for i in range(replicas))
+        self.nodes = frozenset(node for _, node in points)
+        self._hashes = [h for h, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get_node(self, key: str) -> T:
+        """Return the node owning ``key``."""
+        if not self._nodes:
+            raise ValueError("Cannot look up a key in an empty hash ring")
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
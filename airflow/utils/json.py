@@ -17,16 +17,87 @@
 # under the License.
 from __future__ import annotations
 
+import functools
 import json
+import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 
 from flask.json.provider import JSONProvider
 
-from airflow.serialization.serde import CLASSNAME, DATA, SCHEMA_ID, deserialize, serialize
+from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
+from airflow.serialization.serde import CLASSNAME, DATA, OLD_TYPE, SCHEMA_ID, deserialize, serialize
 from airflow.utils.timezone import convert_to_utc, is_naive
 
+log = logging.getLogger(__name__)
+
+# Integers with 19 digits or more may not fit in 64 bits, which orjson and msgspec decode as floats. They
+# are found by turning all digits into zeros, which is much faster than a regular expression.
+_DIGITS_TO_ZERO = bytes.maketrans(b"0123456789", b"0" * 10)
+_LONG_INTEGER = b"0" * 19
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fast_loads() -> tuple[Callable[[bytes], Any], type[Exception]] | None:
+    """Return the ``loads`` function of the JSON library set in ``[core] json_library``, and its error."""
+    library = conf.get("core", "json_library", fallback="auto")
+    if library not in ("auto", "orjson", "msgspec", "json"):
+        raise AirflowConfigException(
+            f"Invalid [core] json_library {library!r}: expected one of auto, orjson, msgspec or json"
+        )
+    if library in ("auto", "orjson"):
+        try:
+            import orjson
+
+            return orjson.loads, orjson.JSONDecodeError
+        except ImportError:
+            if library == "orjson":
+                log.warning("[core] json_library is orjson but it is not installed, using json instead")
+    if library in ("auto", "msgspec"):
+        try:
+            import msgspec
+
+            return msgspec.json.decode, msgspec.DecodeError
+        except ImportError:
+            if library == "msgspec":
+                log.warning("[core] json_library is msgspec but it is not installed, using json instead")
+    return None
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document, with the library set in ``[core] json_library``.
+
+    orjson and msgspec reject some documents the ``json`` module accepts, such as ``NaN``, and decode
+    integers over 64 bits as floats; those documents are parsed with ``settings.json`` instead, so the
+    result does not depend on the library.
+    """
+    from airflow.settings import json as settings_json
+
+    fast_loads = _get_fast_loads()
+    if fast_loads is not None:
+        raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+        if _LONG_INTEGER not in raw.translate(_DIGITS_TO_ZERO):
+            try:
+                return fast_loads[0](raw)
+            except fast_loads[1]:
+                pass
+    return settings_json.loads(data)
+
+
+def loads_xcom(data: bytes, object_hook: Callable[[dict], object] | None = None) -> Any:
+    """
+    Parse a JSON document written with ``XComEncoder``, with ``XComDecoder``.
+
+    ``XComDecoder`` leaves dicts holding no serialized object as they are, so the documents without any are
+    parsed with ``loads``, which does not call back into Python for every dict.
+    """
+    if CLASSNAME.encode() not in data and OLD_TYPE.encode() not in data and b"\\u" not in data:
+        return loads(data)
+    return json.loads(data.decode("UTF-8"), cls=XComDecoder, object_hook=object_hook)
+
 
 class AirflowJsonProvider(JSONProvider):
     """JSON Provider for Flask app to use WebEncoder."""
@@ -0,0 +1,193 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Sidecar index of task log files, to read them by line or byte range without loading them whole."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+import pendulum
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_STRIDE = 1000
+"""Number of lines between two checkpoints of the index."""
+
+_INDEX_VERSION = 1
+
+
+class LogFileIndex:
+    """
+    Sparse index of the lines of a log file, kept next to it.
+
+    Every ``INDEX_STRIDE`` lines, the index records the byte offset of the line and the timestamp of the
+    last log record before it, so reading from any line only scans at most ``INDEX_STRIDE`` lines before
+    it. The index is built on first read and extended as the file grows. It is saved as a hidden
+    ``.<name>.index`` file next to the log when the directory is writable, and only kept in memory
+    otherwise.
+
+    :param path: Path of the log file
+    :param parse_timestamp: Returns the timestamp of a log line, or raises if the line has none
+    """
+
+    def __init__(self, path: Path, parse_timestamp: Callable[[str], Any]):
+        self.path = path
+        self.index_path = path.with_name(f".{path.name}.index")
+        self.parse_timestamp = parse_timestamp
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        self.inode = 0
+        # Indexed bytes, up to the end of the last complete line
+        self.size = 0
+        self.line_count = 0
+        self.timestamp: Any = None
+        # Offset, and timestamp before it, of lines 0, INDEX_STRIDE, 2 * INDEX_STRIDE...
+        self.checkpoints: list[tuple[int, str | None]] = []
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text())
+            if data["version"] != _INDEX_VERSION or data["stride"] != INDEX_STRIDE:
+                return
+            self.inode = data["inode"]
+            self.size = data["size"]
+            self.line_count = data["line_count"]
+            self.timestamp = pendulum.parse(data["timestamp"]) if data["timestamp"] else None
+            self.checkpoints = [tuple(checkpoint) for checkpoint in data["checkpoints"]]  # type: ignore[misc]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+
+    def _save(self) -> None:
+        data = {
+            "version": _INDEX_VERSION,
+            "stride": INDEX_STRIDE,
+            "inode": self.inode,
+            "size": self.size,
+            "line_count": self.line_count,
+            "timestamp": self._format_timestamp(self.timestamp),
+            "checkpoints": self.checkpoints,
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=self.index_path.name)
+        except OSError:
+            logger.debug("Could not save the index of %s", self.path, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            logger.debug("Could not save the index of %s", self.path, exc_info=True)
+            with suppress(OSError):
+                os.unlink(tmp_path)
+
+    @staticmethod
+    def _format_timestamp(timestamp: Any) -> str | None:
+        return timestamp.isoformat() if timestamp is not None else None
+
+    def update(self) -> None:
+        """Index the lines added to the file since the last update, or all of them if it was replaced."""
+        stat = self.path.stat()
+        if stat.st_ino != self.inode or stat.st_size < self.size:
+            self._reset()
+            self.inode = stat.st_ino
+        if stat.st_size == self.size:
+            return
+        offset = self.size
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break
+                if self.line_count % INDEX_STRIDE == 0:
+                    self.checkpoints.append((offset, self._format_timestamp(self.timestamp)))
+                self.timestamp = self._next_timestamp(self._decode(raw_line), self.timestamp)
+                offset += len(raw_line)
+                self.line_count += 1
+        self.size = offset
+        self._save()
+
+    def _next_timestamp(self, line: str, timestamp: Any) -> Any:
+        if line:
+            with suppress(Exception):
+                return self.parse_timestamp(line) or timestamp
+        return timestamp
+
+    @staticmethod
+    def _decode(raw_line: bytes) -> str:
+        return raw_line.decode(errors="replace").rstrip("\r\n")
+
+    def iter_records(
+        self, start: int = 0, stop: int | None = None, *, complete_only: bool = True
+    ) -> Iterator[tuple[Any, int, str]]:
+        """
+        Yield the timestamp, number and content of lines ``start`` to ``stop`` of the file.
+
+        The timestamp of a line is the timestamp of the last line before it which has one, as
+        ``_parse_timestamps_in_log_file`` does.
+
+        :param complete_only: Do not yield the last line if it does not end with a newline yet
+        """
+        self.update()
+        checkpoint = min(start // INDEX_STRIDE, len(self.checkpoints) - 1)
+        if checkpoint < 0:
+            offset, timestamp, number = 0, None, 0
+        else:
+            offset, timestamp_str = self.checkpoints[checkpoint]
+            timestamp = pendulum.parse(timestamp_str) if timestamp_str else None
+            number = checkpoint * INDEX_STRIDE
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw_line in f:
+                if stop is not None and number >= stop:
+                    return
+                if complete_only and not raw_line.endswith(b"\n"):
+                    return
+                line = self._decode(raw_line)
+                timestamp = self._next_timestamp(line, timestamp)
+                if number >= start:
+                    yield timestamp, number, line
+                number += 1
+
+    def line_offset(self, line: int) -> int:
+        """Return the byte offset of ``line``, or the indexed size of the file if it has fewer lines."""
+        self.update()
+        if line >= self.line_count:
+            return self.size
+        offset, _ = self.checkpoints[line // INDEX_STRIDE]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for _ in range(line % INDEX_STRIDE):
+                offset += len(f.readline())
+        return offset
+
+    def read_bytes(self, start: int, stop: int | None = None) -> bytes:
+        """Return bytes ``start`` to ``stop`` of the file."""
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read() if stop is None else f.read(max(stop - start, 0))
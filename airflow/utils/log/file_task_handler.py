@@ -19,7 +19,9 @@
 
 from __future__ import annotations
 
+import heapq
 import inspect
+import itertools
 import logging
 import os
 import warnings
@@ -27,7 +29,7 @@ from contextlib import suppress
 from enum import Enum
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 from urllib.parse import urljoin
 
 import pendulum
@@ -37,7 +39,9 @@ from airflow.configuration import conf
 from airflow.exceptions import AirflowException, RemovedInAirflow3Warning
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.context import Context
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import parse_template_string, render_template_to_string
+from airflow.utils.log.file_log_index import LogFileIndex
 from airflow.utils.log.logging_mixin import SetContextPropagate
 from airflow.utils.log.non_caching_file_handler import NonCachingRotatingFileHandler
 from airflow.utils.session import provide_session
@@ -128,19 +132,46 @@ def _parse_timestamps_in_log_file(lines: Iterable[str]):
             yield timestamp, idx, line
 
 
+_DEFAULT_TIMESTAMP = pendulum.datetime(2000, 1, 1)
+
+
+def _record_sort_key(record):
+    timestamp, idx, _ = record[-1]
+    return (timestamp, idx) if timestamp else (_DEFAULT_TIMESTAMP, idx)
+
+
+def _tag_records(source, records):
+    for record in records:
+        yield source, record
+
+
+def _merge_log_records(sources: dict[str, Iterator[tuple[Any, int, str]]]) -> Iterator[tuple[str, int, str]]:
+    """
+    Merge log records of several sources by timestamp, yielding the source, line number and line of each.
+
+    Each source is expected to be ordered by timestamp already, as log files are, so this is a k-way merge
+    which only holds one record of each source in memory.
+    """
+    for source, (_, idx, line) in heapq.merge(
+        *(_tag_records(source, records) for source, records in sources.items()), key=_record_sort_key
+    ):
+        yield source, idx, line
+
+
 def _interleave_logs(*logs):
-    records = []
-    for log in logs:
-        records.extend(_parse_timestamps_in_log_file(log.splitlines()))
     last = None
-    for _, _, v in sorted(
-        records, key=lambda x: (x[0], x[1]) if x[0] else (pendulum.datetime(2000, 1, 1), x[1])
+    for _, _, v in _merge_log_records(
+        {str(i): _parse_timestamps_in_log_file(log.splitlines()) for i, log in enumerate(logs)}
     ):
         if v != last:  # dedupe
             yield v
         last = v
 
 
+def _line_hash(line: str) -> str:
+    return md5(line.encode(errors="replace")).hexdigest()
+
+
 def _ensure_ti(ti: TaskInstanceKey | TaskInstance | TaskInstancePydantic, session) -> TaskInstance:
     """
     Given TI | TIKey, return a TI object.
@@ -377,7 +408,7 @@ class FileTaskHandler(logging.Handler):
         worker_log_rel_path = self._render_filename(ti, try_number)
         messages_list: list[str] = []
         remote_logs: list[str] = []
-        local_logs: list[str] = []
+        local_logs: list[Path] = []
         executor_messages: list[str] = []
         executor_logs: list[str] = []
         served_logs: list[str] = []
@@ -395,7 +426,7 @@ class FileTaskHandler(logging.Handler):
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            local_messages, local_logs = self._read_from_local(worker_log_full_path)
+            local_messages, local_logs = self._find_local_logs(worker_log_full_path)
             messages_list.extend(local_messages)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_k8s_exec_pod:
             served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
@@ -407,29 +438,80 @@ class FileTaskHandler(logging.Handler):
             served_messages, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
             messages_list.extend(served_messages)
 
-        logs = "\n".join(
-            _interleave_logs(
-                *local_logs,
-                *remote_logs,
-                *(executor_logs or []),
-                *served_logs,
-            )
+        end_of_log = ti.try_number != try_number or ti.state not in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
         )
-        log_pos = len(logs)
+        metadata = metadata or {}
+        # Where each source was read up to, as a line number
+        offsets: dict[str, int] = dict(metadata.get("log_offsets") or {})
+        previous_chars = metadata.get("log_pos", 0)
+        # Lines are read from local files, which can be much larger than memory, as they are merged
+        sources: dict[str, Iterator[tuple[Any, int, str]]] = {}
+        for path in local_logs:
+            sources[f"local:{path}"] = LogFileIndex(path, _parse_timestamp).iter_records(
+                offsets.get(f"local:{path}", 0), complete_only=not end_of_log
+            )
+        for name, logs in (("remote", remote_logs), ("executor", executor_logs), ("served", served_logs)):
+            for i, log in enumerate(logs or []):
+                source = f"{name}:{i}"
+                sources[source] = itertools.islice(
+                    _parse_timestamps_in_log_file(log.splitlines()), offsets.get(source, 0), None
+                )
+
+        # Only local files are paged: the other sources are fetched whole on each read, so they are
+        # returned in a single page rather than fetched again for every page
+        page_size = 0
+        if not (remote_logs or executor_logs or served_logs):
+            page_size = conf.getint("logging", "log_page_lines", fallback=0)
+        last_hash = metadata.get("log_last_line_hash")
+        last = None
+        # Clients of the previous versions only send the character position they read up to
+        skip_chars = previous_chars if "log_pos" in metadata and "log_offsets" not in metadata else 0
+        chars = 0
+        lines: list[str] = []
+        has_more_logs = False
+        for source, idx, line in _merge_log_records(sources):
+            if page_size and len(lines) >= page_size:
+                has_more_logs = True
+                break
+            offsets[source] = idx + 1
+            # dedupe
+            if line == last or (last is None and last_hash is not None and _line_hash(line) == last_hash):
+                last = line
+                continue
+            last = line
+            if chars < skip_chars:
+                # the separator of the previous line counts as well
+                segment = f"\n{line}" if chars else line
+                chars += len(segment)
+                if chars <= skip_chars:
+                    continue
+                line = segment[len(segment) - (chars - skip_chars) :]
+            lines.append(line)
+
+        logs = "\n".join(lines)
+        if lines and previous_chars and not skip_chars:
+            # A continuation starts after the newline ending what was already read
+            logs = "\n" + logs
+        log_pos = max(previous_chars, skip_chars) + len(logs)
         # Log message source details are grouped: they are not relevant for most users and can
         # distract them from finding the root cause of their errors
         messages = " INFO - ::group::Log message source details\n"
         messages += "".join([f"*** {x}\n" for x in messages_list])
         messages += " INFO - ::endgroup::\n"
-        end_of_log = ti.try_number != try_number or ti.state not in (
-            TaskInstanceState.RUNNING,
-            TaskInstanceState.DEFERRED,
-        )
-        if metadata and "log_pos" in metadata:
-            previous_chars = metadata["log_pos"]
-            logs = logs[previous_chars:]  # Cut off previously passed log test as new tail
-        out_message = logs if "log_pos" in (metadata or {}) else messages + logs
-        return out_message, {"end_of_log": end_of_log, "log_pos": log_pos}
+        out_message = logs if "log_pos" in metadata else messages + logs
+        out_metadata = {
+            "end_of_log": end_of_log and not has_more_logs,
+            "log_pos": log_pos,
+            "log_offsets": offsets,
+            "has_more_logs": has_more_logs,
+        }
+        if last is not None:
+            out_metadata["log_last_line_hash"] = _line_hash(last)
+        elif last_hash is not None:
+            out_metadata["log_last_line_hash"] = last_hash
+        return out_message, out_metadata
 
     @staticmethod
     def _get_pod_namespace(ti: TaskInstance):
@@ -564,12 +646,17 @@ class FileTaskHandler(logging.Handler):
         return full_path
 
     @staticmethod
-    def _read_from_local(worker_log_path: Path) -> tuple[list[str], list[str]]:
+    def _find_local_logs(worker_log_path: Path) -> tuple[list[str], list[Path]]:
         messages = []
         paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
         if paths:
             messages.append("Found local files:")
             messages.extend(f"  * {x}" for x in paths)
+        return messages, paths
+
+    @staticmethod
+    def _read_from_local(worker_log_path: Path) -> tuple[list[str], list[str]]:
+        messages, paths = FileTaskHandler._find_local_logs(worker_log_path)
         logs = [file.read_text() for file in paths]
         return messages, logs
 
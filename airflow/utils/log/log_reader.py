@@ -83,10 +83,20 @@ class TaskLogReader:
             metadata.pop("max_offset", None)
             metadata.pop("offset", None)
             metadata.pop("log_pos", None)
+            metadata.pop("log_offsets", None)
+            metadata.pop("log_last_line_hash", None)
+            metadata.pop("has_more_logs", None)
+            in_pages = False
             while True:
                 logs, metadata = self.read_log_chunks(ti, current_try_number, metadata)
+                has_more_logs = metadata.get("has_more_logs", False)
                 for host, log in logs[0]:
-                    yield "\n".join([host or "", log]) + "\n"
+                    # The pages of a long log follow each other, under a single host header
+                    chunk = log if in_pages else "\n".join([host or "", log])
+                    yield chunk if has_more_logs else chunk + "\n"
+                in_pages = has_more_logs
+                if has_more_logs:
+                    continue
                 if "end_of_log" not in metadata or (
                     not metadata["end_of_log"]
                     and ti.state not in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED)
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from sqlalchemy import select
@@ -25,6 +26,7 @@ from airflow.configuration import conf
 from airflow.jobs.job import Job
 from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
 from airflow.utils.net import get_hostname
+from airflow.utils.scheduler_profiling import PROFILE_SIGNAL, get_snapshot_path
 from airflow.utils.session import create_session
 
 log = logging.getLogger(__name__)
@@ -52,9 +54,48 @@ class HealthServer(BaseHTTPRequestHandler):
             except Exception:
                 log.exception("Exception when executing Health check")
                 self.send_error(503)
+        elif self.path == "/profile":
+            self._serve_profile()
         else:
             self.send_error(404)
 
+    def do_POST(self):
+        if self.path == "/profile/sample":
+            self._start_profile_sampling()
+        else:
+            self.send_error(404)
+
+    def _serve_profile(self):
+        """Serve the loop timings written by the scheduler process this server was started from."""
+        if not conf.getboolean("scheduler", "enable_loop_profiling"):
+            self.send_error(404, "Scheduler loop profiling is not enabled")
+            return
+        try:
+            with open(get_snapshot_path(os.getppid()), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            self.send_error(503, "No scheduler profiling snapshot written yet")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_profile_sampling(self):
+        """Ask the scheduler process to sample its stacks; the dump is written next to the snapshot."""
+        if not conf.getboolean("scheduler", "enable_loop_profiling"):
+            self.send_error(404, "Scheduler loop profiling is not enabled")
+            return
+        try:
+            os.kill(os.getppid(), PROFILE_SIGNAL)
+        except OSError:
+            log.exception("Failed to signal the scheduler to start stack sampling")
+            self.send_error(503)
+            return
+        self.send_response(202)
+        self.end_headers()
+
 
 def serve_health_check():
     """Start a http server to serve scheduler health check."""
@@ -0,0 +1,250 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Per-phase timings and on-demand stack sampling for the scheduler loop."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Generator
+
+from sqlalchemy import event
+
+from airflow.stats import Stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    from sqlalchemy.engine import Engine
+
+PROFILE_SIGNAL = signal.SIGUSR1
+"""Signal that makes the scheduler start a stack sampling session."""
+
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+"""Upper bounds (in seconds) of the histogram buckets kept for each phase."""
+
+
+def get_profiling_dir(output_dir: str | None = None) -> str:
+    """Return the directory profiling snapshots and stack dumps are written to."""
+    if not output_dir:
+        from airflow.configuration import conf
+
+        output_dir = conf.get("scheduler", "loop_profiling_output_dir")
+    return output_dir or tempfile.gettempdir()
+
+
+def get_snapshot_path(pid: int, output_dir: str | None = None) -> str:
+    """Return the path of the timing snapshot written by the scheduler running as ``pid``."""
+    return os.path.join(get_profiling_dir(output_dir), f"scheduler-{pid}.profile.json")
+
+
+class _Histogram:
+    """Cumulative duration histogram of a single phase."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(HISTOGRAM_BUCKETS)
+
+    def observe(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        for i, bound in enumerate(HISTOGRAM_BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+                break
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(HISTOGRAM_BUCKETS, self.buckets)
+            },
+        }
+
+
+class SchedulerLoopProfiler(LoggingMixin):
+    """
+    Collect per-phase timings, SQL query counts and DB time of the scheduler loop.
+
+    Timings are emitted through :mod:`airflow.stats` as they happen, accumulated into histograms, and
+    periodically written as a JSON snapshot that the scheduler health check server exposes. A sampling
+    profiler writing collapsed stacks (the input format of ``flamegraph.pl`` and speedscope) can be
+    started on demand, without restarting the scheduler.
+
+    :param output_dir: Directory to write the snapshot and the stack dumps to
+    :param sample_seconds: How long a sampling session started by :data:`PROFILE_SIGNAL` lasts
+    :param sample_interval: Seconds between two stack samples
+    :param snapshot_interval: Minimum number of seconds between two snapshot writes
+    """
+
+    def __init__(
+        self,
+        output_dir: str | None = None,
+        sample_seconds: float = 30.0,
+        sample_interval: float = 0.005,
+        snapshot_interval: float = 5.0,
+    ) -> None:
+        super().__init__()
+        self.output_dir = get_profiling_dir(output_dir)
+        self.sample_seconds = sample_seconds
+        self.sample_interval = sample_interval
+        self.snapshot_interval = snapshot_interval
+        self._histograms: dict[str, _Histogram] = {}
+        self._thread_id = threading.get_ident()
+        self._loop_queries = 0
+        self._loop_db_time = 0.0
+        self._last_loop: dict[str, Any] = {}
+        self._last_snapshot = 0.0
+        self._sampler: threading.Thread | None = None
+
+    def install_query_listeners(self, engine: Engine) -> None:
+        """Count the queries, and the time spent in them, made by the profiled thread."""
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if threading.get_ident() == self._thread_id:
+                conn.info.setdefault("profiler_query_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if threading.get_ident() == self._thread_id:
+                start = conn.info["profiler_query_start_time"].pop()
+                self._loop_queries += 1
+                self._loop_db_time += time.perf_counter() - start
+
+    def observe(self, phase: str, duration: float) -> None:
+        """Record that ``phase`` took ``duration`` seconds."""
+        self._histograms.setdefault(phase, _Histogram()).observe(duration)
+        Stats.timing(f"scheduler.phase_duration.{phase}", timedelta(seconds=duration))
+        Stats.timing("scheduler.phase_duration", timedelta(seconds=duration), tags={"phase": phase})
+
+    @contextmanager
+    def phase(self, phase: str) -> Generator[None, None, None]:
+        """Time the enclosed block as ``phase``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def end_loop(self, loop_duration: float | None) -> None:
+        """Emit the per-loop query metrics, reset them, and write the snapshot if it is due."""
+        Stats.gauge("scheduler.loop_query_count", self._loop_queries)
+        Stats.timing("scheduler.loop_db_duration", timedelta(seconds=self._loop_db_time))
+        self._histograms.setdefault("db", _Histogram()).observe(self._loop_db_time)
+        if loop_duration is not None:
+            self._histograms.setdefault("scheduler_loop", _Histogram()).observe(loop_duration)
+        self._last_loop = {
+            "duration": loop_duration,
+            "query_count": self._loop_queries,
+            "db_time": self._loop_db_time,
+        }
+        self._loop_queries = 0
+        self._loop_db_time = 0.0
+
+        if time.monotonic() - self._last_snapshot >= self.snapshot_interval:
+            self.write_snapshot()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the accumulated timings as a JSON-serializable dict."""
+        return {
+            "pid": os.getpid(),
+            "timestamp": time.time(),
+            "last_loop": self._last_loop,
+            "phases": {name: histogram.to_dict() for name, histogram in sorted(self._histograms.items())},
+            "sampling": self._sampler is not None and self._sampler.is_alive(),
+        }
+
+    def write_snapshot(self) -> None:
+        """Atomically write the snapshot for the health check server to serve."""
+        path = get_snapshot_path(os.getpid(), self.output_dir)
+        try:
+            with tempfile.NamedTemporaryFile("w", dir=self.output_dir, delete=False, suffix=".tmp") as f:
+                json.dump(self.snapshot(), f)
+            os.replace(f.name, path)
+        except OSError:
+            self.log.warning("Failed to write scheduler profiling snapshot to %s", path, exc_info=True)
+        self._last_snapshot = time.monotonic()
+
+    def handle_signal(self, signum: int, frame: FrameType | None) -> None:
+        """Start a sampling session of ``sample_seconds`` in response to :data:`PROFILE_SIGNAL`."""
+        self.start_sampling(self.sample_seconds)
+
+    def start_sampling(self, seconds: float) -> bool:
+        """
+        Sample the stack of the profiled thread for ``seconds`` in a background thread.
+
+        The collapsed stacks are written to ``scheduler-<pid>-<timestamp>.collapsed`` in the output
+        directory once sampling ends.
+
+        :return: False if a sampling session is already running
+        """
+        if self._sampler is not None and self._sampler.is_alive():
+            self.log.info("Scheduler stack sampling already in progress")
+            return False
+        self._sampler = threading.Thread(
+            target=self._sample, args=(seconds,), name="scheduler-stack-sampler", daemon=True
+        )
+        self._sampler.start()
+        return True
+
+    def _sample(self, seconds: float) -> None:
+        self.log.info("Sampling scheduler stacks for %.1f seconds", seconds)
+        stacks: Counter[str] = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                stacks[self._collapse(frame)] += 1
+            del frame
+            time.sleep(self.sample_interval)
+
+        path = os.path.join(self.output_dir, f"scheduler-{os.getpid()}-{int(time.time())}.collapsed")
+        try:
+            with open(path, "w") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError:
+            self.log.warning("Failed to write scheduler stack samples to %s", path, exc_info=True)
+            return
+        self.log.info("Wrote %d scheduler stack samples to %s", sum(stacks.values()), path)
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
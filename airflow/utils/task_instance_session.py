@@ -50,6 +50,11 @@ def get_current_task_instance_session() -> Session:
     return __current_task_instance_session
 
 
+def is_current_task_instance_session(session: Session) -> bool:
+    """Whether ``session`` is the session of the task instance running in this process."""
+    return session is not None and session is __current_task_instance_session
+
+
 @contextlib.contextmanager
 def set_current_task_instance_session(session: Session):
     if InternalApiConfig.get_use_internal_api():
@@ -28,6 +28,7 @@ import math
 import operator
 import os
 import sys
+import threading
 import traceback
 import warnings
 from bisect import insort_left
@@ -35,7 +36,17 @@ from collections import defaultdict
 from functools import cached_property
 from json import JSONDecodeError
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Collection, Iterator, Mapping, MutableMapping, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+)
 from urllib.parse import unquote, urlencode, urljoin, urlparse, urlsplit
 
 import configupdater
@@ -123,11 +134,13 @@ from airflow.utils.airflow_flask_app import get_airflow_app
 from airflow.utils.dag_edges import dag_edges
 from airflow.utils.db import get_query_count
 from airflow.utils.docs import get_doc_url_for_provider, get_docs_url
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import exactly_one
 from airflow.utils.log import secrets_masker
 from airflow.utils.log.log_reader import TaskLogReader
 from airflow.utils.net import get_hostname
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
+from airflow.utils.sqlalchemy import tuple_in_condition
 from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.strings import to_boolean
 from airflow.utils.task_group import TaskGroup, task_group_to_dict
@@ -151,6 +164,7 @@ if TYPE_CHECKING:
     from airflow.auth.managers.models.batch_apis import IsAuthorizedDagRequest
     from airflow.models.dag import DAG
     from airflow.models.operator import Operator
+    from airflow.models.taskmixin import DAGNode
 
 PAGE_SIZE = conf.getint("webserver", "page_size")
 FILTER_TAGS_COOKIE = "tags_filter"
@@ -305,13 +319,18 @@ def node_dict(node_id, label, node_class):
     }
 
 
-def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) -> dict[str, Any]:
+def get_grid_ti_summaries(
+    dag_id: str,
+    run_ids: Collection[str],
+    session: Session,
+    task_run_ids: Collection[tuple[str, str]] | None = None,
+) -> list[Any]:
     """
-    Create a nested dict representation of the DAG's TaskGroup and its children.
+    Return the task instance summaries shown by the Grid view, ordered by task and run.
 
-    Used to construct the Graph and Grid views.
+    :param task_run_ids: Only return the summaries of these ``(task_id, run_id)`` pairs
     """
-    query = session.execute(
+    query = (
         select(
             TaskInstance.task_id,
             TaskInstance.run_id,
@@ -328,24 +347,52 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
         )
         .join(TaskInstance.task_instance_note, isouter=True)
         .where(
-            TaskInstance.dag_id == dag.dag_id,
-            TaskInstance.run_id.in_([dag_run.run_id for dag_run in dag_runs]),
-        )
-        .group_by(
-            TaskInstance.task_id,
-            TaskInstance.run_id,
-            TaskInstance.state,
-            case(
-                (TaskInstance.map_index == -1, TaskInstance.try_number),
-                else_=None,
-            ),
+            TaskInstance.dag_id == dag_id,
+            TaskInstance.run_id.in_(run_ids),
         )
-        .order_by(TaskInstance.task_id, TaskInstance.run_id)
     )
+    if task_run_ids is not None:
+        query = query.where(tuple_in_condition((TaskInstance.task_id, TaskInstance.run_id), task_run_ids))
+    query = query.group_by(
+        TaskInstance.task_id,
+        TaskInstance.run_id,
+        TaskInstance.state,
+        case(
+            (TaskInstance.map_index == -1, TaskInstance.try_number),
+            else_=None,
+        ),
+    ).order_by(TaskInstance.task_id, TaskInstance.run_id)
+    return session.execute(query).all()
+
+
+def dag_to_grid(
+    dag: DagModel,
+    dag_runs: Sequence[DagRun],
+    session: Session,
+    ti_summaries: Iterable[Any] | None = None,
+    children_order: dict[str | None, list[str]] | None = None,
+) -> dict[str, Any]:
+    """
+    Create a nested dict representation of the DAG's TaskGroup and its children.
+
+    Used to construct the Graph and Grid views.
+
+    :param ti_summaries: Task instance summaries, as returned by :func:`get_grid_ti_summaries`; queried
+        if not given
+    :param children_order: Sorted node ids of the children of each TaskGroup. Missing groups are sorted
+        and added to it, so the same dict can be passed again as long as the DAG does not change.
+    """
+    if ti_summaries is None:
+        ti_summaries = get_grid_ti_summaries(dag.dag_id, [dag_run.run_id for dag_run in dag_runs], session)
+    if children_order is None:
+        children_order = {}
 
     grouped_tis: dict[str, list[TaskInstance]] = collections.defaultdict(
         list,
-        ((task_id, list(tis)) for task_id, tis in itertools.groupby(query, key=lambda ti: ti.task_id)),
+        (
+            (task_id, list(tis))
+            for task_id, tis in itertools.groupby(ti_summaries, key=lambda ti: ti.task_id)
+        ),
     )
 
     @cache
@@ -357,6 +404,13 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
             return operator.methodcaller("hierarchical_alphabetical_sort")
         raise AirflowConfigException(f"Unsupported grid_view_sorting_order: {sort_order}")
 
+    def get_sorted_children(task_group: TaskGroup) -> list[DAGNode]:
+        if (node_ids := children_order.get(task_group.group_id)) is None:
+            children = get_task_group_children_getter()(task_group)
+            children_order[task_group.group_id] = [child.node_id for child in children]
+            return children
+        return [task_group.children[node_id] for node_id in node_ids]
+
     def task_group_to_grid(item: Operator | TaskGroup) -> dict[str, Any]:
         if not isinstance(item, TaskGroup):
 
@@ -450,7 +504,7 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
 
         # Task Group
         task_group = item
-        children = [task_group_to_grid(child) for child in get_task_group_children_getter()(item)]
+        children = [task_group_to_grid(child) for child in get_sorted_children(item)]
 
         def get_summary(dag_run: DagRun):
             child_instances = [
@@ -572,6 +626,126 @@ def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session) ->
     return task_group_to_grid(dag.task_group)
 
 
+GRID_DATA_WATERMARK_OVERLAP = datetime.timedelta(seconds=60)
+"""How far back to look for task instance changes committed after the grid of a DAG was last refreshed."""
+
+
+class _GridDataCacheEntry(NamedTuple):
+    """Grid of a DAG as last computed by ``grid_data``, and what is needed to refresh it incrementally."""
+
+    dag_hash: str
+    run_ids: frozenset[str]
+    watermark: tuple[Any, ...]
+    refreshed_at: datetime.datetime
+    ti_summaries: dict[tuple[str, str], list[Any]]
+    children_order: dict[str | None, list[str]]
+    groups: dict[str, Any]
+
+
+_grid_data_cache: collections.OrderedDict[tuple, _GridDataCacheEntry] = collections.OrderedDict()
+_grid_data_cache_lock = threading.Lock()
+
+
+def _get_grid_watermark(dag_id: str, run_ids: Collection[str], session: Session) -> tuple[Any, ...]:
+    """Return a cheap fingerprint of the task instances and notes of the given runs."""
+    ti_updated_at, ti_count = session.execute(
+        select(func.max(TaskInstance.updated_at), func.count()).where(
+            TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids)
+        )
+    ).one()
+    note_updated_at, note_count = session.execute(
+        select(func.max(TaskInstanceNote.updated_at), func.count()).where(
+            TaskInstanceNote.dag_id == dag_id, TaskInstanceNote.run_id.in_(run_ids)
+        )
+    ).one()
+    return ti_updated_at, ti_count, note_updated_at, note_count
+
+
+def get_cached_grid(
+    cache_key: tuple,
+    dag: DAG,
+    dag_hash: str,
+    dag_runs: Sequence[DagRun],
+    session: Session,
+    cache_size: int,
+) -> dict[str, Any]:
+    """
+    Return the same as :func:`dag_to_grid`, reusing what was computed for a previous request.
+
+    The sorted TaskGroup structure is kept for as long as the serialized DAG does not change. Task
+    instance summaries are refreshed only for the ``(task_id, run_id)`` pairs whose task instance or
+    note was updated since the previous request, and the grid is not rebuilt at all if nothing changed.
+    Changes are detected through ``updated_at``, looking :data:`GRID_DATA_WATERMARK_OVERLAP` back to
+    catch transactions that committed after the previous refresh.
+    """
+    run_ids = frozenset(dag_run.run_id for dag_run in dag_runs)
+    with _grid_data_cache_lock:
+        entry = _grid_data_cache.get(cache_key)
+    if entry is not None and entry.dag_hash != dag_hash:
+        entry = None
+
+    refreshed_at = timezone.utcnow()
+    watermark = _get_grid_watermark(dag.dag_id, run_ids, session)
+    if entry is None or entry.run_ids != run_ids or entry.watermark[1::2] != watermark[1::2]:
+        # First request, the DAG changed, or rows were added or deleted: get all summaries again
+        ti_summaries: dict[tuple[str, str], list[Any]] = collections.defaultdict(list)
+        for ti_summary in get_grid_ti_summaries(dag.dag_id, run_ids, session):
+            ti_summaries[(ti_summary.task_id, ti_summary.run_id)].append(ti_summary)
+    else:
+        latest_update = max(filter(None, watermark[::2]), default=None)
+        since = entry.refreshed_at - GRID_DATA_WATERMARK_OVERLAP
+        if entry.watermark == watermark and (latest_update is None or latest_update < since):
+            # Nothing changed: anything committed since the previous refresh would have moved the watermark
+            with _grid_data_cache_lock:
+                _grid_data_cache.move_to_end(cache_key)
+            return entry.groups
+        changed = session.execute(
+            select(TaskInstance.task_id, TaskInstance.run_id)
+            .where(
+                TaskInstance.dag_id == dag.dag_id,
+                TaskInstance.run_id.in_(run_ids),
+                TaskInstance.updated_at > since,
+            )
+            .union(
+                select(TaskInstanceNote.task_id, TaskInstanceNote.run_id).where(
+                    TaskInstanceNote.dag_id == dag.dag_id,
+                    TaskInstanceNote.run_id.in_(run_ids),
+                    TaskInstanceNote.updated_at > since,
+                )
+            )
+        ).all()
+        changed_ids = [(task_id, run_id) for task_id, run_id in changed]
+        ti_summaries = collections.defaultdict(list, entry.ti_summaries)
+        for task_run_id in changed_ids:
+            ti_summaries.pop(task_run_id, None)
+        if changed_ids:
+            for ti_summary in get_grid_ti_summaries(dag.dag_id, run_ids, session, task_run_ids=changed_ids):
+                ti_summaries[(ti_summary.task_id, ti_summary.run_id)].append(ti_summary)
+
+    children_order = entry.children_order if entry is not None else {}
+    groups = dag_to_grid(
+        dag,
+        dag_runs,
+        session,
+        ti_summaries=(ti for key in sorted(ti_summaries) for ti in ti_summaries[key]),
+        children_order=children_order,
+    )
+    with _grid_data_cache_lock:
+        _grid_data_cache[cache_key] = _GridDataCacheEntry(
+            dag_hash=dag_hash,
+            run_ids=run_ids,
+            watermark=watermark,
+            refreshed_at=refreshed_at,
+            ti_summaries=dict(ti_summaries),
+            children_order=children_order,
+            groups=groups,
+        )
+        _grid_data_cache.move_to_end(cache_key)
+        while len(_grid_data_cache) > cache_size:
+            _grid_data_cache.popitem(last=False)
+    return groups
+
+
 def get_key_paths(input_dict):
     """Return a list of dot-separated dictionary paths."""
     for key, value in input_dict.items():
@@ -3345,17 +3519,32 @@ class Airflow(AirflowBaseView):
             else:
                 encoded_runs.append(encoded_dr)
 
+        cache_size = conf.getint("webserver", "grid_data_cache_size")
+        dag_hash = get_airflow_app().dag_bag.dags_hash.get(dag_id)
+        if cache_size > 0 and dag_hash:
+            cache_key = (
+                dag_id,
+                tuple(sorted(arg for arg in request.args.items(multi=True) if not arg[0].startswith("_"))),
+            )
+            groups = get_cached_grid(cache_key, dag, dag_hash, dag_runs, session, cache_size)
+        else:
+            groups = dag_to_grid(dag, dag_runs, session)
+
         data = {
-            "groups": dag_to_grid(dag, dag_runs, session),
+            "groups": groups,
             "dag_runs": encoded_runs,
             "ordering": dag.timetable.run_ordering,
             "errors": encoding_errors,
         }
         # avoid spaces to reduce payload size
-        return (
+        response = flask.make_response(
             htmlsafe_json_dumps(data, separators=(",", ":"), dumps=flask.json.dumps),
             {"Content-Type": "application/json; charset=utf-8"},
         )
+        # Let the browser revalidate its copy on each poll, and answer with a 304 if nothing changed
+        response.set_etag(md5(response.get_data()).hexdigest())
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
 
     @expose("/object/historical_metrics_data")
     @auth.has_access_view(AccessView.CLUSTER_ACTIVITY)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Time the round trip of large DAGs and XCom values through serialization and JSON.
+
+Run it with each ``[core] json_library`` to compare them, e.g.::
+
+    AIRFLOW__CORE__JSON_LIBRARY=json python scripts/perf/serialization_benchmark.py
+    AIRFLOW__CORE__JSON_LIBRARY=orjson python scripts/perf/serialization_benchmark.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import statistics
+import time
+from typing import Any, Callable
+
+from airflow.models.dag import DAG
+from airflow.operators.bash import BashOperator
+from airflow.operators.python import PythonOperator
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.settings import json
+from airflow.utils import json as json_utils
+from airflow.utils.json import XComEncoder
+from airflow.utils.task_group import TaskGroup
+
+
+def make_dag(task_count: int) -> DAG:
+    """Return a DAG of chained task groups of bash and python tasks, with params and templated fields."""
+    with DAG(
+        f"benchmark_{task_count}",
+        start_date=datetime.datetime(2024, 1, 1),
+        schedule="@daily",
+        default_args={"retries": 2, "retry_delay": datetime.timedelta(minutes=5)},
+        params={"env": "prod", "limit": 100},
+    ) as dag:
+        previous = None
+        for group_index in range(task_count // 10):
+            with TaskGroup(f"group_{group_index}") as group:
+                for task_index in range(5):
+                    BashOperator(
+                        task_id=f"bash_{task_index}",
+                        bash_command="echo {{ ds }} {{ params.env }}",
+                        env={"INDEX": str(task_index)},
+                    )
+                    PythonOperator(
+                        task_id=f"python_{task_index}",
+                        python_callable=print,
+                        op_kwargs={"index": task_index, "tags": ["a", "b"]},
+                    )
+            if previous is not None:
+                previous >> group
+            previous = group
+    return dag
+
+
+def make_xcom(row_count: int) -> list[dict[str, Any]]:
+    """Return a list of records, as returned by a task reading a table."""
+    return [
+        {"id": i, "name": f"row {i}", "score": i / 3, "active": i % 2 == 0, "tags": ["x", "y"]}
+        for i in range(row_count)
+    ]
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    """Return the median duration of ``func`` in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=2000, help="Number of tasks of the DAG")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of records of the XCom value")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs of each step")
+    args = parser.parse_args()
+
+    library = json_utils._get_fast_loads()
+    print(f"JSON library: {library[0].__module__ if library else 'json'}")
+
+    dag = make_dag(args.tasks)
+    dag_dict = SerializedDAG.to_dict(dag)
+    dag_json = json.dumps(dag_dict, sort_keys=True).encode("utf-8")
+    xcom = make_xcom(args.rows)
+    xcom_json = json.dumps(xcom, cls=XComEncoder).encode("utf-8")
+
+    steps: list[tuple[str, Callable[[], Any]]] = [
+        ("DAG serialize", lambda: SerializedDAG.to_dict(dag)),
+        ("DAG dumps", lambda: json.dumps(dag_dict, sort_keys=True)),
+        ("DAG loads", lambda: json_utils.loads(dag_json)),
+        ("DAG deserialize", lambda: SerializedDAG.from_dict(dag_dict)),
+        ("DAG deserialize, lazy", lambda: SerializedDAG.from_dict(dag_dict, lazy=True)),
+        ("XCom dumps", lambda: json.dumps(xcom, cls=XComEncoder)),
+        ("XCom loads", lambda: json_utils.loads_xcom(xcom_json)),
+    ]
+    print(f"DAG: {len(dag.task_dict)} tasks, {len(dag_json) / 1e6:.1f} MB")
+    print(f"XCom: {args.rows} records, {len(xcom_json) / 1e6:.1f} MB")
+    for name, func in steps:
+        print(f"{name:<24}{timeit(func, args.repeat):>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()